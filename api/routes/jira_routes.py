@@ -1,25 +1,34 @@
 """
 Jira 관련 API 라우트
 """
+import json
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+import time
+from typing import Any, Callable, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import get_async_db
 from models.pydantic_models import (
     JiraConnectionTest, JiraProjectsResponse, JiraIssuesResponse,
-    SyncRequest, SyncResponse, SyncStatus
+    SyncRequest, SyncResponse, SyncStatus, SyncJobResponse
 )
-from services.jira_service import jira_service
+from models.database_models import SyncJob
+from services.jira_service import JiraPageFetchError, JiraProjectNotFoundError, jira_service
+from services.sync_job_service import async_sync_job_service, sync_job_worker, SyncJobCancelled
+from services.sync_status_store import sync_status_store
+from config.settings import settings
 from services.task_service import task_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/jira", tags=["jira"])
+# 진행 이벤트 스트림을 종료하는 동기화 상태
+SYNC_FINISHED_STATUSES = ("completed", "error", "cancelled", "not_found")
+SSE_KEEPALIVE_SECONDS = 15
 
-# 동기화 상태 저장용 딕셔너리
-sync_status_store = {}
+router = APIRouter(prefix="/jira", tags=["jira"])
 
 
 @router.post("/test-connection", response_model=JiraConnectionTest)
@@ -131,6 +140,18 @@ async def get_jira_project_issues(project_key: str, limit: int = None, quick: bo
                 "count": 0,
                 "message": error_message
             }
+    except JiraProjectNotFoundError:
+        return {
+            "success": False,
+            "project_key": project_key,
+            "issues": [],
+            "count": 0,
+            "message": _get_detailed_error_message(project_key)
+        }
+    except JiraPageFetchError as e:
+        # 재시도 후에도 일부 페이지를 가져오지 못함 - 잘린 목록을 성공으로 반환하지 않음
+        logger.error(f"프로젝트 {project_key} 이슈 조회 중단: {str(e)}")
+        raise HTTPException(status_code=502, detail=f"Jira 이슈 조회 실패 (일부 페이지를 가져오지 못했습니다): {str(e)}")
     except Exception as e:
         logger.error(f"프로젝트 {project_key} 이슈 조회 오류: {str(e)}")
         return {
@@ -176,57 +197,108 @@ def _get_detailed_error_message(project_key: str) -> str:
 @router.post("/sync/{project_key}", response_model=SyncResponse)
 async def sync_jira_project(
     project_key: str,
-    background_tasks: BackgroundTasks,
     sync_request: Optional[SyncRequest] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Jira 프로젝트 동기화"""
+    """Jira 프로젝트 동기화 - 작업 큐에 등록하고 워커가 실행"""
     try:
         selected_issues = None
         if sync_request and sync_request.selected_issues:
             selected_issues = sync_request.selected_issues
+        full_sync = bool(sync_request and sync_request.full_sync)
         
-        # 동기화 상태 초기화
-        sync_status_store[project_key] = SyncStatus(
+        job, created = await async_sync_job_service.enqueue(
+            db,
+            project_key,
+            {"selected_issues": selected_issues, "full_sync": full_sync}
+        )
+        
+        if not created:
+            # 같은 프로젝트 동기화가 이미 대기/실행 중이면 새로 시작하지 않음
+            return SyncResponse(
+                success=True,
+                message=f"프로젝트 {project_key}의 동기화 작업 #{job.id}이(가) 이미 {'실행' if job.status == 'running' else '대기'} 중입니다.",
+                project_key=project_key,
+                job_id=job.id
+            )
+        
+        # 동기화 상태 초기화 (DB 저장소일 수 있으므로 스레드풀에서 실행)
+        await run_in_threadpool(sync_status_store.save, project_key, SyncStatus(
             status="starting",
             progress=0,
-            message="동기화를 시작합니다...",
+            message="동기화 작업이 대기열에 등록되었습니다...",
             total_issues=0,
             processed_issues=0,
-            selected_issues=selected_issues
-        )
-        
-        # 백그라운드 작업으로 동기화 실행
-        background_tasks.add_task(
-            background_sync_project,
-            project_key,
-            db,
-            selected_issues
-        )
+            selected_issues=selected_issues,
+            job_id=job.id
+        ), force=True)
         
         if selected_issues:
             return SyncResponse(
                 success=True,
                 message=f"프로젝트 {project_key}의 선택된 {len(selected_issues)}개 이슈 동기화를 시작했습니다.",
                 project_key=project_key,
-                selected_issues_count=len(selected_issues)
+                selected_issues_count=len(selected_issues),
+                job_id=job.id
             )
         else:
             return SyncResponse(
                 success=True,
-                message=f"프로젝트 {project_key} 전체 동기화를 시작했습니다.",
-                project_key=project_key
+                message=f"프로젝트 {project_key} {'전체' if full_sync else '증분'} 동기화를 시작했습니다.",
+                project_key=project_key,
+                job_id=job.id
             )
     except Exception as e:
         logger.error(f"동기화 시작 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"동기화 시작 실패: {str(e)}")
 
 
+@router.get("/sync-jobs", response_model=List[SyncJobResponse])
+async def get_sync_jobs(
+    project_key: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: int = 50,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """동기화 작업 목록 조회"""
+    jobs = await async_sync_job_service.get_jobs(db, project_key=project_key, status=status, limit=limit)
+    return [_sync_job_response(job) for job in jobs]
+
+
+@router.get("/sync-jobs/{job_id}", response_model=SyncJobResponse)
+async def get_sync_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    """동기화 작업 조회"""
+    job = await async_sync_job_service.get_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="동기화 작업을 찾을 수 없습니다")
+    return _sync_job_response(job)
+
+
+@router.post("/sync-jobs/{job_id}/cancel", response_model=SyncJobResponse)
+async def cancel_sync_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    """동기화 작업 취소 (대기 중이면 즉시, 실행 중이면 현재 페이지 처리 후 중단)"""
+    job = await async_sync_job_service.cancel(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="동기화 작업을 찾을 수 없습니다")
+    
+    status = await run_in_threadpool(sync_status_store.get, job.project_key)
+    if status and status.job_id == job.id:
+        if job.status == "cancelled":
+            status.status = "cancelled"
+            status.message = "동기화가 취소되었습니다."
+        elif job.cancel_requested:
+            status.message = "동기화 취소 요청됨 - 현재 단계가 끝나면 중단합니다..."
+        await run_in_threadpool(sync_status_store.save, job.project_key, status, force=True)
+    
+    return _sync_job_response(job)
+
+
 @router.get("/sync-status/{project_key}", response_model=SyncStatus)
 async def get_sync_status(project_key: str):
     """동기화 상태 조회"""
-    if project_key in sync_status_store:
-        return sync_status_store[project_key]
+    status = await run_in_threadpool(sync_status_store.get, project_key)
+    if status:
+        return status
     else:
         return SyncStatus(
             status="not_found",
@@ -234,6 +306,42 @@ async def get_sync_status(project_key: str):
         )
 
 
+@router.get("/sync-status/{project_key}/stream")
+async def stream_sync_status(project_key: str):
+    """동기화 상태 SSE 스트림 - 상태가 바뀔 때마다 이벤트를 보내고 완료/오류/취소 시 종료"""
+    
+    async def event_stream():
+        last_data = None
+        last_sent = time.monotonic()
+        
+        while True:
+            status = await run_in_threadpool(sync_status_store.get, project_key)
+            if not status:
+                status = SyncStatus(status="not_found", message="동기화 상태를 찾을 수 없습니다.")
+            
+            data = status.model_dump_json()
+            if data != last_data:
+                yield f"data: {data}\n\n"
+                last_data = data
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= SSE_KEEPALIVE_SECONDS:
+                # 프록시/클라이언트 읽기 timeout 방지용 주석 이벤트
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+            
+            if status.status in SYNC_FINISHED_STATUSES:
+                break
+            
+            # 같은 프로세스의 워커가 상태를 저장하면 즉시 깨어나고, 아니면 저장 간격마다 다시 조회
+            await sync_status_store.wait_for_update(settings.SYNC_STATUS_WRITE_INTERVAL)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/diagnose/{project_key}")
 async def diagnose_project(project_key: str):
     """프로젝트 문제 진단 및 해결책 제시"""
@@ -280,112 +388,164 @@ async def get_alternative_projects(project_key: str):
         }
 
 
-async def background_sync_project(
-    project_key: str,
-    db: Session,
-    selected_issues: Optional[List[str]] = None
-):
-    """백그라운드 동기화 함수 - 새로운 DB 세션 사용"""
+def run_jira_sync_job(job: SyncJob, payload: Dict[str, Any], check_cancelled: Callable[[], None]) -> Dict[str, Any]:
+    """Jira 동기화 작업 실행 - 작업 큐 워커 스레드에서 새로운 DB 세션으로 실행
+    
+    선택 이슈가 없으면 마지막 동기화 이후 변경분만 조회하며, full_sync=True면 전체를 조회한다.
+    진행률 콜백마다 취소 여부를 확인하므로 취소 요청 시 현재 페이지까지만 저장하고 중단한다.
+    """
     from core.database import SessionLocal
     
-    # 백그라운드 작업용 새로운 DB 세션 생성
+    project_key = job.project_key
+    selected_issues = payload.get("selected_issues")
+    full_sync = bool(payload.get("full_sync"))
+    
+    # 재시작 후 재개된 작업이면 상태 저장소에 항목이 없을 수 있음
+    status = sync_status_store.get(project_key)
+    if not status or status.job_id != job.id:
+        status = SyncStatus(
+            status="starting",
+            message="동기화를 시작합니다...",
+            selected_issues=selected_issues,
+            job_id=job.id
+        )
+    
+    # 작업용 새로운 DB 세션 생성
     db_session = SessionLocal()
     
     try:
         # 상태 업데이트: 연결 중
-        sync_status_store[project_key].status = "connecting"
-        sync_status_store[project_key].progress = 10
-        sync_status_store[project_key].message = "Jira 서버에 연결 중..."
+        status.status = "connecting"
+        status.progress = 10
+        status.message = "Jira 서버에 연결 중..."
+        sync_status_store.save(project_key, status)
         
         # Jira 연결 테스트
         success, message = jira_service.test_connection()
         if not success:
             raise Exception(f"Jira 연결 실패: {message}")
+        check_cancelled()
         
-        # 상태 업데이트: 이슈 조회 중
-        sync_status_store[project_key].status = "fetching_issues"
-        sync_status_store[project_key].progress = 30
-        sync_status_store[project_key].message = "Jira 이슈 목록 조회 중..."
+        # 조회/저장 단계 진행률 (전체 동기화는 두 단계가 페이지 단위로 겹쳐서 진행됨)
+        status.status = "fetching_issues"
+        status.progress = 20
+        status.message = "Jira 이슈 목록 조회 중..."
+        sync_status_store.save(project_key, status)
         
-        # 이슈 목록 가져오기
-        if selected_issues:
-            # 선택된 이슈만 처리 - 개별 이슈 조회로 최적화
-            issues = []
-            sync_status_store[project_key].total_issues = len(selected_issues)
+        def fetch_progress_callback(fetched: int, total: int):
+            """이슈 조회 진행률 콜백"""
+            check_cancelled()
+            status.fetch_progress = min(int((fetched / total) * 100), 100) if total > 0 else 0
+            status.fetched_issues = fetched
+            status.total_issues = max(total, fetched)
+            status.progress = _combined_progress(status)
+            if status.status == "fetching_issues":
+                status.message = f"Jira 이슈 조회 중... ({fetched}/{total})"
+            sync_status_store.save(project_key, status)
+        
+        def progress_callback(processed: int, total: int, current_issue: str = ""):
+            """저장 진행률 콜백"""
+            check_cancelled()
+            status.status = "processing"
+            status.persist_progress = min(int((processed / total) * 100), 100) if total > 0 else 100
+            status.processed_issues = processed
+            status.progress = _combined_progress(status)
             
-            for i, issue_key in enumerate(selected_issues):
-                try:
-                    # 진행률 업데이트
-                    progress = 30 + int((i / len(selected_issues)) * 10)  # 30-40% 구간
-                    sync_status_store[project_key].progress = progress
-                    sync_status_store[project_key].message = f"선택된 이슈 조회 중: {issue_key} ({i+1}/{len(selected_issues)})"
-                    
-                    issue = jira_service.get_issue(issue_key)
-                    if issue:
-                        issues.append(issue)
-                        logger.info(f"선택된 이슈 조회 성공: {issue_key}")
-                    else:
-                        logger.warning(f"이슈 {issue_key} 조회 실패: 이슈를 찾을 수 없음")
-                except Exception as e:
-                    logger.warning(f"이슈 {issue_key} 조회 실패: {str(e)}")
+            if current_issue:
+                status.message = f"이슈 처리 중: {current_issue} ({processed}/{total})"
+            else:
+                status.message = f"이슈 동기화 중... ({processed}/{total})"
+            sync_status_store.save(project_key, status)
             
-            logger.info(f"선택된 이슈 {len(selected_issues)}개 중 {len(issues)}개 조회 성공")
-        else:
-            # 전체 이슈 조회 (무제한)
-            logger.info(f"프로젝트 {project_key} 전체 이슈 조회 시작 (무제한)")
-            issues = jira_service.get_issues(project_key)  # limit 제거
-            logger.info(f"프로젝트 {project_key} 전체 이슈 {len(issues)}개 조회 완료")
+            logger.info(f"동기화 진행률: {status.progress}% ({processed}/{total})")
         
-        if not issues:
-            raise Exception(f"조회된 이슈가 없습니다. 프로젝트 {project_key}에 이슈가 있는지 확인해주세요.")
-        
-        # 총 이슈 수 업데이트
-        sync_status_store[project_key].total_issues = len(issues)
-        sync_status_store[project_key].progress = 40
-        sync_status_store[project_key].message = f"{len(issues)}개 이슈 조회 완료, 동기화 시작..."
-        
-        # 상태 업데이트: 처리 중
-        sync_status_store[project_key].status = "processing"
-        
-        # 동기화 실행 (진행률 콜백 포함)
-        def progress_callback(processed: int, total: int, current_issue: str = ""):
-            """동기화 진행률 콜백"""
-            if project_key in sync_status_store:
-                progress = 40 + int((processed / total) * 50) if total > 0 else 90
-                sync_status_store[project_key].progress = progress
-                sync_status_store[project_key].processed_issues = processed
-                
-                if current_issue:
-                    sync_status_store[project_key].message = f"이슈 처리 중: {current_issue} ({processed}/{total})"
-                else:
-                    sync_status_store[project_key].message = f"이슈 동기화 중... ({processed}/{total})"
-                
-                logger.info(f"동기화 진행률: {progress}% ({processed}/{total})")
+        issues = None
+        if selected_issues:
+            # 선택된 이슈만 처리 - key in (...) JQL로 100개씩 묶어서 조회
+            status.total_issues = len(selected_issues)
+            status.message = f"선택된 이슈 {len(selected_issues)}개 조회 중..."
+            sync_status_store.save(project_key, status)
+            issues = jira_service.get_issues_by_keys(selected_issues, progress_callback=fetch_progress_callback)
+            
+            if not issues:
+                raise Exception(f"조회된 이슈가 없습니다. 프로젝트 {project_key}에 이슈가 있는지 확인해주세요.")
+        else:
+            # 전체/증분 이슈는 페이지 단위로 조회하면서 바로 저장 (스트리밍)
+            logger.info(f"프로젝트 {project_key} 이슈 스트리밍 동기화 시작 ({'전체' if full_sync else '증분'})")
         
-        # 동기화 실행 (새로운 DB 세션과 콜백 함수 사용)
-        logger.info(f"프로젝트 {project_key} 동기화 시작: {len(issues)}개 이슈")
+        # 조회된 이슈는 그대로 저장 단계에 전달 (재조회 없음)
         result = task_service.sync_jira_issues_with_progress(
-            db_session, project_key, selected_issues, progress_callback
+            db_session, project_key, selected_issues, progress_callback,
+            issues=issues, fetch_progress_callback=fetch_progress_callback,
+            full_sync=full_sync
         )
         
+        # 증분 동기화는 변경된 이슈가 없을 수 있음
+        if result.get("total_issues", 0) == 0 and result.get("sync_type") != "incremental":
+            raise Exception(f"조회된 이슈가 없습니다. 프로젝트 {project_key}에 이슈가 있는지 확인해주세요.")
+        
         # 상태 업데이트: 완료
-        sync_status_store[project_key].status = "completed"
-        sync_status_store[project_key].progress = 100
-        sync_status_store[project_key].message = result["message"]
-        sync_status_store[project_key].total_issues = result.get("total_issues", len(issues))
-        sync_status_store[project_key].processed_issues = result.get("synced_count", 0)
+        status.status = "completed"
+        status.progress = 100
+        status.fetch_progress = 100
+        status.persist_progress = 100
+        status.message = result["message"]
+        status.total_issues = result.get("total_issues", 0)
+        status.fetched_issues = result.get("total_issues", 0)
+        status.processed_issues = result.get("synced_count", 0)
+        status.changed_issues = result.get("new_tasks", 0) + result.get("updated_tasks", 0)
+        status.unchanged_issues = result.get("unchanged_tasks", 0)
+        status.deleted_issues = result.get("deleted_tasks", 0)
+        sync_status_store.save(project_key, status, force=True)
         
         logger.info(f"프로젝트 {project_key}: 백그라운드 동기화 완료 - {result.get('synced_count', 0)}개 처리됨")
+        return result
+        
+    except SyncJobCancelled:
+        status.status = "cancelled"
+        status.message = "동기화가 중단되었습니다. (저장된 페이지는 유지됨)"
+        sync_status_store.save(project_key, status, force=True)
+        
+        logger.info(f"프로젝트 {project_key} 동기화 작업 #{job.id} 중단")
+        raise
         
     except Exception as e:
         # 상태 업데이트: 오류
-        if project_key in sync_status_store:
-            sync_status_store[project_key].status = "error"
-            sync_status_store[project_key].progress = 0
-            sync_status_store[project_key].message = f"동기화 실패: {str(e)}"
+        status.status = "error"
+        status.progress = 0
+        status.message = f"동기화 실패: {str(e)}"
+        sync_status_store.save(project_key, status, force=True)
         
         logger.error(f"프로젝트 {project_key} 백그라운드 동기화 실패: {str(e)}")
+        raise
         
     finally:
         # DB 세션 정리
         db_session.close()
+
+
+def _combined_progress(status: SyncStatus) -> int:
+    """조회(20-40%)와 저장(40-90%) 단계 진행률을 전체 진행률로 환산"""
+    return 20 + int(status.fetch_progress * 0.2) + int(status.persist_progress * 0.5)
+
+
+def _sync_job_response(job: SyncJob) -> SyncJobResponse:
+    """SyncJob 모델을 응답 모델로 변환 (JSON 컬럼 파싱)"""
+    return SyncJobResponse(
+        id=job.id,
+        job_type=job.job_type,
+        project_key=job.project_key,
+        status=job.status,
+        payload=json.loads(job.payload) if job.payload else {},
+        cancel_requested=bool(job.cancel_requested),
+        attempts=job.attempts or 0,
+        result=json.loads(job.result) if job.result else None,
+        error_message=job.error_message,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at
+    )
+
+
+# 작업 큐 워커에 Jira 동기화 실행 함수 등록
+sync_job_worker.register_handler("jira_sync", run_jira_sync_job)
@@ -3,14 +3,14 @@
 """
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import get_db
+from core.database import get_async_db
 from models.pydantic_models import (
     ProjectCreate, ProjectUpdate, ProjectResponse, 
     BaseResponse, DeleteResponse
 )
-from services.project_service import project_service
+from services.project_service import async_project_service
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -20,17 +20,17 @@ async def get_projects(
     is_active: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 목록 조회"""
-    projects = project_service.get_projects(db, is_active=is_active, skip=skip, limit=limit)
+    projects = await async_project_service.get_projects(db, is_active=is_active, skip=skip, limit=limit)
     return projects
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
-async def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """프로젝트 상세 조회"""
-    project = project_service.get_project_by_id(db, project_id)
+    project = await async_project_service.get_project_by_id(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -40,10 +40,10 @@ async def get_project(project_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
-async def create_project(project_data: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends(get_async_db)):
     """프로젝트 생성"""
     try:
-        project = project_service.create_project(db, project_data)
+        project = await async_project_service.create_project(db, project_data)
         return project
     except ValueError as e:
         raise HTTPException(
@@ -61,10 +61,10 @@ async def create_project(project_data: ProjectCreate, db: Session = Depends(get_
 async def update_project(
     project_id: int, 
     project_data: ProjectUpdate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """프로젝트 업데이트"""
-    project = project_service.update_project(db, project_id, project_data)
+    project = await async_project_service.update_project(db, project_id, project_data)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -74,9 +74,9 @@ async def update_project(
 
 
 @router.delete("/{project_id}", response_model=DeleteResponse)
-async def delete_project(project_id: int, db: Session = Depends(get_db)):
+async def delete_project(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """프로젝트 삭제"""
-    success = project_service.delete_project(db, project_id)
+    success = await async_project_service.delete_project(db, project_id)
     if not success:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -91,9 +91,9 @@ async def delete_project(project_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{project_id}/stats")
-async def get_project_stats(project_id: int, db: Session = Depends(get_db)):
+async def get_project_stats(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """프로젝트 통계 조회"""
-    stats = project_service.get_project_stats(db, project_id)
+    stats = await async_project_service.get_project_stats(db, project_id)
     if not stats:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -103,9 +103,9 @@ async def get_project_stats(project_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/{project_id}/sync", response_model=BaseResponse)
-async def update_project_sync(project_id: int, db: Session = Depends(get_db)):
+async def update_project_sync(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """프로젝트 동기화 시간 업데이트"""
-    project = project_service.update_last_sync(db, project_id)
+    project = await async_project_service.update_last_sync(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
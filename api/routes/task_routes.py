@@ -4,15 +4,17 @@
 import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from core.database import get_db
+from core.database import get_async_db, get_db
 from models.pydantic_models import (
     TaskResponse, TaskCreate, TaskUpdate, DashboardStats,
     MemoRequest, MemoResponse, DeleteResponse, QAStatusResponse,
     BaseResponse
 )
-from services.task_service import task_service
+from services.task_service import async_task_service, task_service
+from services.task_stats_service import async_task_stats_service
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +27,11 @@ async def get_tasks(
     status: Optional[str] = Query(None, description="상태 필터"),
     skip: int = Query(0, ge=0, description="건너뛸 항목 수"),
     limit: int = Query(1000, ge=1, le=5000, description="가져올 항목 수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """작업 목록 조회"""
     try:
-        tasks = task_service.get_tasks(
+        tasks = await async_task_service.get_tasks(
             db=db,
             project_id=project_id,
             status=status,
@@ -45,10 +47,10 @@ async def get_tasks(
 
 
 @router.delete("/reset", response_model=DeleteResponse)
-async def reset_all_tasks(db: Session = Depends(get_db)):
+async def reset_all_tasks(db: AsyncSession = Depends(get_async_db)):
     """모든 작업 데이터 초기화"""
     try:
-        result = task_service.reset_all_tasks(db)
+        result = await async_task_service.reset_all_tasks(db)
         
         return DeleteResponse(
             success=True,
@@ -61,10 +63,10 @@ async def reset_all_tasks(db: Session = Depends(get_db)):
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
-async def get_task(task_id: int, db: Session = Depends(get_db)):
+async def get_task(task_id: int, db: AsyncSession = Depends(get_async_db)):
     """작업 상세 조회"""
     try:
-        task = task_service.get_task_by_id(db, task_id)
+        task = await async_task_service.get_task_by_id(db, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         return task
@@ -76,18 +78,18 @@ async def get_task(task_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/", response_model=TaskResponse)
-async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
+async def create_task(task_data: TaskCreate, db: AsyncSession = Depends(get_async_db)):
     """작업 생성"""
     try:
         # 중복 Jira 키 확인
-        existing_task = task_service.get_task_by_jira_key(db, task_data.jira_key)
+        existing_task = await async_task_service.get_task_by_jira_key(db, task_data.jira_key)
         if existing_task:
             raise HTTPException(
                 status_code=400,
                 detail=f"Jira 키 '{task_data.jira_key}'가 이미 존재합니다."
             )
         
-        task = task_service.create_task(db, task_data)
+        task = await async_task_service.create_task(db, task_data)
         return task
     except HTTPException:
         raise
@@ -100,11 +102,11 @@ async def create_task(task_data: TaskCreate, db: Session = Depends(get_db)):
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """작업 업데이트"""
     try:
-        task = task_service.update_task(db, task_id, task_data)
+        task = await async_task_service.update_task(db, task_id, task_data)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         return task
@@ -116,11 +118,11 @@ async def update_task(
 
 
 @router.delete("/{task_id}", response_model=DeleteResponse)
-async def delete_task(task_id: int, db: Session = Depends(get_db)):
+async def delete_task(task_id: int, db: AsyncSession = Depends(get_async_db)):
     """작업 삭제"""
     try:
         # 작업 정보 조회 (삭제 전)
-        task = task_service.get_task_by_id(db, task_id)
+        task = await async_task_service.get_task_by_id(db, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         
@@ -131,7 +133,7 @@ async def delete_task(task_id: int, db: Session = Depends(get_db)):
         }
         
         # 작업 삭제
-        success = task_service.delete_task(db, task_id)
+        success = await async_task_service.delete_task(db, task_id)
         if not success:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         
@@ -152,16 +154,16 @@ async def delete_task(task_id: int, db: Session = Depends(get_db)):
 async def update_qa_status(
     task_id: int,
     qa_status: str = Query(..., pattern="^(미시작|QA 시작|QA 진행중|QA 완료)$"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """QA 상태 업데이트 - qa_status 필드만 업데이트"""
     try:
-        task = task_service.get_task_by_id(db, task_id)
+        task = await async_task_service.get_task_by_id(db, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         
         old_qa_status = task.qa_status
-        updated_task = task_service.update_qa_status(db, task_id, qa_status)
+        updated_task = await async_task_service.update_qa_status(db, task_id, qa_status)
         
         return QAStatusResponse(
             success=True,
@@ -182,15 +184,15 @@ async def update_qa_status(
 async def update_task_memo(
     task_id: int,
     memo_request: MemoRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """작업 메모 업데이트"""
     try:
-        task = task_service.get_task_by_id(db, task_id)
+        task = await async_task_service.get_task_by_id(db, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         
-        updated_task = task_service.update_memo(db, task_id, memo_request.memo)
+        updated_task = await async_task_service.update_memo(db, task_id, memo_request.memo)
         
         return MemoResponse(
             success=True,
@@ -208,10 +210,10 @@ async def update_task_memo(
 
 
 @router.get("/{task_id}/memo", response_model=MemoResponse)
-async def get_task_memo(task_id: int, db: Session = Depends(get_db)):
+async def get_task_memo(task_id: int, db: AsyncSession = Depends(get_async_db)):
     """작업 메모 조회"""
     try:
-        task = task_service.get_task_by_id(db, task_id)
+        task = await async_task_service.get_task_by_id(db, task_id)
         if not task:
             raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
         
@@ -231,16 +233,30 @@ async def get_task_memo(task_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/stats/dashboard", response_model=DashboardStats)
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
     """대시보드 통계 조회"""
     try:
-        stats = task_service.get_dashboard_stats(db)
+        stats = await async_task_service.get_dashboard_stats(db)
         return DashboardStats(**stats)
     except Exception as e:
         logger.error(f"대시보드 통계 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 
+@router.post("/stats/rebuild", response_model=BaseResponse)
+async def rebuild_task_stats(db: AsyncSession = Depends(get_async_db)):
+    """작업 통계 집계 테이블 재계산"""
+    try:
+        bucket_count = await async_task_stats_service.rebuild(db)
+        return BaseResponse(
+            success=True,
+            message=f"작업 통계 재계산 완료: {bucket_count}개 버킷"
+        )
+    except Exception as e:
+        logger.error(f"작업 통계 재계산 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"통계 재계산 실패: {str(e)}")
+
+
 @router.get("/{task_id}/linked-cycles")
 async def get_task_linked_cycles(task_id: int, db: Session = Depends(get_db)):
     """Task에 연결된 Zephyr 테스트 사이클 목록 조회"""
@@ -262,12 +278,20 @@ async def get_task_linked_cycles(task_id: int, db: Session = Depends(get_db)):
             )
         ).all()
         
+        # 외부 ID로 연결된 사이클 중 동기화된 사이클 (저장된 실행 결과 통계 표시용, 한 번에 조회)
+        external_ids = [link.zephyr_cycle_external_id for link in active_links if link.zephyr_cycle_external_id]
+        synced_cycles = {
+            cycle.zephyr_cycle_id: cycle for cycle in
+            db.query(ZephyrTestCycle).filter(ZephyrTestCycle.zephyr_cycle_id.in_(external_ids))
+        } if external_ids else {}
+        
         # 응답 데이터 구성
         result = []
         for link in active_links:
             # 외부 Zephyr ID를 사용하는 새로운 연결 방식
             if link.zephyr_cycle_external_id:
                 # 외부 ID를 사용한 연결 (새로운 방식)
+                synced_cycle = synced_cycles.get(link.zephyr_cycle_external_id)
                 cycle_data = {
                     "id": link.zephyr_cycle_external_id,  # 외부 Zephyr ID 사용
                     "zephyr_cycle_id": link.zephyr_cycle_external_id,
@@ -281,11 +305,12 @@ async def get_task_linked_cycles(task_id: int, db: Session = Depends(get_db)):
                     "assigned_to": "N/A",
                     "start_date": "N/A",
                     "end_date": "N/A",
-                    "total_test_cases": 0,
-                    "executed_test_cases": 0,
-                    "passed_test_cases": 0,
-                    "failed_test_cases": 0,
-                    "blocked_test_cases": 0,
+                    "total_test_cases": synced_cycle.total_test_cases or 0 if synced_cycle else 0,
+                    "executed_test_cases": synced_cycle.executed_test_cases or 0 if synced_cycle else 0,
+                    "passed_test_cases": synced_cycle.passed_test_cases or 0 if synced_cycle else 0,
+                    "failed_test_cases": synced_cycle.failed_test_cases or 0 if synced_cycle else 0,
+                    "blocked_test_cases": synced_cycle.blocked_test_cases or 0 if synced_cycle else 0,
+                    "not_executed_test_cases": synced_cycle.not_executed_test_cases or 0 if synced_cycle else 0,
                     "created_at": "N/A",
                     "last_sync": "N/A",
                     # 연결 정보
@@ -317,6 +342,7 @@ async def get_task_linked_cycles(task_id: int, db: Session = Depends(get_db)):
                         "passed_test_cases": cycle.passed_test_cases,
                         "failed_test_cases": cycle.failed_test_cases,
                         "blocked_test_cases": cycle.blocked_test_cases,
+                        "not_executed_test_cases": cycle.not_executed_test_cases or 0,
                         "created_at": cycle.created_at.isoformat() if cycle.created_at else "N/A",
                         "last_sync": cycle.last_sync.isoformat() if cycle.last_sync else "N/A",
                         # 연결 정보
@@ -532,6 +558,7 @@ async def get_available_cycles_for_task(task_id: int, db: Session = Depends(get_
                     "passed_test_cases": cycle.passed_test_cases,
                     "failed_test_cases": cycle.failed_test_cases,
                     "blocked_test_cases": cycle.blocked_test_cases,
+                    "not_executed_test_cases": cycle.not_executed_test_cases or 0,
                     "created_at": cycle.created_at.isoformat() if cycle.created_at else "N/A",
                     "last_sync": cycle.last_sync.isoformat() if cycle.last_sync else "N/A"
                 }
@@ -5,16 +5,17 @@ Zephyr 연동 API 라우트
 import logging
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from core.database import get_db
+from core.database import get_async_db, get_db
 from models.pydantic_models import (
     BaseResponse, ZephyrConnectionCreate, ZephyrConnectionUpdate, ZephyrConnectionResponse,
     ZephyrConnectionTest, ZephyrProjectResponse, ZephyrTestCaseResponse,
     ZephyrTestExecutionResponse, ZephyrSyncRequest, ZephyrSyncResponse,
     ZephyrSyncStatus, ZephyrSyncHistoryResponse, ZephyrDashboardStats
 )
-from services.zephyr_service import zephyr_service
+from services.zephyr_service import async_zephyr_service, zephyr_service
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +38,10 @@ async def create_zephyr_connection(
 
 
 @router.get("/connection", response_model=ZephyrConnectionResponse)
-async def get_zephyr_connection(db: Session = Depends(get_db)):
+async def get_zephyr_connection(db: AsyncSession = Depends(get_async_db)):
     """현재 Zephyr 연결 설정 조회"""
     try:
-        connection = zephyr_service.get_connection(db)
+        connection = await async_zephyr_service.get_connection(db)
         if not connection:
             raise HTTPException(status_code=404, detail="연결 설정을 찾을 수 없습니다.")
         return ZephyrConnectionResponse.from_orm(connection)
@@ -353,16 +354,29 @@ async def get_zephyr_sync_status(
 
 # Zephyr 통계 관련 엔드포인트
 @router.get("/stats/dashboard", response_model=ZephyrDashboardStats)
-async def get_zephyr_dashboard_stats(db: Session = Depends(get_db)):
+async def get_zephyr_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
     """Zephyr 대시보드 통계 조회"""
     try:
-        stats = zephyr_service.get_dashboard_stats(db)
+        stats = await async_zephyr_service.get_dashboard_stats(db)
         return stats
     except Exception as e:
         logger.error(f"Zephyr 대시보드 통계 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=f"통계 조회 실패: {str(e)}")
 
 
+@router.get("/stats/cycles")
+async def get_zephyr_cycle_stats(
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """저장된 실행 결과 기준 사이클별 통계 조회 (사이클 ID → 통계)"""
+    try:
+        return await async_zephyr_service.get_cycle_statistics(db, project_id)
+    except Exception as e:
+        logger.error(f"Zephyr 사이클 통계 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"사이클 통계 조회 실패: {str(e)}")
+
+
 # 유틸리티 엔드포인트
 @router.delete("/projects/{project_id}/reset", response_model=BaseResponse)
 async def reset_zephyr_project(
@@ -371,7 +385,10 @@ async def reset_zephyr_project(
 ):
     """Zephyr 프로젝트 데이터 초기화"""
     try:
-        from models.database_models import ZephyrProject, ZephyrTestCase, ZephyrTestExecution, ZephyrSyncHistory
+        from models.database_models import (
+            ZephyrProject, ZephyrTestCase, ZephyrTestExecution, ZephyrSyncHistory,
+            ZephyrTestCycle, ZephyrCycleExecution
+        )
         
         # 프로젝트 확인
         project = db.query(ZephyrProject).filter(
@@ -382,15 +399,30 @@ async def reset_zephyr_project(
             raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
         
         # 관련 데이터 삭제
-        # 실행 결과 삭제
+        # 실행 결과 삭제 (사이클 실행 결과 포함)
+        project_test_case_ids = db.query(ZephyrTestCase.id).filter(
+            ZephyrTestCase.zephyr_project_id == project_id
+        )
         db.query(ZephyrTestExecution).filter(
-            ZephyrTestExecution.test_case_id.in_(
-                db.query(ZephyrTestCase.id).filter(
-                    ZephyrTestCase.zephyr_project_id == project_id
-                )
-            )
+            ZephyrTestExecution.test_case_id.in_(project_test_case_ids)
+        ).delete(synchronize_session=False)
+        db.query(ZephyrCycleExecution).filter(
+            ZephyrCycleExecution.test_case_id.in_(project_test_case_ids)
         ).delete(synchronize_session=False)
         
+        # 사이클 통계를 남은 실행 결과 기준으로 재계산
+        db.query(ZephyrTestCycle).filter(
+            ZephyrTestCycle.zephyr_project_id == project_id
+        ).update({
+            ZephyrTestCycle.total_test_cases: 0,
+            ZephyrTestCycle.executed_test_cases: 0,
+            ZephyrTestCycle.passed_test_cases: 0,
+            ZephyrTestCycle.failed_test_cases: 0,
+            ZephyrTestCycle.blocked_test_cases: 0,
+            ZephyrTestCycle.not_executed_test_cases: 0
+        }, synchronize_session=False)
+        zephyr_service.refresh_cycle_statistics(db, project_id)
+        
         # 테스트 케이스 삭제
         deleted_test_cases = db.query(ZephyrTestCase).filter(
             ZephyrTestCase.zephyr_project_id == project_id
@@ -409,6 +441,7 @@ async def reset_zephyr_project(
         project.is_synced = False
         project.sync_status = "not_synced"
         project.test_case_count = 0
+        project.executions_cursor = None
         project.last_sync = None
         project.sync_error = None
         
@@ -487,6 +520,7 @@ async def get_available_cycles_for_task(
                 "passed_test_cases": cycle.passed_test_cases,
                 "failed_test_cases": cycle.failed_test_cases,
                 "blocked_test_cases": cycle.blocked_test_cases,
+                "not_executed_test_cases": cycle.not_executed_test_cases or 0,
                 "created_at": cycle.created_at.isoformat() if cycle.created_at else "N/A",
                 "last_sync": cycle.last_sync.isoformat() if cycle.last_sync else "N/A"
             }
@@ -743,6 +777,7 @@ async def create_test_data(
                     passed_test_cases=i*2,
                     failed_test_cases=i,
                     blocked_test_cases=0,
+                    not_executed_test_cases=10 + i*2,
                     created_at=datetime.now(),
                     last_sync=datetime.now()
                 )
@@ -860,7 +895,7 @@ async def reset_all_zephyr_data(db: Session = Depends(get_db)):
     try:
         from models.database_models import (
             ZephyrConnection, ZephyrProject, ZephyrTestCase, 
-            ZephyrTestExecution, ZephyrSyncHistory, TaskCycleLink, ZephyrTestCycle
+            ZephyrTestExecution, ZephyrSyncHistory, TaskCycleLink, ZephyrTestCycle, ZephyrCycleExecution
         )
         
         # 모든 데이터 개수 조회
@@ -874,6 +909,7 @@ async def reset_all_zephyr_data(db: Session = Depends(get_db)):
         
         # 모든 데이터 삭제 (외래키 순서 고려)
         db.query(TaskCycleLink).delete()  # Task-Cycle 연결 먼저 삭제
+        db.query(ZephyrCycleExecution).delete()  # 테스트 케이스/사이클을 참조하는 사이클 실행 결과
         db.query(ZephyrTestExecution).delete()
         db.query(ZephyrTestCase).delete()
         db.query(ZephyrTestCycle).delete()  # 테스트 사이클 삭제 추가
@@ -12,6 +12,24 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = config("DATABASE_URL", default="sqlite:///./qa_dashboard.db")
+    ASYNC_DB_ENABLED: bool = config("ASYNC_DB_ENABLED", default=True, cast=bool)  # API 라우트에서 비동기 드라이버(aiosqlite/asyncpg) 사용
+    ASYNC_DATABASE_URL: str = config("ASYNC_DATABASE_URL", default="")  # 비우면 DATABASE_URL에서 변환 (sqlite+aiosqlite, postgresql+asyncpg)
+    SQLITE_TUNED: bool = config("SQLITE_TUNED", default=True, cast=bool)  # WAL/pragma 적용 + 연결 풀 사용 (False면 단일 공유 연결)
+    SQLITE_POOL_SIZE: int = config("SQLITE_POOL_SIZE", default=5, cast=int)  # 유지할 SQLite 연결 수
+    SQLITE_MAX_OVERFLOW: int = config("SQLITE_MAX_OVERFLOW", default=10, cast=int)  # 풀 초과 시 추가로 열 수 있는 연결 수
+    SQLITE_BUSY_TIMEOUT: int = config("SQLITE_BUSY_TIMEOUT", default=20, cast=int)  # 쓰기 잠금 대기 시간 (초)
+    SQLITE_CACHE_SIZE_KB: int = config("SQLITE_CACHE_SIZE_KB", default=65536, cast=int)  # 연결당 페이지 캐시 크기 (KiB)
+    SQLITE_MMAP_SIZE: int = config("SQLITE_MMAP_SIZE", default=268435456, cast=int)  # 메모리 맵 I/O 크기 (바이트, 0이면 사용 안 함)
+    
+    # 서버 데이터베이스(PostgreSQL 등) 연결 풀 설정 - 프로세스(uvicorn 워커)당 최대 연결 수는 POOL_SIZE + MAX_OVERFLOW
+    DB_POOL_SIZE: int = config("DB_POOL_SIZE", default=10, cast=int)  # 유지할 연결 수
+    DB_MAX_OVERFLOW: int = config("DB_MAX_OVERFLOW", default=10, cast=int)  # 풀 초과 시 추가로 열 수 있는 연결 수
+    DB_POOL_RECYCLE: int = config("DB_POOL_RECYCLE", default=1800, cast=int)  # 연결 재생성 주기 (초, -1이면 사용 안 함)
+    DB_POOL_TIMEOUT: int = config("DB_POOL_TIMEOUT", default=30, cast=int)  # 풀에서 연결을 기다리는 최대 시간 (초)
+    DB_POOL_PRE_PING: str = config("DB_POOL_PRE_PING", default="lazy")  # lazy(유휴 연결만 확인), always(매 checkout), off
+    DB_POOL_PRE_PING_IDLE_SECONDS: int = config("DB_POOL_PRE_PING_IDLE_SECONDS", default=60, cast=int)  # lazy 모드에서 확인할 유휴 시간 (초)
+    DB_PREPARE_THRESHOLD: int = config("DB_PREPARE_THRESHOLD", default=5, cast=int)  # 서버 prepared statement 전환 실행 횟수 (postgresql+psycopg 드라이버, 0이면 사용 안 함)
+    DB_STATEMENT_CACHE_SIZE: int = config("DB_STATEMENT_CACHE_SIZE", default=100, cast=int)  # 연결당 prepared statement 캐시 크기 (postgresql+asyncpg 드라이버, 0이면 사용 안 함)
     
     # JWT 설정
     SECRET_KEY: str = config("SECRET_KEY", default="your-secret-key-here")
@@ -65,8 +83,28 @@ class Settings(BaseSettings):
     JIRA_QUICK_TIMEOUT: int = config("JIRA_QUICK_TIMEOUT", default=10, cast=int)  # 빠른 조회용 (이슈 수 등)
     JIRA_SYNC_TIMEOUT: int = config("JIRA_SYNC_TIMEOUT", default=30, cast=int)  # 동기화용 (더 긴 시간)
     
+    # HTTP 연결 풀 및 재시도 설정
+    JIRA_HTTP_POOL_SIZE: int = config("JIRA_HTTP_POOL_SIZE", default=10, cast=int)  # keep-alive 연결 수
+    JIRA_MAX_RETRIES: int = config("JIRA_MAX_RETRIES", default=5, cast=int)  # 429/5xx/연결 오류 재시도 횟수
+    JIRA_RETRY_BACKOFF_FACTOR: float = config("JIRA_RETRY_BACKOFF_FACTOR", default=1.0, cast=float)  # 지수 백오프 계수 (초)
+    JIRA_FETCH_CONCURRENCY: int = config("JIRA_FETCH_CONCURRENCY", default=4, cast=int)  # 이슈 페이지 동시 조회 수 (1이면 순차 조회)
+    
     # 동기화 설정
     SYNC_BATCH_SIZE: int = config("SYNC_BATCH_SIZE", default=50, cast=int)
+    JIRA_INCREMENTAL_OVERLAP_MINUTES: int = config("JIRA_INCREMENTAL_OVERLAP_MINUTES", default=5, cast=int)  # 증분 동기화 시 기준 시각 여유분
+    ZEPHYR_EXECUTION_OVERLAP_MINUTES: int = config("ZEPHYR_EXECUTION_OVERLAP_MINUTES", default=5, cast=int)  # 실행 결과 증분 가져오기 시 기준 시각 여유분
+    ZEPHYR_PROJECT_ID_CACHE_TTL: int = config("ZEPHYR_PROJECT_ID_CACHE_TTL", default=3600, cast=int)  # Zephyr 프로젝트 ID 메모리 캐시 유지 시간 (초)
+    
+    # 동기화 작업 큐 설정
+    SYNC_WORKER_COUNT: int = config("SYNC_WORKER_COUNT", default=2, cast=int)  # 동시에 실행할 동기화 작업 수
+    SYNC_JOB_POLL_INTERVAL: float = config("SYNC_JOB_POLL_INTERVAL", default=1.0, cast=float)  # 대기 작업 확인 주기 (초)
+    SYNC_JOB_STALE_SECONDS: int = config("SYNC_JOB_STALE_SECONDS", default=120, cast=int)  # heartbeat가 끊긴 작업을 재개하기까지의 시간
+    SYNC_JOB_MAX_ATTEMPTS: int = config("SYNC_JOB_MAX_ATTEMPTS", default=3, cast=int)  # 중단된 작업 재개 최대 횟수
+    SYNC_JOB_SHUTDOWN_TIMEOUT: float = config("SYNC_JOB_SHUTDOWN_TIMEOUT", default=10.0, cast=float)  # 서버 종료 시 실행 중인 작업 중단을 기다리는 최대 시간 (초)
+    SYNC_STATUS_BACKEND: str = config("SYNC_STATUS_BACKEND", default="memory")  # memory(단일 프로세스) 또는 database(멀티 워커)
+    SYNC_PROGRESS_INTERVAL: float = config("SYNC_PROGRESS_INTERVAL", default=0.5, cast=float)  # 진행률 보고 최소 간격 (초)
+    SYNC_PROGRESS_STEP_PERCENT: int = config("SYNC_PROGRESS_STEP_PERCENT", default=5, cast=int)  # 간격 전이라도 보고할 진행률 증가폭 (%)
+    SYNC_STATUS_WRITE_INTERVAL: float = config("SYNC_STATUS_WRITE_INTERVAL", default=1.0, cast=float)  # database 저장소 진행률 저장 최소 간격 (초)
     
     # API v3 특화 설정
     JIRA_USE_SEARCH_API: bool = config("JIRA_USE_SEARCH_API", default=True, cast=bool)  # v3 search API 사용 여부
@@ -0,0 +1,32 @@
+"""
+서비스 계층 비동기 래퍼
+"""
+from typing import Any, Callable, Iterable
+
+
+class AsyncServiceProxy:
+    """동기 서비스의 DB 메서드를 비동기로 호출하는 래퍼
+    
+    await async_task_service.get_tasks(db, ...)는 get_async_db의 세션에서
+    db.run_sync(task_service.get_tasks, ...)를 실행한다. AsyncSession이면 같은 서비스 코드가
+    비동기 드라이버 위에서 실행되어 DB I/O 동안 이벤트 루프를 양보하고, 비동기 엔진을 쓸 수 없으면
+    스레드풀에서 실행된다. 서비스 로직을 복제하지 않으므로 동기 경로(동기화 워커 등)와 동작이 같다.
+    
+    외부 HTTP 호출(Jira/Zephyr API)이 있는 메서드는 이벤트 루프 스레드를 막으므로 methods에 넣지 않는다.
+    """
+    
+    def __init__(self, service: Any, methods: Iterable[str]):
+        self._service = service
+        self._methods = frozenset(methods)
+    
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_") or name not in self._methods:
+            raise AttributeError(f"{type(self._service).__name__}.{name}은(는) 비동기 호출 대상이 아닙니다")
+        method = getattr(self._service, name)
+        
+        async def call(db, *args, **kwargs):
+            return await db.run_sync(lambda session: method(session, *args, **kwargs))
+        
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
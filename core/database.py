@@ -2,32 +2,110 @@
 데이터베이스 연결 및 세션 관리
 """
 import logging
-from sqlalchemy import create_engine
+from typing import Any, AsyncIterator, Callable, Dict, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event, func, inspect, select, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from config.settings import settings
+from core.db_pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool, install_pool_listeners
 
 logger = logging.getLogger(__name__)
 
+def _postgres_connect_args(url: str) -> Dict[str, Any]:
+    """PostgreSQL 드라이버별 prepared statement 설정
+    
+    psycopg 3(postgresql+psycopg)는 DB_PREPARE_THRESHOLD회 이상 실행한 쿼리를 서버 prepared statement로 전환하고,
+    asyncpg(postgresql+asyncpg, postgresql:// 기본 설정의 비동기 엔진)는 연결당 DB_STATEMENT_CACHE_SIZE개를 캐시한다.
+    psycopg2는 서버 prepared statement를 지원하지 않는다.
+    """
+    if url.startswith("postgresql+psycopg:"):
+        return {"prepare_threshold": settings.DB_PREPARE_THRESHOLD or None}  # None이면 사용 안 함
+    if url.startswith("postgresql+asyncpg:"):
+        return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+    return {}
+
+
+IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+# 인메모리 DB는 연결마다 별개의 DB가 되므로 단일 연결을 공유해야 함
+IS_SQLITE_MEMORY = IS_SQLITE and (
+    settings.DATABASE_URL in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in settings.DATABASE_URL
+)
+SQLITE_TUNED = IS_SQLITE and settings.SQLITE_TUNED and not IS_SQLITE_MEMORY
+
 # SQLite 설정 최적화
 connect_args = {}
-if "sqlite" in settings.DATABASE_URL:
+engine_options = {}
+if SQLITE_TUNED:
+    # 튜닝 모드: 스레드마다 풀에서 연결을 받고, WAL로 읽기가 쓰기(동기화)와 동시에 진행됨
+    connect_args = {
+        "check_same_thread": False,
+        "timeout": settings.SQLITE_BUSY_TIMEOUT
+    }
+    engine_options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.SQLITE_POOL_SIZE,
+        "max_overflow": settings.SQLITE_MAX_OVERFLOW
+    }
+elif IS_SQLITE:
     connect_args = {
         "check_same_thread": False,
-        "timeout": 20,
+        "timeout": settings.SQLITE_BUSY_TIMEOUT,
         "isolation_level": None
     }
+    engine_options = {"poolclass": StaticPool}
+else:
+    # 서버 DB: 워커 수에 맞춰 풀 크기를 조정할 수 있도록 설정값 사용
+    engine_options = {
+        "poolclass": InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT
+    }
+    connect_args = _postgres_connect_args(settings.DATABASE_URL)
 
 # 데이터베이스 엔진 생성
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args=connect_args,
-    poolclass=StaticPool if "sqlite" in settings.DATABASE_URL else None,
-    pool_pre_ping=True,
-    echo=False  # 프로덕션에서는 False
+    pool_pre_ping=settings.DB_POOL_PRE_PING == "always",
+    echo=False,  # 프로덕션에서는 False
+    **engine_options
+)
+
+# 풀 계측 및 지연 pre-ping (SQLite 파일 연결은 끊기지 않으므로 확인하지 않음)
+install_pool_listeners(
+    engine,
+    lazy_ping_idle_seconds=(
+        settings.DB_POOL_PRE_PING_IDLE_SECONDS if settings.DB_POOL_PRE_PING == "lazy" and not IS_SQLITE else 0
+    )
 )
 
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """새 SQLite 연결마다 성능 pragma 적용"""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")  # DB 파일에 유지됨
+        cursor.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 안전
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT * 1000}")
+        cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+        cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+if SQLITE_TUNED:
+    event.listen(engine, "connect", _apply_sqlite_pragmas)
+
+
 # 세션 팩토리
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -35,9 +113,70 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+
+
+def _async_database_url(url: str) -> str:
+    """동기 DATABASE_URL을 비동기 드라이버 URL로 변환 (sqlite → aiosqlite, postgresql → asyncpg)"""
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    if url.startswith("postgresql:") or url.startswith("postgresql+psycopg2:"):
+        return "postgresql+asyncpg:" + url.split(":", 1)[1]
+    return url  # postgresql+psycopg 등 비동기를 지원하는 드라이버는 그대로 사용
+
+
+def _create_async_engine():
+    """비동기 엔진 생성 - 인메모리 SQLite이거나 드라이버가 없으면 None (스레드풀 실행으로 대체)"""
+    if not settings.ASYNC_DB_ENABLED or IS_SQLITE_MEMORY:
+        return None
+    
+    async_url = settings.ASYNC_DATABASE_URL or _async_database_url(settings.DATABASE_URL)
+    async_options = {"pool_pre_ping": settings.DB_POOL_PRE_PING == "always", "echo": False}
+    if IS_SQLITE:
+        async_options["connect_args"] = {"timeout": settings.SQLITE_BUSY_TIMEOUT}
+        async_options.update(pool_size=settings.SQLITE_POOL_SIZE, max_overflow=settings.SQLITE_MAX_OVERFLOW)
+    else:
+        async_options["connect_args"] = _postgres_connect_args(async_url)
+        async_options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_timeout=settings.DB_POOL_TIMEOUT
+        )
+    
+    try:
+        created = create_async_engine(async_url, poolclass=InstrumentedAsyncAdaptedQueuePool, **async_options)
+    except ImportError as e:
+        logger.warning(f"⚠️ 비동기 DB 드라이버를 사용할 수 없어 스레드풀로 대체합니다: {e}")
+        return None
+    
+    if SQLITE_TUNED:
+        event.listen(created.sync_engine, "connect", _apply_sqlite_pragmas)
+    install_pool_listeners(
+        created.sync_engine,
+        lazy_ping_idle_seconds=(
+            settings.DB_POOL_PRE_PING_IDLE_SECONDS if settings.DB_POOL_PRE_PING == "lazy" and not IS_SQLITE else 0
+        )
+    )
+    return created
+
+
+# 비동기 엔진 및 세션 팩토리 (FastAPI 라우트용)
+async_engine = _create_async_engine()
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False  # 커밋 후 응답 직렬화 시 지연 로딩(동기 I/O)이 일어나지 않도록
+) if async_engine is not None else None
+
 # Base 클래스
 Base = declarative_base()
 
+# INSERT ... ON CONFLICT DO UPDATE를 지원하는 dialect별 insert 구성자
+BULK_UPSERT_INSERTS = {
+    "sqlite": sqlite_insert,
+    "postgresql": postgresql_insert,
+}
+
 
 def get_db() -> Session:
     """데이터베이스 세션 의존성"""
@@ -52,16 +191,110 @@ def get_db() -> Session:
         db.close()
 
 
+class ThreadPoolSession:
+    """비동기 엔진을 쓸 수 없을 때 AsyncSession.run_sync 대신 동기 세션을 스레드풀에서 실행"""
+    
+    def __init__(self):
+        self.session = SessionLocal()
+    
+    async def run_sync(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+    
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.session.rollback)
+    
+    async def close(self) -> None:
+        await run_in_threadpool(self.session.close)
+
+
+async def get_async_db() -> AsyncIterator[Union[AsyncSession, ThreadPoolSession]]:
+    """비동기 데이터베이스 세션 의존성
+    
+    서비스 호출은 run_sync로 실행하므로 (async_service 참고) DB I/O 동안 이벤트 루프를 막지 않는다.
+    """
+    db = AsyncSessionLocal() if AsyncSessionLocal is not None else ThreadPoolSession()
+    try:
+        yield db
+    except Exception as e:
+        logger.error(f"데이터베이스 세션 오류: {e}")
+        await db.rollback()
+        raise
+    finally:
+        await db.close()
+
+
 def init_db():
     """데이터베이스 초기화"""
     try:
         Base.metadata.create_all(bind=engine)
+        _add_missing_columns()
+        _add_missing_indexes()
         logger.info("✅ 데이터베이스 테이블 생성 완료")
     except Exception as e:
         logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
         raise
 
 
+def _add_missing_columns():
+    """기존 데이터베이스에 모델에 새로 추가된 컬럼 반영
+    
+    create_all은 이미 존재하는 테이블을 변경하지 않으므로, 누락된 컬럼을 nullable로 추가한다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    with engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            
+            existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing_columns:
+                    continue
+                
+                column_type = column.type.compile(dialect=engine.dialect)
+                connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                logger.info(f"컬럼 추가: {table.name}.{column.name} ({column_type})")
+
+
+def _add_missing_indexes():
+    """기존 데이터베이스에 모델에 새로 추가된 인덱스 반영
+    
+    create_all은 이미 존재하는 테이블의 인덱스를 만들지 않으므로, 누락된 인덱스를 이름 기준으로 생성한다.
+    info={"dedupe_on_create": True}인 유니크 인덱스는 만들기 전에 같은 키의 중복 행을 id가 가장 작은 행만 남기고 삭제한다.
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+        
+        existing_indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            
+            try:
+                with engine.begin() as connection:
+                    if index.unique and index.info.get("dedupe_on_create"):
+                        _delete_duplicate_rows(connection, table, list(index.columns))
+                    index.create(bind=connection)
+                logger.info(f"인덱스 추가: {table.name}.{index.name}")
+            except Exception as e:
+                # 기존 데이터가 유니크 조건을 위반하는 경우 등 - 기동은 계속 진행
+                logger.warning(f"⚠️ 인덱스 추가 실패: {table.name}.{index.name} - {e}")
+
+
+def _delete_duplicate_rows(connection, table, columns) -> None:
+    """columns 값이 같은 행 중 id가 가장 작은 행만 남기고 삭제"""
+    keep_ids = select(func.min(table.c.id)).group_by(*columns)
+    result = connection.execute(table.delete().where(table.c.id.not_in(keep_ids)))
+    if result.rowcount:
+        logger.warning(f"⚠️ 중복 행 삭제: {table.name} {result.rowcount}건 ({', '.join(column.name for column in columns)} 기준)")
+
+
 def check_db_connection() -> bool:
     """데이터베이스 연결 상태 확인"""
     try:
@@ -0,0 +1,146 @@
+"""
+데이터베이스 연결 풀 계측 및 지연 pre-ping
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """연결 풀 checkout/대기 시간 통계 (프로세스 단위)"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self) -> None:
+        """통계 초기화"""
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.pings = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+    
+    def record_wait(self, wait: float, timed_out: bool = False) -> None:
+        """풀에서 연결을 받기까지 기다린 시간 기록"""
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+    
+    def increment(self, name: str) -> None:
+        """카운터 증가 (checkins, connects, invalidations, pings)"""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def snapshot(self, engine: Engine, async_engine: Optional[AsyncEngine] = None) -> Dict[str, Any]:
+        """현재 풀 상태와 누적 통계 (카운터는 동기/비동기 엔진 합계)"""
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "pre_pings": self.pings,
+                "checkout_timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+        
+        data["pool"] = _pool_state(engine.pool)
+        if async_engine is not None:
+            data["async_pool"] = _pool_state(async_engine.pool)
+        return data
+
+
+def _pool_state(pool: Pool) -> Dict[str, Any]:
+    """풀 클래스와 현재 연결 수"""
+    state = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        state.update({
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow()
+        })
+    return state
+
+
+pool_metrics = PoolMetrics()
+
+
+class _WaitTimingMixin:
+    """checkout 대기 시간을 pool_metrics에 기록"""
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """checkout 대기 시간을 기록하는 QueuePool (동기 엔진용)"""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """checkout 대기 시간을 기록하는 AsyncAdaptedQueuePool (비동기 엔진용)"""
+
+
+def install_pool_listeners(engine: Engine, lazy_ping_idle_seconds: float = 0) -> None:
+    """풀 이벤트 계측 등록 - lazy_ping_idle_seconds > 0이면 그 시간 이상 쉬었던 연결만 checkout 시 확인"""
+    
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        pool_metrics.increment("connects")
+    
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        pool_metrics.increment("checkins")
+        connection_record.info["last_checkin"] = time.monotonic()
+    
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        pool_metrics.increment("invalidations")
+    
+    if lazy_ping_idle_seconds <= 0:
+        return
+    
+    @event.listens_for(engine, "checkout")
+    def _lazy_pre_ping(dbapi_connection, connection_record, connection_proxy):
+        # 매 요청마다 SELECT 1을 보내지 않고, 오래 쉬었던 연결만 확인 (끊겼으면 풀이 새 연결로 재시도)
+        last_checkin = connection_record.info.get("last_checkin")
+        if last_checkin is None or time.monotonic() - last_checkin < lazy_ping_idle_seconds:
+            return
+        
+        pool_metrics.increment("pings")
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            logger.warning(f"유휴 연결 확인 실패, 재연결: {e}")
+            raise exc.DisconnectionError() from e
+        finally:
+            try:
+                cursor.close()
+            except Exception:
+                pass
@@ -0,0 +1,66 @@
+"""
+동기화 파이프라인 유틸리티
+"""
+import logging
+import queue
+import threading
+from typing import Iterable, Iterator, List, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Iterator[T]:
+    """별도 스레드에서 iterable을 미리 읽어 최대 depth개까지 버퍼링
+
+    소비 측이 현재 항목(예: 이슈 한 페이지)을 저장하는 동안 다음 항목을 미리 조회하므로
+    조회와 저장이 겹쳐서 실행되고, 메모리에는 처리 중인 항목과 버퍼 항목만 유지된다.
+    생산 측에서 발생한 예외는 소비 측에서 다시 발생한다.
+    """
+    buffer = queue.Queue(maxsize=max(depth, 1))
+    stopped = threading.Event()
+    errors = []
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    return
+        except Exception as e:
+            errors.append(e)
+        finally:
+            put(_END)
+
+    producer = threading.Thread(target=produce, name="prefetch-producer", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END:
+                break
+            yield item
+
+        if errors:
+            raise errors[0]
+    finally:
+        # 소비 측이 중단되면 생산 스레드도 멈추도록 알림
+        stopped.set()
+
+
+def chunked(items: List[T], size: int) -> Iterator[List[T]]:
+    """리스트를 size 크기의 배치로 분할"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,54 @@
+"""
+동기화 진행률 보고 유틸리티
+"""
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from config.settings import settings
+
+
+class ProgressReporter:
+    """진행률 콜백 호출을 시간 간격/퍼센트 단위로 합쳐서 전달
+    
+    update(done, total, ...)는 이전 전달 이후 min_interval초가 지났거나, 진행률이 min_percent_step 이상
+    올랐거나, 마지막 항목(done >= total, total == 0 포함)이거나, force인 경우에만 콜백을 호출한다.
+    그 외 호출은 시각 비교만 하고 반환하므로 항목마다 호출해도 비용이 거의 없다.
+    콜백과 같은 시그니처로 호출할 수 있어 기존 progress_callback 자리에 그대로 전달할 수 있다.
+    """
+    
+    def __init__(
+        self,
+        callback: Callable[..., Any],
+        min_interval: Optional[float] = None,
+        min_percent_step: Optional[int] = None
+    ):
+        self.callback = callback
+        self.min_interval = settings.SYNC_PROGRESS_INTERVAL if min_interval is None else min_interval
+        self.min_percent_step = settings.SYNC_PROGRESS_STEP_PERCENT if min_percent_step is None else min_percent_step
+        self._lock = threading.Lock()
+        self._last_time: Optional[float] = None
+        self._last_percent = 0
+    
+    def update(self, done: int, total: int, *args, force: bool = False) -> bool:
+        """진행 상황 보고 - 콜백을 실제로 호출했으면 True"""
+        now = time.monotonic()
+        percent = int(done * 100 / total) if total > 0 else 0
+        
+        with self._lock:
+            due = (
+                force
+                or self._last_time is None
+                or done >= total  # 마지막 항목 (total == 0인 빈 결과 포함)은 항상 전달
+                or now - self._last_time >= self.min_interval
+                or percent - self._last_percent >= self.min_percent_step
+            )
+            if not due:
+                return False
+            self._last_time = now
+            self._last_percent = percent
+        
+        self.callback(done, total, *args)
+        return True
+    
+    __call__ = update
@@ -1,18 +1,23 @@
 """
 QA Dashboard - 메인 애플리케이션
 """
+import asyncio
 import logging
 import sys
 import traceback
 from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.settings import settings
-from core.database import init_db, check_db_connection
+from core.database import init_db, check_db_connection, get_async_db, SessionLocal, engine, async_engine
+from core.db_pool import pool_metrics
 from api.routes import jira_routes, task_routes, qa_request_routes, project_routes, zephyr_routes
+from services.sync_job_service import sync_job_worker
+from services.task_stats_service import task_stats_service
 
 # 로깅 설정
 logging.basicConfig(
@@ -43,6 +48,16 @@ async def lifespan(app: FastAPI):
         else:
             logger.error("❌ 데이터베이스 연결 실패")
             
+        # 작업 통계 집계 테이블 초기화 (기존 데이터베이스는 최초 1회 재계산)
+        db = SessionLocal()
+        try:
+            task_stats_service.ensure_initialized(db)
+        finally:
+            db.close()
+            
+        # 동기화 작업 큐 워커 시작 (중단된 작업은 heartbeat 만료 후 재개)
+        sync_job_worker.start()
+        
         # Jira 설정 확인
         if settings.is_jira_configured:
             logger.info("✅ Jira 설정 완료")
@@ -55,7 +70,10 @@ async def lifespan(app: FastAPI):
     
     yield
     
-    # 종료 시 실행
+    # 종료 시 실행 (작업 중단 대기는 이벤트 루프를 막지 않도록 별도 스레드에서)
+    await asyncio.to_thread(sync_job_worker.stop)
+    if async_engine is not None:
+        await async_engine.dispose()
     logger.info("👋 QA Dashboard 종료")
 
 
@@ -130,77 +148,60 @@ async def health_check():
     }
 
 
+@app.get("/health/db-pool")
+async def db_pool_status():
+    """데이터베이스 연결 풀 상태 - checkout 대기 시간이 늘면 DB_POOL_SIZE/DB_MAX_OVERFLOW 조정"""
+    return pool_metrics.snapshot(engine, async_engine)
+
+
 @app.get("/stats/dashboard")
-async def get_dashboard_stats_legacy():
+async def get_dashboard_stats_legacy(db: AsyncSession = Depends(get_async_db)):
     """레거시 대시보드 통계 엔드포인트 (하위 호환성)"""
-    from core.database import get_db
-    from services.task_service import task_service
+    from services.task_service import async_task_service
     
-    # 데이터베이스 세션 생성
-    db_gen = get_db()
-    db = next(db_gen)
-    
-    try:
-        stats = task_service.get_dashboard_stats(db)
-        return stats
-    finally:
-        db.close()
+    return await async_task_service.get_dashboard_stats(db)
 
 
 @app.get("/projects")
-async def get_projects_legacy():
+async def get_projects_legacy(db: AsyncSession = Depends(get_async_db)):
     """레거시 프로젝트 목록 엔드포인트 (하위 호환성)"""
-    from core.database import get_db
     from models.database_models import Project
     
-    # 데이터베이스 세션 생성
-    db_gen = get_db()
-    db = next(db_gen)
-    
-    try:
-        projects = db.query(Project).filter(Project.is_active == True).all()
-        return [
-            {
-                "id": p.id,
-                "name": p.name,
-                "jira_project_key": p.jira_project_key,
-                "description": p.description,
-                "is_active": p.is_active,
-                "last_sync": p.last_sync
-            }
-            for p in projects
-        ]
-    finally:
-        db.close()
+    projects = await db.run_sync(
+        lambda session: session.query(Project).filter(Project.is_active == True).all()
+    )
+    return [
+        {
+            "id": p.id,
+            "name": p.name,
+            "jira_project_key": p.jira_project_key,
+            "description": p.description,
+            "is_active": p.is_active,
+            "last_sync": p.last_sync
+        }
+        for p in projects
+    ]
 
 
 @app.get("/tasks")
-async def get_tasks_legacy():
+async def get_tasks_legacy(db: AsyncSession = Depends(get_async_db)):
     """레거시 작업 목록 엔드포인트 (하위 호환성)"""
-    from core.database import get_db
-    from services.task_service import task_service
+    from services.task_service import async_task_service
     
-    # 데이터베이스 세션 생성
-    db_gen = get_db()
-    db = next(db_gen)
-    
-    try:
-        tasks = task_service.get_tasks(db)
-        return [
-            {
-                "id": t.id,
-                "jira_key": t.jira_key,
-                "title": t.title,
-                "status": t.status,
-                "assignee": t.assignee,
-                "priority": t.priority,
-                "project_id": t.project_id,
-                "last_sync": t.last_sync
-            }
-            for t in tasks
-        ]
-    finally:
-        db.close()
+    tasks = await async_task_service.get_tasks(db)
+    return [
+        {
+            "id": t.id,
+            "jira_key": t.jira_key,
+            "title": t.title,
+            "status": t.status,
+            "assignee": t.assignee,
+            "priority": t.priority,
+            "project_id": t.project_id,
+            "last_sync": t.last_sync
+        }
+        for t in tasks
+    ]
 
 
 def main():
@@ -1,7 +1,7 @@
 """
 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Index, UniqueConstraint, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.database import Base
@@ -19,6 +19,7 @@ class Project(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_sync = Column(DateTime(timezone=True))
+    issues_updated_cursor = Column(DateTime(timezone=True))  # 마지막 증분/전체 동기화의 조회 시작 시각 (UTC, 증분 동기화 기준)
     
     # 관계 설정
     tasks = relationship("Task", back_populates="project", cascade="all, delete-orphan")
@@ -30,6 +31,16 @@ class Project(Base):
 class Task(Base):
     """작업 모델"""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 작업 목록 필터(프로젝트/상태/QA 상태)와 updated_at 정렬용
+        Index("ix_tasks_project_status", "project_id", "status"),
+        Index("ix_tasks_project_updated_at", "project_id", "updated_at"),
+        Index("ix_tasks_status_updated_at", "status", "updated_at"),
+        Index("ix_tasks_qa_status", "qa_status"),
+        Index("ix_tasks_updated_at", "updated_at"),
+        # 대시보드 주간 신규 작업 수 (created_at 기간 조건)
+        Index("ix_tasks_created_at", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     jira_key = Column(String(50), unique=True, index=True, nullable=False)
@@ -45,6 +56,8 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_sync = Column(DateTime(timezone=True))
+    content_hash = Column(String(32))  # 동기화 필드 해시 (변경 감지용)
+    deleted_at = Column(DateTime(timezone=True))  # Jira에서 사라진 작업 (전체 동기화 시 표시)
     
     # 관계 설정
     project = relationship("Project", back_populates="tasks")
@@ -54,6 +67,25 @@ class Task(Base):
         return f"<Task(id={self.id}, jira_key={self.jira_key}, title={self.title[:50]})>"
 
 
+class TaskStat(Base):
+    """작업 통계 집계 모델 (대시보드용) - 버킷별 작업 수를 작업 변경 시 함께 갱신"""
+    __tablename__ = "task_stats"
+    __table_args__ = (
+        UniqueConstraint("project_id", "status", "qa_status", "priority", "assignee", name="uq_task_stats_bucket"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    status = Column(String(50), nullable=False, default="")  # NULL은 빈 문자열로 저장
+    qa_status = Column(String(50), nullable=False, default="")
+    priority = Column(String(20), nullable=False, default="")
+    assignee = Column(String(100), nullable=False, default="")
+    task_count = Column(Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f"<TaskStat(project_id={self.project_id}, status={self.status}, qa_status={self.qa_status}, count={self.task_count})>"
+
+
 class TestCase(Base):
     """테스트 케이스 모델"""
     __tablename__ = "test_cases"
@@ -82,10 +114,13 @@ class SyncHistory(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     project_key = Column(String(50), nullable=False)
-    sync_type = Column(String(20), default="full")  # full, partial, selected
+    sync_type = Column(String(20), default="full")  # full, incremental, selected
     status = Column(String(20), default="started")  # started, completed, failed
     total_issues = Column(Integer, default=0)
     processed_issues = Column(Integer, default=0)
+    changed_issues = Column(Integer, default=0)  # 생성 + 내용이 바뀐 이슈
+    unchanged_issues = Column(Integer, default=0)  # 해시가 같아 쓰기를 건너뛴 이슈
+    deleted_issues = Column(Integer, default=0)  # Jira에서 사라져 삭제 표시한 작업
     error_message = Column(Text)
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
@@ -94,6 +129,50 @@ class SyncHistory(Base):
         return f"<SyncHistory(id={self.id}, project_key={self.project_key}, status={self.status})>"
 
 
+class SyncJob(Base):
+    """동기화 작업 큐 모델 (서버 재시작 후에도 유지)"""
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        # 프로젝트당 대기/실행 중인 작업은 하나만 허용
+        Index(
+            "ix_sync_jobs_active_project", "job_type", "project_key", unique=True,
+            sqlite_where=text("status IN ('queued', 'running')"),
+            postgresql_where=text("status IN ('queued', 'running')")
+        ),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    job_type = Column(String(50), nullable=False, default="jira_sync")
+    project_key = Column(String(50), nullable=False, index=True)
+    payload = Column(Text)  # JSON 형태의 작업 인자 (selected_issues, full_sync 등)
+    status = Column(String(20), default="queued", index=True)  # queued, running, completed, failed, cancelled
+    cancel_requested = Column(Boolean, default=False)
+    attempts = Column(Integer, default=0)  # 실행 시도 횟수 (재시작 후 재개 포함)
+    worker_id = Column(String(100))  # 실행 중인 워커 식별자
+    result = Column(Text)  # JSON 형태의 결과
+    error_message = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))  # 실행 중 주기적으로 갱신 (중단 감지용)
+    completed_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f"<SyncJob(id={self.id}, project_key={self.project_key}, status={self.status})>"
+
+
+class SyncProgress(Base):
+    """프로젝트별 동기화 진행 상태 (여러 워커 프로세스가 공유)"""
+    __tablename__ = "sync_progress"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    project_key = Column(String(50), unique=True, index=True, nullable=False)
+    status_data = Column(Text)  # JSON 형태의 SyncStatus
+    updated_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self):
+        return f"<SyncProgress(project_key={self.project_key}, updated_at={self.updated_at})>"
+
+
 class QARequest(Base):
     """QA 요청서 모델"""
     __tablename__ = "qa_requests"
@@ -165,11 +244,13 @@ class ZephyrProject(Base):
     zephyr_project_id = Column(String(50), nullable=False)
     project_key = Column(String(50), nullable=False)
     project_name = Column(String(255), nullable=False)
+    api_project_id = Column(String(50))  # 사이클 조회에 쓰는 API 프로젝트 ID (최초 조회 후 저장)
     description = Column(Text)
     is_synced = Column(Boolean, default=False)
     sync_status = Column(String(20), default="not_synced")  # not_synced, syncing, completed, failed
     test_case_count = Column(Integer, default=0)
     last_sync = Column(DateTime(timezone=True))
+    executions_cursor = Column(DateTime(timezone=True))  # 가져온 실행 결과의 최대 실행 시각 (UTC, 증분 가져오기 기준 - 미동기화 사이클의 실행 결과가 있으면 그 시각까지만)
     sync_error = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -186,6 +267,10 @@ class ZephyrProject(Base):
 class ZephyrTestCase(Base):
     """Zephyr 테스트 케이스 모델"""
     __tablename__ = "zephyr_test_cases"
+    __table_args__ = (
+        # 가져오기 시 기존 테스트 케이스 조회용
+        Index("ix_zephyr_test_cases_project_test", "zephyr_project_id", "zephyr_test_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     zephyr_test_id = Column(String(50), nullable=False)
@@ -219,6 +304,15 @@ class ZephyrTestCase(Base):
 class ZephyrTestExecution(Base):
     """Zephyr 테스트 실행 결과 모델"""
     __tablename__ = "zephyr_test_executions"
+    __table_args__ = (
+        # 테스트 케이스별 실행 결과/상태별 집계용
+        Index("ix_zephyr_test_executions_case_status", "test_case_id", "execution_status"),
+        # 가져오기 upsert 기준 (ON CONFLICT) - 기존 DB의 중복 행은 인덱스 추가 시 정리
+        Index(
+            "ix_zephyr_test_executions_execution_id", "zephyr_execution_id", unique=True,
+            info={"dedupe_on_create": True}
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     zephyr_execution_id = Column(String(50), nullable=False)
@@ -246,6 +340,10 @@ class ZephyrTestExecution(Base):
 class ZephyrTestCycle(Base):
     """Zephyr 테스트 사이클 모델"""
     __tablename__ = "zephyr_test_cycles"
+    __table_args__ = (
+        # 동기화 시 기존 사이클 조회용
+        Index("ix_zephyr_test_cycles_project_cycle", "zephyr_project_id", "zephyr_cycle_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     zephyr_cycle_id = Column(String(50), nullable=False)
@@ -265,9 +363,11 @@ class ZephyrTestCycle(Base):
     passed_test_cases = Column(Integer, default=0)
     failed_test_cases = Column(Integer, default=0)
     blocked_test_cases = Column(Integer, default=0)
+    not_executed_test_cases = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     last_sync = Column(DateTime(timezone=True))
+    payload_hash = Column(String(32))  # API 응답 해시 (변경 없는 사이클 재동기화 생략)
     
     # 관계 설정
     zephyr_project = relationship("ZephyrProject", back_populates="test_cycles")
@@ -280,6 +380,15 @@ class ZephyrTestCycle(Base):
 class ZephyrCycleExecution(Base):
     """Zephyr 사이클 실행 결과 모델"""
     __tablename__ = "zephyr_cycle_executions"
+    __table_args__ = (
+        # 사이클별/상태별 통계 집계용
+        Index("ix_zephyr_cycle_executions_cycle_status", "test_cycle_id", "execution_status"),
+        # 가져오기 upsert 기준 (ON CONFLICT) - 기존 DB의 중복 행은 인덱스 추가 시 정리
+        Index(
+            "ix_zephyr_cycle_executions_cycle_execution", "test_cycle_id", "zephyr_execution_id", unique=True,
+            info={"dedupe_on_create": True}
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     zephyr_execution_id = Column(String(50), nullable=False)
@@ -333,6 +442,10 @@ class ZephyrSyncHistory(Base):
 class TaskCycleLink(Base):
     """Task와 Zephyr 테스트 사이클 연결 모델"""
     __tablename__ = "task_cycle_links"
+    __table_args__ = (
+        # 작업별 활성 연결 조회용
+        Index("ix_task_cycle_links_task_active", "task_id", "is_active"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
@@ -2,7 +2,7 @@
 Pydantic 모델 정의 (API 요청/응답)
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -212,6 +212,7 @@ class JiraIssuesResponse(BaseResponse):
 class SyncRequest(BaseModel):
     """동기화 요청 모델"""
     selected_issues: Optional[List[str]] = None
+    full_sync: bool = False  # True면 증분 기준 시각을 무시하고 전체 동기화
 
 
 class SyncStatus(BaseModel):
@@ -221,7 +222,14 @@ class SyncStatus(BaseModel):
     message: str = ""
     total_issues: int = 0
     processed_issues: int = 0
+    fetch_progress: int = 0  # 조회 단계 진행률 (0-100)
+    fetched_issues: int = 0
+    persist_progress: int = 0  # 저장 단계 진행률 (0-100)
+    changed_issues: int = 0  # 새로 생성되거나 내용이 바뀐 이슈
+    unchanged_issues: int = 0  # 내용이 같아 쓰기를 건너뛴 이슈
+    deleted_issues: int = 0  # Jira에서 사라져 삭제 표시한 작업
     selected_issues: Optional[List[str]] = None
+    job_id: Optional[int] = None  # 동기화 작업 큐 ID
     start_time: Optional[datetime] = None
     end_time: Optional[datetime] = None
 
@@ -230,6 +238,23 @@ class SyncResponse(BaseResponse):
     """동기화 응답 모델"""
     project_key: str
     selected_issues_count: Optional[int] = None
+    job_id: Optional[int] = None
+
+
+class SyncJobResponse(BaseModel):
+    """동기화 작업 응답 모델"""
+    id: int
+    job_type: str
+    project_key: str
+    status: str  # queued, running, completed, failed, cancelled
+    payload: Dict[str, Any] = {}
+    cancel_requested: bool = False
+    attempts: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
 
 
 # 대시보드 통계 모델
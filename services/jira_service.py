@@ -3,16 +3,38 @@ Jira API 서비스
 """
 import logging
 import base64
-from typing import List, Dict, Optional, Tuple
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple, Callable, Iterator
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from config.settings import settings
 
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8 이하
+    ZoneInfo = None
+
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 logger = logging.getLogger(__name__)
 
+# Jira 이슈 키 형식 (예: QA-123)
+ISSUE_KEY_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_]*-\d+$")
+
+
+class JiraPageFetchError(Exception):
+    """페이지네이션 중간 페이지 조회 실패 (재시도 후에도 실패)"""
+
+
+class JiraProjectNotFoundError(JiraPageFetchError):
+    """프로젝트가 존재하지 않거나 접근 권한이 없음"""
+
 
 class JiraService:
     """Jira API 서비스 클래스"""
@@ -22,6 +44,8 @@ class JiraService:
         self.username = settings.JIRA_USERNAME
         self.api_token = settings.JIRA_API_TOKEN
         self.configured = settings.is_jira_configured
+        self._user_timezone = None  # JQL 날짜 해석 기준이 되는 Jira 사용자 시간대 (조회 후 캐시)
+        self.session = self._create_session()
         
         if self.configured:
             credentials = f"{self.username}:{self.api_token}"
@@ -30,6 +54,31 @@ class JiraService:
         else:
             logger.warning("Jira 설정이 불완전합니다.")
     
+    def _create_session(self) -> requests.Session:
+        """keep-alive 연결 풀과 자동 재시도가 설정된 HTTP 세션 생성
+        
+        429/502/503/504 응답과 연결 오류는 지수 백오프로 재시도하며,
+        429/503의 Retry-After 헤더가 있으면 그 시간만큼 기다린다.
+        """
+        retry = Retry(
+            total=settings.JIRA_MAX_RETRIES,
+            backoff_factor=settings.JIRA_RETRY_BACKOFF_FACTOR,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET", "POST"],  # 이슈 검색 POST는 조회용이므로 재시도 가능
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=settings.JIRA_HTTP_POOL_SIZE,
+            pool_maxsize=settings.JIRA_HTTP_POOL_SIZE,
+            max_retries=retry
+        )
+        
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
     def get_headers(self) -> Dict[str, str]:
         """API 요청 헤더 생성"""
         return {
@@ -50,7 +99,7 @@ class JiraService:
             if len(self.api_token) < 50:
                 return False, "API 토큰이 올바르지 않습니다. 새로운 토큰을 생성해주세요."
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.server_url}/rest/api/3/myself",
                 headers=self.get_headers(),
                 timeout=settings.JIRA_CONNECTION_TIMEOUT,
@@ -107,7 +156,7 @@ class JiraService:
                     "startAt": start_at
                 }
                 
-                response = requests.get(
+                response = self.session.get(
                     f"{self.server_url}/rest/api/3/project/search",
                     headers=self.get_headers(),
                     params=params,
@@ -132,7 +181,7 @@ class JiraService:
                 else:
                     # v3 search API 실패 시 기본 API로 폴백 (페이지네이션 없음)
                     logger.warning(f"v3 search API 실패 (HTTP {response.status_code}), 기본 API로 재시도")
-                    response = requests.get(
+                    response = self.session.get(
                         f"{self.server_url}/rest/api/3/project",
                         headers=self.get_headers(),
                         timeout=settings.JIRA_QUICK_TIMEOUT,
@@ -170,7 +219,7 @@ class JiraService:
                 "fields": "key"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.server_url}/rest/api/3/search/jql",
                 headers=self.get_headers(),
                 params=params,
@@ -192,7 +241,7 @@ class JiraService:
                     "fields": "key"
                 }
                 
-                response = requests.get(
+                response = self.session.get(
                     f"{self.server_url}/rest/api/3/search/jql",
                     headers=self.get_headers(),
                     params=params,
@@ -219,8 +268,19 @@ class JiraService:
             logger.warning(f"프로젝트 {project_key} 이슈 수 조회 실패: {str(e)}")
             return 0
     
-    def get_issues(self, project_key: str, limit: int = None, max_results: int = None, quick_mode: bool = False) -> List[Dict]:
-        """Jira 이슈 목록 가져오기 - 성능 최적화된 조회"""
+    def get_issues(
+        self,
+        project_key: str,
+        limit: int = None,
+        max_results: int = None,
+        quick_mode: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """Jira 이슈 목록 가져오기 - 성능 최적화된 조회
+        
+        progress_callback(fetched, total)이 주어지면 페이지마다 조회 진행률을 알린다.
+        재시도 후에도 페이지 조회가 실패하면 일부만 반환하지 않고 JiraPageFetchError를 그대로 발생시킨다.
+        """
         if not self.configured:
             return []
         
@@ -239,169 +299,313 @@ class JiraService:
             if not quick_mode:
                 logger.info(f"Jira 이슈 조회: 프로젝트 {project_key} (전체 모드)")
             
-            # 프로젝트 존재 여부 먼저 확인
-            project_exists = self._check_project_exists(project_key)
-            if not project_exists:
-                logger.error(f"❌ 프로젝트 {project_key}가 존재하지 않거나 접근할 수 없습니다.")
-                return []
+            # 안전장치: 목록으로 모으는 경우 무제한 조회 시 최대 10,000개로 제한
+            all_issues = []
+            for page in self.iter_issue_pages(
+                project_key,
+                max_issues=target_limit if target_limit else 10000,
+                progress_callback=progress_callback
+            ):
+                all_issues.extend(page)
+            
+            if all_issues:
+                logger.info(f"✅ Jira 이슈 총 {len(all_issues)}개 조회 성공")
+            return all_issues
+        
+        except JiraPageFetchError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ 이슈 조회 전체 오류: {str(e)}")
+            return []
+    
+    def iter_issue_pages(
+        self,
+        project_key: str,
+        page_size: int = 100,
+        max_issues: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        updated_since: Optional[datetime] = None,
+        full_scan: bool = False
+    ) -> Iterator[List[Dict]]:
+        """Jira 이슈를 페이지 단위로 조회하여 정규화된 페이지를 순서대로 반환 (generator)
+        
+        전체 이슈를 메모리에 모으지 않으므로 호출 측에서 페이지를 받는 즉시 저장할 수 있다.
+        JQL 폴백은 첫 페이지가 성공할 때까지만 시도하며, 모든 JQL이 실패하거나 중간 페이지 조회가 실패하면
+        JiraPageFetchError를 발생시킨다. 증분 조회의 빈 결과(HTTP 200)만 변경 없음으로 처리한다.
+        updated_since(UTC)가 주어지면 그 이후 변경된 이슈만 조회한다 (증분 동기화).
+        full_scan이면 기간 제한 없이 프로젝트의 모든 이슈를 키 순서로 조회한다 (삭제 이슈 감지용).
+        """
+        if not self.configured:
+            return
+        
+        # 프로젝트 존재 여부 먼저 확인
+        project_exists = self._check_project_exists(project_key)
+        if not project_exists:
+            logger.error(f"❌ 프로젝트 {project_key}가 존재하지 않거나 접근할 수 없습니다.")
+            raise JiraProjectNotFoundError(f"프로젝트 {project_key}가 존재하지 않거나 접근할 수 없습니다.")
+        
+        last_error_details = None
+        
+        if updated_since:
+            jql_candidates = self._build_incremental_jql_candidates(project_key, updated_since)
+        elif full_scan:
+            # 페이지 조회 중 이슈가 수정되어도 순서가 바뀌지 않도록 키 순서로 정렬
+            jql_candidates = [
+                f'project = {project_key} ORDER BY key ASC',
+                f'project = "{project_key}" ORDER BY key ASC',
+            ]
+        else:
+            jql_candidates = self._build_issue_jql_candidates(project_key)
+        
+        for i, jql in enumerate(jql_candidates):
+            try:
+                logger.info(f"JQL 시도 {i+1}: {jql}")
+                response = self._request_issue_page(jql, 0, page_size)
+                result = response.json() if response.status_code == 200 else None
+            except Exception as query_error:
+                logger.warning(f"JQL 쿼리 {i+1} 실행 오류: {str(query_error)}")
+                last_error_details = f"쿼리 실행 오류: {str(query_error)}"
+                continue
+            
+            if result and result.get("issues"):
+                yield from self._iter_pages_from(jql, result, page_size, max_issues, progress_callback)
+                return
+            
+            if response.status_code == 200 and updated_since:
+                # 증분 조회에서 결과가 없으면 변경된 이슈가 없는 것
+                logger.info(f"프로젝트 {project_key}: {updated_since} 이후 변경된 이슈 없음")
+                if progress_callback:
+                    progress_callback(0, 0)
+                return
+            elif response.status_code == 200:
+                logger.warning(f"JQL 쿼리 {i+1}: 조회된 이슈 없음")
+                last_error_details = "조회된 이슈 없음"
+                continue
+            elif response.status_code == 400:
+                error_msg = self._parse_error_response(response)
+                logger.warning(f"JQL 쿼리 오류 (400): {error_msg}")
+                last_error_details = f"JQL 구문 오류: {error_msg}"
+                continue
+            elif response.status_code == 410:
+                logger.warning(f"프로젝트 {project_key}가 비활성화되었거나 삭제됨 (410)")
+                last_error_details = f"프로젝트 {project_key}가 비활성화되었거나 삭제되었습니다."
+                # 410 에러의 경우 다른 쿼리도 실패할 가능성이 높으므로 조기 종료
+                if i >= 2:  # 몇 개 시도 후 종료
+                    break
+                continue
+            elif response.status_code == 403:
+                logger.warning(f"프로젝트 {project_key}에 대한 권한 없음 (403)")
+                last_error_details = f"프로젝트 {project_key}에 대한 접근 권한이 없습니다."
+                continue
+            elif response.status_code == 404:
+                logger.warning(f"프로젝트 {project_key}를 찾을 수 없음 (404)")
+                last_error_details = f"프로젝트 {project_key}를 찾을 수 없습니다."
+                continue
+            else:
+                error_msg = self._parse_error_response(response)
+                logger.warning(f"이슈 조회 실패: HTTP {response.status_code} - {error_msg}")
+                last_error_details = f"HTTP {response.status_code}: {error_msg}"
+                continue
+        
+        # 모든 쿼리 실패 - 호출 측이 "변경 없음"으로 처리하지 않도록 오류로 전달
+        logger.error(f"❌ 프로젝트 {project_key}: 모든 JQL 쿼리 실패")
+        if last_error_details:
+            logger.error(f"마지막 오류 상세: {last_error_details}")
+        raise JiraPageFetchError(last_error_details or f"프로젝트 {project_key}: 모든 JQL 쿼리 실패")
+    
+    def _iter_pages_from(
+        self,
+        jql: str,
+        first_result: Dict,
+        page_size: int,
+        max_issues: Optional[int],
+        progress_callback: Optional[Callable[[int, int], None]]
+    ) -> Iterator[List[Dict]]:
+        """첫 페이지 응답부터 시작해 나머지 페이지를 조회하며 정규화된 페이지를 순서대로 반환
+        
+        첫 페이지에서 total을 알 수 있으면 이후 페이지를 최대 JIRA_FETCH_CONCURRENCY개까지
+        동시에 요청하고, 결과는 startAt 순서대로 반환한다.
+        """
+        fetched = 0
+        total = first_result.get("total", 0)
+        
+        def take_page(result: Dict, start_at: int) -> List[Dict]:
+            nonlocal fetched
+            page_issues = result.get("issues", [])
+            
+            # 사용자 제한이 있으면 초과분 제거
+            if max_issues and fetched + len(page_issues) > max_issues:
+                page_issues = page_issues[:max_issues - fetched]
+            
+            fetched += len(page_issues)
+            logger.info(f"📄 페이지 {start_at//page_size + 1}: {len(page_issues)}개 이슈 조회 (전체 {total}개 중 {fetched}개 완료)")
             
-            # 최근 1년치 이슈 조회 (성능 최적화) - 우선순위 순
-            jql_queries = [
-                # 최근 1년 + 최신순 정렬 (가장 효율적)
-                f'project = {project_key} AND updated >= -365d ORDER BY updated DESC',
-                f'project = "{project_key}" AND updated >= -365d ORDER BY updated DESC',
-                f'project = {project_key} AND created >= -365d ORDER BY created DESC',
-                f'project = "{project_key}" AND created >= -365d ORDER BY created DESC',
+            if progress_callback:
+                progress_callback(fetched, total)
+            return page_issues
+        
+        def should_request(start_at: int) -> bool:
+            # total이 정확하면 그 이상은 요청하지 않음
+            if total > 0 and start_at >= total:
+                return False
+            # 제한에 도달했으면 종료
+            if max_issues and start_at >= max_issues:
+                logger.info(f"조회 제한 {max_issues}개에 도달하여 조회 종료")
+                return False
+            return True
+        
+        page_issues = take_page(first_result, 0)
+        if page_issues:
+            yield [self._normalize_issue_data(issue) for issue in page_issues]
+        
+        # 더 이상 가져올 이슈가 없으면 종료
+        if len(page_issues) < page_size:
+            return
+        
+        # total을 모르면 다음 페이지 존재 여부를 알 수 없으므로 순차 조회
+        window = max(settings.JIRA_FETCH_CONCURRENCY, 1) if total > 0 else 1
+        executor = ThreadPoolExecutor(max_workers=window, thread_name_prefix="jira-page")
+        pending = deque()
+        next_start = page_size
+        
+        try:
+            while True:
+                # 순서를 유지하면서 최대 window개 페이지를 미리 요청
+                while len(pending) < window and should_request(next_start):
+                    pending.append((next_start, executor.submit(self._fetch_issue_page, jql, next_start, page_size)))
+                    next_start += page_size
                 
-                # 폴백: 6개월 기간 제한
-                f'project = {project_key} AND updated >= -180d ORDER BY updated DESC',
-                f'project = "{project_key}" AND updated >= -180d ORDER BY updated DESC',
+                if not pending:
+                    break
                 
-                # 폴백: 3개월 기간 제한
-                f'project = {project_key} AND updated >= -90d ORDER BY updated DESC',
-                f'project = "{project_key}" AND updated >= -90d ORDER BY updated DESC',
+                start_at, future = pending.popleft()
+                page_issues = take_page(future.result(), start_at)
                 
-                # 최종 폴백: 기간 제한 없음 (기존 방식)
-                f'project = {project_key} ORDER BY updated DESC',
-                f'project = "{project_key}" ORDER BY updated DESC',
-            ]
-            
-            last_error_details = None
-            
-            for i, jql in enumerate(jql_queries):
-                try:
-                    logger.info(f"JQL 시도 {i+1}: {jql}")
-                    
-                    # 페이지네이션으로 모든 이슈 가져오기
-                    all_issues = []
-                    start_at = 0
-                    page_size = 100  # 한 번에 가져올 페이지 크기
-                    
-                    while True:
-                        params = {
-                            "jql": jql,
-                            "maxResults": page_size,
-                            "startAt": start_at,
-                            "fields": "key,summary,description,status,assignee,priority,created,updated,issuetype,reporter"
-                        }
-                        
-                        # GET 방식으로 시도 (API v3 사용 - 새로운 엔드포인트)
-                        response = requests.get(
-                            f"{self.server_url}/rest/api/3/search/jql",
-                            headers=self.get_headers(),
-                            params=params,
-                            timeout=settings.JIRA_SYNC_TIMEOUT,
-                            verify=False
-                        )
-                        
-                        # GET 실패 시 POST 방식으로 재시도
-                        if response.status_code == 405:
-                            logger.info(f"GET 방식 실패, POST 방식으로 재시도: {jql}")
-                            post_data = {
-                                "jql": jql,
-                                "maxResults": page_size,
-                                "startAt": start_at,
-                                "fields": ["key", "summary", "description", "status", "assignee", "priority", "created", "updated", "issuetype", "reporter"]
-                            }
-                            
-                            response = requests.post(
-                                f"{self.server_url}/rest/api/3/search/jql",
-                                headers=self.get_headers(),
-                                json=post_data,
-                                timeout=settings.JIRA_SYNC_TIMEOUT,
-                                verify=False
-                            )
-                        
-                        logger.info(f"응답 상태: HTTP {response.status_code}")
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            page_issues = result.get("issues", [])
-                            total = result.get("total", 0)
-                            
-                            all_issues.extend(page_issues)
-                            logger.info(f"📄 페이지 {start_at//page_size + 1}: {len(page_issues)}개 이슈 조회 (전체 {total}개 중 {len(all_issues)}개 완료)")
-                            
-                            # 더 이상 가져올 이슈가 없으면 종료
-                            if len(page_issues) < page_size:
-                                break
-                            
-                            # total이 정확하고 도달했으면 종료
-                            if total > 0 and len(all_issues) >= total:
-                                break
-                            
-                            # 사용자 제한이 있고 도달했으면 종료
-                            if target_limit and len(all_issues) >= target_limit:
-                                all_issues = all_issues[:target_limit]
-                                logger.info(f"사용자 제한 {target_limit}개에 도달하여 조회 종료")
-                                break
-                            
-                            # 안전장치: 무제한 조회 시 최대 10,000개로 제한
-                            if target_limit is None and len(all_issues) >= 10000:
-                                logger.warning(f"안전장치 발동: 무제한 조회에서 10,000개 도달하여 조회 종료")
-                                break
-                            
-                            start_at += page_size
-                        else:
-                            # 첫 페이지 실패 시 다른 JQL로 시도
-                            if start_at == 0:
-                                break
-                            else:
-                                # 중간 페이지 실패 시 현재까지 수집한 이슈 반환
-                                logger.warning(f"페이지 {start_at//page_size + 1} 조회 실패, 현재까지 {len(all_issues)}개 이슈 반환")
-                                break
-                    
-                    if all_issues:
-                        logger.info(f"✅ Jira 이슈 총 {len(all_issues)}개 조회 성공")
-                        
-                        # 이슈 데이터 정규화
-                        normalized_issues = []
-                        for issue in all_issues:
-                            normalized_issue = self._normalize_issue_data(issue)
-                            normalized_issues.append(normalized_issue)
-                        
-                        logger.info(f"이슈 데이터 정규화 완료: {len(normalized_issues)}개")
-                        return normalized_issues
-                    elif response.status_code == 400:
-                        error_msg = self._parse_error_response(response)
-                        logger.warning(f"JQL 쿼리 오류 (400): {error_msg}")
-                        last_error_details = f"JQL 구문 오류: {error_msg}"
-                        continue
-                    elif response.status_code == 410:
-                        logger.warning(f"프로젝트 {project_key}가 비활성화되었거나 삭제됨 (410)")
-                        last_error_details = f"프로젝트 {project_key}가 비활성화되었거나 삭제되었습니다."
-                        # 410 에러의 경우 다른 쿼리도 실패할 가능성이 높으므로 조기 종료
-                        if i >= 2:  # 몇 개 시도 후 종료
-                            break
-                        continue
-                    elif response.status_code == 403:
-                        logger.warning(f"프로젝트 {project_key}에 대한 권한 없음 (403)")
-                        last_error_details = f"프로젝트 {project_key}에 대한 접근 권한이 없습니다."
-                        continue
-                    elif response.status_code == 404:
-                        logger.warning(f"프로젝트 {project_key}를 찾을 수 없음 (404)")
-                        last_error_details = f"프로젝트 {project_key}를 찾을 수 없습니다."
-                        continue
-                    else:
-                        error_msg = self._parse_error_response(response)
-                        logger.warning(f"이슈 조회 실패: HTTP {response.status_code} - {error_msg}")
-                        last_error_details = f"HTTP {response.status_code}: {error_msg}"
-                        continue
-                        
-                except Exception as query_error:
-                    logger.warning(f"JQL 쿼리 {i+1} 실행 오류: {str(query_error)}")
-                    last_error_details = f"쿼리 실행 오류: {str(query_error)}"
-                    continue
-            
-            # 모든 쿼리 실패
-            logger.error(f"❌ 프로젝트 {project_key}: 모든 JQL 쿼리 실패")
-            if last_error_details:
-                logger.error(f"마지막 오류 상세: {last_error_details}")
-            return []
+                if page_issues:
+                    yield [self._normalize_issue_data(issue) for issue in page_issues]
                 
+                # 더 이상 가져올 이슈가 없으면 종료
+                if len(page_issues) < page_size:
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _fetch_issue_page(self, jql: str, start_at: int, page_size: int) -> Dict:
+        """이슈 검색 결과 한 페이지 조회 - 재시도 후에도 실패하면 JiraPageFetchError
+        
+        일부만 조회된 결과를 조용히 넘기지 않도록 중간 페이지 실패는 오류로 알린다.
+        """
+        try:
+            response = self._request_issue_page(jql, start_at, page_size)
+        except requests.exceptions.RequestException as e:
+            raise JiraPageFetchError(f"페이지 {start_at//page_size + 1} 조회 오류: {str(e)}") from e
+        
+        if response.status_code != 200:
+            raise JiraPageFetchError(f"페이지 {start_at//page_size + 1} 조회 실패: HTTP {response.status_code}")
+        
+        return response.json()
+    
+    def _request_issue_page(self, jql: str, start_at: int, page_size: int) -> requests.Response:
+        """이슈 검색 API로 한 페이지 요청 (GET 실패 시 POST로 재시도)"""
+        params = {
+            "jql": jql,
+            "maxResults": page_size,
+            "startAt": start_at,
+            "fields": "key,summary,description,status,assignee,priority,created,updated,issuetype,reporter"
+        }
+        
+        # GET 방식으로 시도 (API v3 사용 - 새로운 엔드포인트)
+        response = self.session.get(
+            f"{self.server_url}/rest/api/3/search/jql",
+            headers=self.get_headers(),
+            params=params,
+            timeout=settings.JIRA_SYNC_TIMEOUT,
+            verify=False
+        )
+        
+        # GET 실패 시 POST 방식으로 재시도
+        if response.status_code == 405:
+            logger.info(f"GET 방식 실패, POST 방식으로 재시도: {jql}")
+            post_data = {
+                "jql": jql,
+                "maxResults": page_size,
+                "startAt": start_at,
+                "fields": ["key", "summary", "description", "status", "assignee", "priority", "created", "updated", "issuetype", "reporter"]
+            }
+            
+            response = self.session.post(
+                f"{self.server_url}/rest/api/3/search/jql",
+                headers=self.get_headers(),
+                json=post_data,
+                timeout=settings.JIRA_SYNC_TIMEOUT,
+                verify=False
+            )
+        
+        logger.info(f"응답 상태: HTTP {response.status_code}")
+        return response
+    
+    def _build_incremental_jql_candidates(self, project_key: str, updated_since: datetime) -> List[str]:
+        """증분 조회용 JQL 후보 목록 - updated 기준 시각 이후 변경분을 오래된 순으로 조회"""
+        # JQL 날짜는 분 단위이며 Jira 사용자 시간대로 해석되므로 변환 후 여유분을 둔다
+        since = updated_since.replace(tzinfo=updated_since.tzinfo or timezone.utc)
+        since -= timedelta(minutes=settings.JIRA_INCREMENTAL_OVERLAP_MINUTES)
+        
+        user_timezone = self._get_user_timezone()
+        if user_timezone:
+            since = since.astimezone(user_timezone)
+        else:
+            # 시간대를 알 수 없으면 가장 이른 시간대(UTC-12) 기준으로 넉넉하게 조회
+            since = since.astimezone(timezone.utc) - timedelta(hours=14)
+        
+        since_jql = since.strftime("%Y-%m-%d %H:%M")
+        # updated가 같은 이슈끼리도 페이지 경계가 흔들리지 않도록 key로 순서를 고정
+        return [
+            f'project = {project_key} AND updated >= "{since_jql}" ORDER BY updated ASC, key ASC',
+            f'project = "{project_key}" AND updated >= "{since_jql}" ORDER BY updated ASC, key ASC',
+        ]
+    
+    def _get_user_timezone(self):
+        """JQL 날짜 해석에 사용되는 Jira 사용자 시간대 조회 (최초 1회 조회 후 캐시)"""
+        if self._user_timezone is not None or ZoneInfo is None:
+            return self._user_timezone
+        
+        try:
+            response = self.session.get(
+                f"{self.server_url}/rest/api/3/myself",
+                headers=self.get_headers(),
+                timeout=settings.JIRA_QUICK_TIMEOUT,
+                verify=False
+            )
+            if response.status_code == 200 and response.json().get("timeZone"):
+                self._user_timezone = ZoneInfo(response.json()["timeZone"])
+                logger.info(f"Jira 사용자 시간대: {self._user_timezone}")
         except Exception as e:
-            logger.error(f"❌ 이슈 조회 전체 오류: {str(e)}")
-            return []
+            logger.warning(f"Jira 사용자 시간대 조회 실패: {str(e)}")
+        
+        return self._user_timezone
+    
+    def _build_issue_jql_candidates(self, project_key: str) -> List[str]:
+        """이슈 조회용 JQL 후보 목록 (우선순위 순)"""
+        # 최근 1년치 이슈 조회 (성능 최적화) - 우선순위 순
+        return [
+            # 최근 1년 + 최신순 정렬 (가장 효율적)
+            f'project = {project_key} AND updated >= -365d ORDER BY updated DESC',
+            f'project = "{project_key}" AND updated >= -365d ORDER BY updated DESC',
+            f'project = {project_key} AND created >= -365d ORDER BY created DESC',
+            f'project = "{project_key}" AND created >= -365d ORDER BY created DESC',
+            
+            # 폴백: 6개월 기간 제한
+            f'project = {project_key} AND updated >= -180d ORDER BY updated DESC',
+            f'project = "{project_key}" AND updated >= -180d ORDER BY updated DESC',
+            
+            # 폴백: 3개월 기간 제한
+            f'project = {project_key} AND updated >= -90d ORDER BY updated DESC',
+            f'project = "{project_key}" AND updated >= -90d ORDER BY updated DESC',
+            
+            # 최종 폴백: 기간 제한 없음 (기존 방식)
+            f'project = {project_key} ORDER BY updated DESC',
+            f'project = "{project_key}" ORDER BY updated DESC',
+        ]
     
     def get_issue(self, issue_key: str) -> Optional[Dict]:
         """개별 이슈 조회"""
@@ -411,7 +615,7 @@ class JiraService:
         try:
             logger.info(f"개별 이슈 조회: {issue_key}")
             
-            response = requests.get(
+            response = self.session.get(
                 f"{self.server_url}/rest/api/3/issue/{issue_key}",
                 headers=self.get_headers(),
                 params={
@@ -434,10 +638,64 @@ class JiraService:
             logger.error(f"이슈 {issue_key} 조회 오류: {str(e)}")
             return None
     
+    def get_issues_by_keys(
+        self,
+        issue_keys: List[str],
+        chunk_size: int = 100,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Dict]:
+        """선택된 이슈들을 key in (...) JQL로 묶어서 조회 (chunk_size개당 검색 1회)
+        
+        존재하지 않는 키가 섞여 검색이 400으로 실패하면 해당 묶음만 개별 조회로 대체한다.
+        반환 순서는 요청한 키 순서를 따른다.
+        """
+        if not self.configured or not issue_keys:
+            return []
+        
+        # 중복 제거 및 JQL에 넣을 수 없는 키 제외
+        unique_keys = []
+        for issue_key in dict.fromkeys(issue_keys):
+            if ISSUE_KEY_PATTERN.match(issue_key or ""):
+                unique_keys.append(issue_key)
+            else:
+                logger.warning(f"잘못된 이슈 키 형식으로 제외: {issue_key}")
+        
+        issues_by_key = {}
+        
+        for start in range(0, len(unique_keys), chunk_size):
+            chunk = unique_keys[start:start + chunk_size]
+            jql = "key in ({})".format(", ".join(f'"{issue_key}"' for issue_key in chunk))
+            
+            try:
+                response = self._request_issue_page(jql, 0, len(chunk))
+            except Exception as e:
+                logger.warning(f"선택 이슈 일괄 조회 오류: {str(e)}")
+                response = None
+            
+            if response is not None and response.status_code == 200:
+                for issue in response.json().get("issues", []):
+                    normalized_issue = self._normalize_issue_data(issue)
+                    issues_by_key[normalized_issue['key']] = normalized_issue
+            else:
+                # 존재하지 않거나 권한 없는 키가 포함된 경우 - 이 묶음만 개별 조회
+                status_code = response.status_code if response is not None else "N/A"
+                logger.warning(f"선택 이슈 일괄 조회 실패 (HTTP {status_code}), {len(chunk)}개 개별 조회로 대체")
+                for issue_key in chunk:
+                    issue = self.get_issue(issue_key)
+                    if issue:
+                        issues_by_key[issue['key']] = issue
+            
+            if progress_callback:
+                progress_callback(min(start + chunk_size, len(unique_keys)), len(unique_keys))
+        
+        issues = [issues_by_key[issue_key] for issue_key in unique_keys if issue_key in issues_by_key]
+        logger.info(f"선택된 이슈 {len(unique_keys)}개 중 {len(issues)}개 조회 성공")
+        return issues
+    
     def _check_project_exists(self, project_key: str) -> bool:
         """프로젝트 존재 여부 확인"""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.server_url}/rest/api/3/project/{project_key}",
                 headers=self.get_headers(),
                 timeout=settings.JIRA_QUICK_TIMEOUT,
@@ -630,6 +888,7 @@ class JiraService:
             # 날짜 정보
             normalized['created'] = fields.get('created', '')
             normalized['updated'] = fields.get('updated', '')
+            normalized['updated_timestamp'] = fields.get('updated', '')  # 원본 ISO 시각 (증분 동기화 기준)
             
             # 날짜 포맷 정리 (ISO 형식을 간단한 형식으로 변환)
             for date_field in ['created', 'updated']:
@@ -663,7 +922,8 @@ class JiraService:
                 'reporter': 'Unknown',
                 'reporter_email': '',
                 'created': '',
-                'updated': ''
+                'updated': '',
+                'updated_timestamp': ''
             }
     
     def safe_description(self, desc_field) -> str:
@@ -7,8 +7,10 @@ from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from core.async_service import AsyncServiceProxy
 from models.database_models import Project, Task
 from models.pydantic_models import ProjectCreate, ProjectUpdate, ProjectResponse
+from services.task_stats_service import task_stats_service
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +90,7 @@ class ProjectService:
         
         # 관련 작업 삭제
         if task_count > 0:
+            task_stats_service.remove_tasks(db, [Task.project_id == project_id])
             db.query(Task).filter(Task.project_id == project_id).delete()
             logger.info(f"프로젝트 {project.name}의 관련 작업 {task_count}개 삭제")
         
@@ -104,19 +107,13 @@ class ProjectService:
         if not project:
             return {}
         
-        total_tasks = db.query(Task).filter(Task.project_id == project_id).count()
-        completed_tasks = db.query(Task).filter(
-            Task.project_id == project_id,
-            Task.status == "Done"
-        ).count()
-        qa_ready_tasks = db.query(Task).filter(
-            Task.project_id == project_id,
-            Task.status == "QA Ready"
-        ).count()
-        in_progress_tasks = db.query(Task).filter(
-            Task.project_id == project_id,
-            Task.status == "In Progress"
-        ).count()
+        # 삭제 표시된 작업은 통계에서 제외
+        tasks = db.query(Task).filter(Task.project_id == project_id, Task.deleted_at.is_(None))
+        
+        total_tasks = tasks.count()
+        completed_tasks = tasks.filter(Task.status == "Done").count()
+        qa_ready_tasks = tasks.filter(Task.status == "QA Ready").count()
+        in_progress_tasks = tasks.filter(Task.status == "In Progress").count()
         
         completion_rate = 0.0
         if total_tasks > 0:
@@ -169,3 +166,9 @@ class ProjectService:
 
 # 전역 프로젝트 서비스 인스턴스
 project_service = ProjectService()
+
+# API 라우트용 비동기 래퍼
+async_project_service = AsyncServiceProxy(project_service, methods=(
+    "get_projects", "get_project_by_id", "get_project_by_key", "create_project", "update_project",
+    "delete_project", "get_project_stats", "update_last_sync"
+))
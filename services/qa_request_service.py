@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc
 from datetime import datetime
 
+from core.async_service import AsyncServiceProxy
 from models.database_models import QARequest, QARequestDocument
 from models.pydantic_models import (
     QARequestCreate, QARequestUpdate, QARequestResponse, 
@@ -225,3 +226,9 @@ class QARequestService:
 
 # 서비스 인스턴스
 qa_request_service = QARequestService()
+
+# API 라우트용 비동기 래퍼
+async_qa_request_service = AsyncServiceProxy(qa_request_service, methods=(
+    "create_qa_request", "get_qa_requests", "get_qa_request", "update_qa_request",
+    "update_qa_request_status", "delete_qa_request", "get_qa_request_stats"
+))
@@ -0,0 +1,394 @@
+"""
+동기화 작업 큐 서비스
+
+동기화 요청을 sync_jobs 테이블에 저장하고, 워커 스레드 풀이 이벤트 루프와 별개로 실행한다.
+서버가 중단되어도 작업이 테이블에 남아 있으므로 재시작 후 이어서 실행된다.
+"""
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from core.async_service import AsyncServiceProxy
+from core.database import SessionLocal
+from models.database_models import SyncJob
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_JOB_STATUSES = ("queued", "running")
+
+# 작업 핸들러: (작업, 작업 인자, 취소 확인 함수) -> 결과
+SyncJobHandler = Callable[[SyncJob, Dict[str, Any], Callable[[], None]], Dict[str, Any]]
+
+
+class SyncJobCancelled(Exception):
+    """취소 요청 또는 서버 종료로 동기화 작업이 중단됨"""
+    pass
+
+
+class SyncJobService:
+    """동기화 작업 큐 서비스 클래스"""
+    
+    @staticmethod
+    def enqueue(
+        db: Session,
+        project_key: str,
+        payload: Optional[Dict[str, Any]] = None,
+        job_type: str = "jira_sync"
+    ) -> Tuple[SyncJob, bool]:
+        """작업 등록 - (작업, 새로 등록 여부) 반환
+        
+        같은 프로젝트의 대기/실행 중인 작업이 있으면 새로 등록하지 않고 기존 작업을 반환한다.
+        """
+        existing_job = SyncJobService.get_active_job(db, project_key, job_type)
+        if existing_job:
+            return existing_job, False
+        
+        job = SyncJob(
+            job_type=job_type,
+            project_key=project_key,
+            payload=json.dumps(payload or {}, ensure_ascii=False),
+            status="queued"
+        )
+        db.add(job)
+        
+        try:
+            db.commit()
+        except IntegrityError:
+            # 동시에 들어온 요청이 먼저 등록한 경우 (프로젝트별 활성 작업 unique 인덱스)
+            db.rollback()
+            existing_job = SyncJobService.get_active_job(db, project_key, job_type)
+            if existing_job:
+                return existing_job, False
+            raise
+        
+        db.refresh(job)
+        logger.info(f"동기화 작업 등록: #{job.id} ({job_type}, {project_key})")
+        
+        sync_job_worker.wake()
+        return job, True
+    
+    @staticmethod
+    def get_job(db: Session, job_id: int) -> Optional[SyncJob]:
+        """ID로 작업 조회"""
+        return db.query(SyncJob).filter(SyncJob.id == job_id).first()
+    
+    @staticmethod
+    def get_active_job(db: Session, project_key: str, job_type: str = "jira_sync") -> Optional[SyncJob]:
+        """프로젝트의 대기/실행 중인 작업 조회"""
+        return db.query(SyncJob).filter(
+            SyncJob.job_type == job_type,
+            SyncJob.project_key == project_key,
+            SyncJob.status.in_(ACTIVE_JOB_STATUSES)
+        ).first()
+    
+    @staticmethod
+    def get_jobs(
+        db: Session,
+        project_key: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50
+    ) -> List[SyncJob]:
+        """작업 목록 조회 (최신순)"""
+        query = db.query(SyncJob)
+        
+        if project_key:
+            query = query.filter(SyncJob.project_key == project_key)
+        if status:
+            query = query.filter(SyncJob.status == status)
+        
+        return query.order_by(SyncJob.id.desc()).limit(limit).all()
+    
+    @staticmethod
+    def cancel(db: Session, job_id: int) -> Optional[SyncJob]:
+        """작업 취소 - 대기 중이면 바로 취소하고, 실행 중이면 다음 확인 시점에 중단되도록 요청"""
+        job = SyncJobService.get_job(db, job_id)
+        if not job:
+            return None
+        
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.completed_at = datetime.now()
+            logger.info(f"대기 중인 동기화 작업 취소: #{job.id}")
+        elif job.status == "running":
+            job.cancel_requested = True
+            logger.info(f"실행 중인 동기화 작업 취소 요청: #{job.id}")
+        
+        db.commit()
+        db.refresh(job)
+        
+        sync_job_worker.notify_cancel(job.id)
+        return job
+    
+    @staticmethod
+    def claim_next_job(db: Session, worker_id: str) -> Optional[SyncJob]:
+        """가장 오래된 대기 작업을 실행 상태로 선점 - 다른 워커와 경쟁 시 조건부 UPDATE로 하나만 성공"""
+        candidate_ids = [
+            job_id for (job_id,) in
+            db.query(SyncJob.id).filter(SyncJob.status == "queued").order_by(SyncJob.id).limit(10)
+        ]
+        
+        for job_id in candidate_ids:
+            now = datetime.now()
+            claimed = db.query(SyncJob).filter(
+                SyncJob.id == job_id,
+                SyncJob.status == "queued"
+            ).update({
+                SyncJob.status: "running",
+                SyncJob.worker_id: worker_id,
+                SyncJob.attempts: SyncJob.attempts + 1,
+                SyncJob.started_at: now,
+                SyncJob.heartbeat_at: now
+            }, synchronize_session=False)
+            db.commit()
+            
+            if claimed:
+                return SyncJobService.get_job(db, job_id)
+        
+        return None
+    
+    @staticmethod
+    def touch_jobs(db: Session, job_ids: List[int]) -> List[int]:
+        """실행 중인 작업의 heartbeat 갱신 - 취소 요청된 작업 ID 반환"""
+        if not job_ids:
+            return []
+        
+        db.query(SyncJob).filter(SyncJob.id.in_(job_ids), SyncJob.status == "running").update(
+            {SyncJob.heartbeat_at: datetime.now()}, synchronize_session=False
+        )
+        db.commit()
+        
+        return [
+            job_id for (job_id,) in
+            db.query(SyncJob.id).filter(SyncJob.id.in_(job_ids), SyncJob.cancel_requested.is_(True))
+        ]
+    
+    @staticmethod
+    def requeue_stale_jobs(db: Session) -> int:
+        """heartbeat가 끊긴 실행 중 작업(서버 중단 등)을 다시 대기 상태로 전환 - 재개한 작업 수 반환"""
+        cutoff = datetime.now() - timedelta(seconds=settings.SYNC_JOB_STALE_SECONDS)
+        stale_jobs = db.query(SyncJob).filter(
+            SyncJob.status == "running",
+            or_(SyncJob.heartbeat_at.is_(None), SyncJob.heartbeat_at < cutoff)
+        ).all()
+        
+        requeued_count = 0
+        for job in stale_jobs:
+            if job.cancel_requested:
+                job.status = "cancelled"
+                job.completed_at = datetime.now()
+            elif (job.attempts or 0) >= settings.SYNC_JOB_MAX_ATTEMPTS:
+                job.status = "failed"
+                job.error_message = f"작업이 {job.attempts}회 중단되어 재시도를 중지했습니다."
+                job.completed_at = datetime.now()
+            else:
+                job.status = "queued"
+                job.worker_id = None
+                requeued_count += 1
+            logger.warning(f"중단된 동기화 작업 #{job.id} ({job.project_key}) → {job.status}")
+        
+        if stale_jobs:
+            db.commit()
+        
+        return requeued_count
+    
+    @staticmethod
+    def finish_job(
+        db: Session,
+        job_id: int,
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None
+    ) -> None:
+        """작업 종료 상태 기록 (completed, failed, cancelled, queued)"""
+        job = SyncJobService.get_job(db, job_id)
+        if not job:
+            return
+        
+        job.status = status
+        job.error_message = error_message
+        if result is not None:
+            job.result = json.dumps(result, ensure_ascii=False, default=str)
+        
+        if status == "queued":
+            # 서버 종료로 중단된 작업은 재시작 후 다시 실행 (재시도 횟수에 포함하지 않음)
+            job.worker_id = None
+            job.attempts = max((job.attempts or 1) - 1, 0)
+        else:
+            job.completed_at = datetime.now()
+        
+        db.commit()
+
+
+class SyncJobWorker:
+    """동기화 작업 워커 - 디스패처 스레드가 대기 작업을 선점해 스레드 풀에서 실행"""
+    
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, SyncJobHandler] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._jobs_finished = threading.Condition(self._lock)
+        self._running_jobs: Dict[int, threading.Event] = {}  # 작업 ID -> 취소 이벤트
+    
+    def register_handler(self, job_type: str, handler: SyncJobHandler) -> None:
+        """작업 유형별 실행 함수 등록"""
+        self._handlers[job_type] = handler
+    
+    def start(self) -> None:
+        """워커 시작 (이미 실행 중이면 무시)"""
+        if self._dispatcher and self._dispatcher.is_alive():
+            return
+        
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(settings.SYNC_WORKER_COUNT, 1),
+            thread_name_prefix="sync-job"
+        )
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="sync-job-dispatcher", daemon=True)
+        self._dispatcher.start()
+        logger.info(f"✅ 동기화 작업 워커 시작 ({self.worker_id}, 워커 {settings.SYNC_WORKER_COUNT}개)")
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """워커 종료 - 실행 중인 작업은 중단 후 대기 상태로 되돌려 재시작 시 이어서 실행
+        
+        작업은 진행률 콜백에서 취소 여부를 확인하므로 진행 중인 HTTP 요청(재시도 포함)이 끝나야 중단된다.
+        timeout(기본 SYNC_JOB_SHUTDOWN_TIMEOUT)초 안에 끝나지 않은 작업은 기다리지 않으며,
+        heartbeat가 끊긴 뒤 재시작한 서버나 다른 워커가 이어서 실행한다.
+        """
+        if not self._dispatcher:
+            return
+        
+        if timeout is None:
+            timeout = settings.SYNC_JOB_SHUTDOWN_TIMEOUT
+        deadline = time.monotonic() + timeout
+        
+        self._stopped.set()
+        self._wakeup.set()
+        
+        with self._lock:
+            for cancel_event in self._running_jobs.values():
+                cancel_event.set()
+        
+        self._dispatcher.join(timeout)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        
+        with self._jobs_finished:
+            while self._running_jobs and deadline - time.monotonic() > 0:
+                self._jobs_finished.wait(deadline - time.monotonic())
+            unfinished_jobs = list(self._running_jobs)
+        
+        self._dispatcher = None
+        self._executor = None
+        if unfinished_jobs:
+            logger.warning(f"동기화 작업 워커 종료 - {timeout}초 안에 중단되지 않은 작업: {unfinished_jobs}")
+        else:
+            logger.info("동기화 작업 워커 종료")
+    
+    def wake(self) -> None:
+        """새 작업이 등록되었음을 디스패처에 알림"""
+        self._wakeup.set()
+    
+    def notify_cancel(self, job_id: int) -> None:
+        """이 프로세스에서 실행 중인 작업이면 즉시 취소 이벤트 설정"""
+        with self._lock:
+            cancel_event = self._running_jobs.get(job_id)
+        if cancel_event:
+            cancel_event.set()
+    
+    def _dispatch_loop(self) -> None:
+        """heartbeat 갱신, 중단 작업 재개, 대기 작업 선점을 주기적으로 반복"""
+        while not self._stopped.is_set():
+            db = SessionLocal()
+            try:
+                with self._lock:
+                    running_ids = list(self._running_jobs)
+                
+                for job_id in SyncJobService.touch_jobs(db, running_ids):
+                    self.notify_cancel(job_id)
+                
+                SyncJobService.requeue_stale_jobs(db)
+                
+                while not self._stopped.is_set() and self._has_free_worker():
+                    job = SyncJobService.claim_next_job(db, self.worker_id)
+                    if not job:
+                        break
+                    
+                    cancel_event = threading.Event()
+                    if job.cancel_requested:
+                        cancel_event.set()
+                    with self._lock:
+                        self._running_jobs[job.id] = cancel_event
+                    self._executor.submit(self._run_job, job.id, cancel_event)
+            except Exception as e:
+                logger.error(f"동기화 작업 디스패처 오류: {str(e)}")
+            finally:
+                db.close()
+            
+            self._wakeup.wait(settings.SYNC_JOB_POLL_INTERVAL)
+            self._wakeup.clear()
+    
+    def _has_free_worker(self) -> bool:
+        with self._lock:
+            return len(self._running_jobs) < max(settings.SYNC_WORKER_COUNT, 1)
+    
+    def _run_job(self, job_id: int, cancel_event: threading.Event) -> None:
+        """작업 하나 실행 (워커 스레드)"""
+        db = SessionLocal()
+        
+        def check_cancelled():
+            if cancel_event.is_set():
+                raise SyncJobCancelled(f"동기화 작업 #{job_id}이(가) 중단되었습니다.")
+        
+        try:
+            job = SyncJobService.get_job(db, job_id)
+            handler = self._handlers.get(job.job_type)
+            if not handler:
+                raise ValueError(f"등록되지 않은 작업 유형입니다: {job.job_type}")
+            
+            logger.info(f"동기화 작업 실행: #{job.id} ({job.job_type}, {job.project_key}, 시도 {job.attempts}회)")
+            payload = json.loads(job.payload or "{}")
+            result = handler(job, payload, check_cancelled)
+            
+            SyncJobService.finish_job(db, job_id, "completed", result=result)
+            logger.info(f"동기화 작업 완료: #{job_id}")
+        except SyncJobCancelled as e:
+            db.rollback()
+            job = SyncJobService.get_job(db, job_id)
+            if self._stopped.is_set() and not (job and job.cancel_requested):
+                SyncJobService.finish_job(db, job_id, "queued", error_message=str(e))
+                logger.info(f"서버 종료로 동기화 작업 #{job_id} 중단 - 재시작 후 재개")
+            else:
+                SyncJobService.finish_job(db, job_id, "cancelled", error_message=str(e))
+                logger.info(f"동기화 작업 취소됨: #{job_id}")
+        except Exception as e:
+            db.rollback()
+            SyncJobService.finish_job(db, job_id, "failed", error_message=str(e))
+            logger.error(f"동기화 작업 실패: #{job_id} - {str(e)}")
+        finally:
+            db.close()
+            with self._jobs_finished:
+                self._running_jobs.pop(job_id, None)
+                self._jobs_finished.notify_all()
+            self._wakeup.set()
+
+
+# 전역 인스턴스
+sync_job_service = SyncJobService()
+sync_job_worker = SyncJobWorker()
+
+# API 라우트용 비동기 래퍼
+async_sync_job_service = AsyncServiceProxy(sync_job_service, methods=("enqueue", "get_job", "get_jobs", "cancel"))
@@ -0,0 +1,175 @@
+"""
+동기화 진행 상태 저장소
+
+기본 memory 저장소는 프로세스 내부 딕셔너리를 사용한다.
+uvicorn 워커를 여러 개 실행할 때는 database 저장소를 사용하면 모든 프로세스가 같은 상태를 조회하고,
+서버를 재시작해도 마지막 진행 상태가 유지된다.
+"""
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+import time
+from datetime import datetime
+from typing import Dict, Optional, Set, Tuple
+
+from sqlalchemy.exc import IntegrityError
+
+from config.settings import settings
+from core.database import SessionLocal
+from models.database_models import SyncProgress
+from models.pydantic_models import SyncStatus
+
+logger = logging.getLogger(__name__)
+
+
+class SyncStatusStore(ABC):
+    """동기화 진행 상태 저장소 인터페이스 (get/save를 모두 구현해야 생성 가능)"""
+    
+    def __init__(self):
+        self._waiters_lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+    
+    @abstractmethod
+    def get(self, project_key: str) -> Optional[SyncStatus]:
+        """프로젝트의 동기화 상태 조회"""
+    
+    @abstractmethod
+    def save(self, project_key: str, status: SyncStatus, force: bool = False) -> None:
+        """동기화 상태 저장 - force가 아니면 저장소에 따라 쓰기 빈도를 제한할 수 있음"""
+    
+    async def wait_for_update(self, timeout: float) -> None:
+        """이 프로세스에서 상태가 저장될 때까지 최대 timeout초 대기 (진행 이벤트 스트림용)
+        
+        스레드풀을 점유하지 않도록 이벤트 루프의 asyncio.Event로 기다리며, 워커 스레드의 save()가 깨운다.
+        다른 프로세스의 변경은 알 수 없으므로 호출 측은 timeout 후 다시 조회해야 한다.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._waiters_lock:
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._waiters_lock:
+                self._waiters.discard(waiter)
+    
+    def _notify_update(self) -> None:
+        with self._waiters_lock:
+            waiters = list(self._waiters)
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 경우
+                pass
+
+
+class InMemorySyncStatusStore(SyncStatusStore):
+    """프로세스 내부 딕셔너리 저장소 (단일 워커용)"""
+    
+    def __init__(self):
+        super().__init__()
+        self._statuses: Dict[str, SyncStatus] = {}
+    
+    def get(self, project_key: str) -> Optional[SyncStatus]:
+        return self._statuses.get(project_key)
+    
+    def save(self, project_key: str, status: SyncStatus, force: bool = False) -> None:
+        self._statuses[project_key] = status
+        self._notify_update()
+
+
+class DatabaseSyncStatusStore(SyncStatusStore):
+    """sync_progress 테이블 저장소 (멀티 워커용)
+    
+    진행률 콜백은 페이지마다 호출되므로, 상태 단계가 바뀌거나 force인 경우를 제외하면
+    write_interval 간격으로만 저장한다. 아직 저장되지 않은 최신 상태는 같은 프로세스에서 조회 시 반환한다.
+    """
+    
+    def __init__(self, write_interval: float = 1.0):
+        super().__init__()
+        self.write_interval = write_interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, SyncStatus] = {}  # 저장 대기 중인 최신 상태
+        self._last_written: Dict[str, tuple] = {}  # 프로젝트 -> (저장 시각, 저장된 상태 단계)
+    
+    def get(self, project_key: str) -> Optional[SyncStatus]:
+        with self._lock:
+            pending = self._pending.get(project_key)
+        if pending:
+            return pending
+        
+        db = SessionLocal()
+        try:
+            record = db.query(SyncProgress).filter(SyncProgress.project_key == project_key).first()
+            if not record or not record.status_data:
+                return None
+            return SyncStatus.model_validate_json(record.status_data)
+        except Exception as e:
+            logger.error(f"동기화 상태 조회 오류 ({project_key}): {str(e)}")
+            return None
+        finally:
+            db.close()
+    
+    def save(self, project_key: str, status: SyncStatus, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            last_time, last_stage = self._last_written.get(project_key, (None, None))
+            due = (
+                force
+                or last_time is None
+                or status.status != last_stage
+                or now - last_time >= self.write_interval
+            )
+            if not due:
+                self._pending[project_key] = status
+            else:
+                self._pending.pop(project_key, None)
+                self._last_written[project_key] = (now, status.status)
+        
+        if due:
+            self._write(project_key, status)
+        self._notify_update()
+    
+    def _write(self, project_key: str, status: SyncStatus) -> None:
+        status_data = status.model_dump_json()
+        db = SessionLocal()
+        try:
+            for attempt in range(2):
+                record = db.query(SyncProgress).filter(SyncProgress.project_key == project_key).first()
+                if not record:
+                    record = SyncProgress(project_key=project_key)
+                    db.add(record)
+                record.status_data = status_data
+                record.updated_at = datetime.now()
+                
+                try:
+                    db.commit()
+                    return
+                except IntegrityError:
+                    # 다른 프로세스가 같은 프로젝트 행을 먼저 만든 경우 업데이트로 재시도
+                    db.rollback()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"동기화 상태 저장 오류 ({project_key}): {str(e)}")
+        finally:
+            db.close()
+
+
+def create_sync_status_store() -> SyncStatusStore:
+    """설정(SYNC_STATUS_BACKEND)에 맞는 저장소 생성"""
+    backend = settings.SYNC_STATUS_BACKEND.lower()
+    
+    if backend == "database":
+        logger.info("동기화 상태 저장소: database (sync_progress 테이블)")
+        return DatabaseSyncStatusStore(write_interval=settings.SYNC_STATUS_WRITE_INTERVAL)
+    if backend != "memory":
+        logger.warning(f"알 수 없는 SYNC_STATUS_BACKEND '{backend}' - memory 저장소를 사용합니다")
+    
+    return InMemorySyncStatusStore()
+
+
+# 전역 인스턴스
+sync_status_store = create_sync_status_store()
@@ -1,18 +1,30 @@
 """
 작업 관리 서비스
 """
+import hashlib
+import json
 import logging
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from datetime import datetime, timezone
+from typing import List, Optional, Dict, Any, Set, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 
-from models.database_models import Task, Project, SyncHistory
+from config.settings import settings
+from core.async_service import AsyncServiceProxy
+from core.database import BULK_UPSERT_INSERTS
+from core.pipeline import prefetch, chunked
+from core.progress import ProgressReporter
+from models.database_models import Task, TaskStat, Project, SyncHistory
 from models.pydantic_models import TaskCreate, TaskUpdate, TaskResponse
 from services.jira_service import jira_service
+from services.task_stats_service import task_stats_service, DEFAULT_QA_STATUS
 
 logger = logging.getLogger(__name__)
 
+# content_hash 계산에 사용하는 Jira 동기화 필드
+TASK_HASH_FIELDS = ("jira_id", "title", "description", "status", "assignee", "priority", "project_id")
+
 
 class TaskService:
     """작업 관리 서비스 클래스"""
@@ -25,8 +37,8 @@ class TaskService:
         skip: int = 0,
         limit: int = 1000
     ) -> List[Task]:
-        """작업 목록 조회"""
-        query = db.query(Task)
+        """작업 목록 조회 (삭제 표시된 작업 제외)"""
+        query = db.query(Task).filter(Task.deleted_at.is_(None))
         
         if project_id:
             query = query.filter(Task.project_id == project_id)
@@ -50,6 +62,8 @@ class TaskService:
         """작업 생성"""
         task = Task(**task_data.dict())
         db.add(task)
+        db.flush()
+        task_stats_service.record_change(db, None, task_stats_service.bucket_of(task))
         db.commit()
         db.refresh(task)
         logger.info(f"작업 생성: {task.jira_key}")
@@ -62,10 +76,13 @@ class TaskService:
         if not task:
             return None
         
+        old_bucket = task_stats_service.bucket_of(task)
         update_data = task_data.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(task, field, value)
         
+        if not task.deleted_at:
+            task_stats_service.record_change(db, old_bucket, task_stats_service.bucket_of(task))
         task.updated_at = datetime.now()
         db.commit()
         db.refresh(task)
@@ -80,6 +97,8 @@ class TaskService:
             return False
         
         jira_key = task.jira_key
+        if not task.deleted_at:
+            task_stats_service.record_change(db, task_stats_service.bucket_of(task), None)
         db.delete(task)
         db.commit()
         logger.info(f"작업 삭제: {jira_key}")
@@ -93,7 +112,10 @@ class TaskService:
             return None
         
         old_qa_status = task.qa_status
+        old_bucket = task_stats_service.bucket_of(task)
         task.qa_status = qa_status  # status가 아닌 qa_status 필드 업데이트
+        if not task.deleted_at:
+            task_stats_service.record_change(db, old_bucket, task_stats_service.bucket_of(task))
         task.updated_at = datetime.now()
         db.commit()
         db.refresh(task)
@@ -118,68 +140,68 @@ class TaskService:
     
     @staticmethod
     def get_dashboard_stats(db: Session) -> Dict[str, Any]:
-        """대시보드 통계 조회 - 고급 통계 포함"""
-        # 기본 통계
-        total_tasks = db.query(Task).count()
-        completed_tasks = db.query(Task).filter(Task.status == "Done").count()
-        qa_ready_tasks = db.query(Task).filter(Task.status == "QA Ready").count()
-        in_progress_tasks = db.query(Task).filter(Task.status == "In Progress").count()
+        """대시보드 통계 조회 - 고급 통계 포함
+        
+        건수 통계는 task_stats 집계 버킷에서 계산하므로 tasks 전체를 스캔하지 않는다.
+        """
+        from datetime import datetime, timedelta
+        week_ago = datetime.now() - timedelta(days=7)
+        
+        summary = task_stats_service.get_summary(db)
+        status_counts = summary["status"]
+        qa_status_counts = summary["qa_status"]
+        priority_counts = summary["priority"]
+        
+        total_tasks = summary["total"]
+        completed_tasks = status_counts["Done"]
+        qa_completed = qa_status_counts["QA 완료"]
         
         completion_rate = 0.0
         if total_tasks > 0:
             completion_rate = round((completed_tasks / total_tasks) * 100, 1)
         
-        # QA 상태별 통계
-        qa_completed = db.query(Task).filter(Task.qa_status == "QA 완료").count()
-        qa_in_progress = db.query(Task).filter(Task.qa_status == "QA 진행중").count()
-        qa_started = db.query(Task).filter(Task.qa_status == "QA 시작").count()
-        qa_not_started = db.query(Task).filter(
-            (Task.qa_status == "미시작") | (Task.qa_status.is_(None))
-        ).count()
-        
-        # 우선순위별 통계
-        priority_stats = db.query(Task.priority, func.count(Task.id)).group_by(Task.priority).all()
-        priority_dict = {priority: count for priority, count in priority_stats}
-        
         # 담당자별 통계 (상위 5명)
-        assignee_stats = db.query(Task.assignee, func.count(Task.id)).filter(
-            Task.assignee.isnot(None), Task.assignee != "", Task.assignee != "Unassigned"
-        ).group_by(Task.assignee).order_by(func.count(Task.id).desc()).limit(5).all()
+        assignee_stats = [
+            (assignee, count) for assignee, count in summary["assignee"].most_common()
+            if assignee not in ("", "Unassigned")
+        ][:5]
         
         # 프로젝트별 통계
-        project_stats = db.query(Project.jira_project_key, func.count(Task.id)).join(
-            Task, Project.id == Task.project_id
-        ).group_by(Project.jira_project_key).order_by(func.count(Task.id).desc()).all()
+        project_keys = dict(db.query(Project.id, Project.jira_project_key).all())
+        project_stats = [
+            (project_keys[project_id], count) for project_id, count in summary["project"].most_common()
+            if project_id in project_keys
+        ]
         
         # 최근 동기화 정보
         recent_sync = db.query(SyncHistory).order_by(desc(SyncHistory.started_at)).first()
         
-        # 일주일간 생성된 작업 수
-        from datetime import datetime, timedelta
-        week_ago = datetime.now() - timedelta(days=7)
-        weekly_new_tasks = db.query(Task).filter(Task.created_at >= week_ago).count()
+        # 일주일간 생성된 작업 수 (기간 조건이라 집계 버킷으로 유지할 수 없음 - ix_tasks_created_at 범위 조회)
+        weekly_new_tasks = db.query(func.count(Task.id)).filter(
+            Task.deleted_at.is_(None), Task.created_at >= week_ago
+        ).scalar()
         
         return {
             # 기본 통계
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
-            "qa_ready_tasks": qa_ready_tasks,
-            "in_progress_tasks": in_progress_tasks,
+            "qa_ready_tasks": status_counts["QA Ready"],
+            "in_progress_tasks": status_counts["In Progress"],
             "completion_rate": completion_rate,
             
             # QA 상태별 통계
             "qa_completed": qa_completed,
-            "qa_in_progress": qa_in_progress,
-            "qa_started": qa_started,
-            "qa_not_started": qa_not_started,
+            "qa_in_progress": qa_status_counts["QA 진행중"],
+            "qa_started": qa_status_counts["QA 시작"],
+            "qa_not_started": qa_status_counts["미시작"] + qa_status_counts[""],
             "qa_completion_rate": round((qa_completed / total_tasks) * 100, 1) if total_tasks > 0 else 0.0,
             
             # 우선순위별 통계
-            "priority_highest": priority_dict.get("Highest", 0),
-            "priority_high": priority_dict.get("High", 0),
-            "priority_medium": priority_dict.get("Medium", 0),
-            "priority_low": priority_dict.get("Low", 0),
-            "priority_lowest": priority_dict.get("Lowest", 0),
+            "priority_highest": priority_counts["Highest"],
+            "priority_high": priority_counts["High"],
+            "priority_medium": priority_counts["Medium"],
+            "priority_low": priority_counts["Low"],
+            "priority_lowest": priority_counts["Lowest"],
             
             # 담당자별 통계 (상위 5명)
             "top_assignees": [{"name": assignee, "count": count} for assignee, count in assignee_stats],
@@ -196,7 +218,7 @@ class TaskService:
             "weekly_new_tasks": weekly_new_tasks,
             
             # 활성 프로젝트 수
-            "active_projects": db.query(Project).filter(Project.is_active == True).count()
+            "active_projects": db.query(func.count(Project.id)).filter(Project.is_active == True).scalar()
         }
     
     @staticmethod
@@ -212,8 +234,9 @@ class TaskService:
             from models.database_models import TestCase
             db.query(TestCase).delete()
             
-            # 2. Task 삭제
+            # 2. Task 및 작업 통계 삭제
             db.query(Task).delete()
+            db.query(TaskStat).delete()
             
             # 3. SyncHistory 삭제
             db.query(SyncHistory).delete()
@@ -240,11 +263,12 @@ class TaskService:
     def sync_jira_issues(
         db: Session,
         project_key: str,
-        selected_issues: Optional[List[str]] = None
+        selected_issues: Optional[List[str]] = None,
+        full_sync: bool = False
     ) -> Dict[str, Any]:
         """Jira 이슈 동기화"""
         return TaskService.sync_jira_issues_with_progress(
-            db, project_key, selected_issues, None
+            db, project_key, selected_issues, None, full_sync=full_sync
         )
     
     @staticmethod
@@ -252,151 +276,155 @@ class TaskService:
         db: Session,
         project_key: str,
         selected_issues: Optional[List[str]] = None,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        issues: Optional[List[Dict[str, Any]]] = None,
+        fetch_progress_callback: Optional[callable] = None,
+        full_sync: bool = False
     ) -> Dict[str, Any]:
-        """Jira 이슈 동기화 (진행률 콜백 지원) - 고성능 배치 처리"""
+        """Jira 이슈 동기화 (진행률 콜백 지원) - 페이지 단위 스트리밍 처리
+        
+        issues가 주어지면 Jira를 다시 조회하지 않고 전달받은 정규화 이슈를 바로 저장한다.
+        전체 동기화는 다음 페이지를 조회하는 동안 현재 페이지를 저장하므로
+        프로젝트 전체 이슈를 메모리에 올리지 않는다.
+        프로젝트에 증분 기준 시각이 있으면 그 이후 변경분만 조회하며, full_sync=True면 전체를 조회한다.
+        진행률 콜백은 ProgressReporter로 감싸 시간/퍼센트 단위로만 호출된다.
+        """
+        if progress_callback:
+            progress_callback = ProgressReporter(progress_callback)
+        if fetch_progress_callback:
+            fetch_progress_callback = ProgressReporter(fetch_progress_callback)
+        
         try:
+            # 프로젝트 확인 및 생성
+            project = TaskService._ensure_project_exists(db, project_key)
+            
+            # 동기화 방식 결정: 선택 / 증분 / 전체
+            updated_since = None
+            if selected_issues:
+                sync_type = "selected"
+            elif issues is None and not full_sync and project.issues_updated_cursor:
+                sync_type = "incremental"
+                updated_since = project.issues_updated_cursor
+                logger.info(f"프로젝트 {project_key} 증분 동기화: {updated_since} (UTC) 이후 변경분 조회")
+            else:
+                sync_type = "full"
+            
+            # 전체 스트리밍 동기화에서만 Jira에서 사라진 작업을 정리
+            reconcile = sync_type == "full" and issues is None
+            
             # 동기화 이력 생성
             sync_history = SyncHistory(
                 project_key=project_key,
-                sync_type="selected" if selected_issues else "full",
+                sync_type=sync_type,
                 status="started"
             )
             db.add(sync_history)
             db.commit()
             
-            # 프로젝트 확인 및 생성
-            project = TaskService._ensure_project_exists(db, project_key)
+            batch_size = settings.SYNC_BATCH_SIZE
+            fetch_state = {"total": 0}
             
-            # Jira 이슈 가져오기 - 선택된 이슈만 개별 조회
-            if selected_issues:
-                # 선택된 이슈만 개별 조회 (성능 최적화)
-                issues = []
-                logger.info(f"선택된 이슈 {len(selected_issues)}개 개별 조회 시작")
+            # 증분 기준 시각은 조회 시작 시각 (UTC) - 동기화 중 수정된 이슈는 다음 증분 조회에 포함됨
+            # 이미 조회된 이슈를 전달받은 경우는 조회 시각을 알 수 없으므로 기준 시각을 갱신하지 않음
+            sync_started_at = datetime.now(timezone.utc).replace(tzinfo=None) if issues is None else None
+            
+            # Jira 이슈 가져오기 - 이미 조회된 이슈가 있으면 재조회하지 않음
+            if issues is not None:
+                logger.info(f"프로젝트 {project_key}: 조회된 이슈 {len(issues)}개로 저장 단계 시작")
+                fetch_state["total"] = len(issues)
+                pages = chunked(issues, batch_size)
+            elif selected_issues:
+                # 선택된 이슈를 key in (...) JQL로 묶어서 조회
+                logger.info(f"선택된 이슈 {len(selected_issues)}개 일괄 조회 시작")
+                issues = jira_service.get_issues_by_keys(selected_issues, progress_callback=fetch_progress_callback)
+                fetch_state["total"] = len(issues)
+                pages = chunked(issues, batch_size)
+            else:
+                # 전체/증분 이슈 스트리밍 조회 - 페이지를 받는 대로 저장
+                logger.info(f"프로젝트 {project_key} 이슈 스트리밍 동기화 시작 ({sync_type})")
                 
-                for issue_key in selected_issues:
-                    try:
-                        issue = jira_service.get_issue(issue_key)
-                        if issue:
-                            issues.append(issue)
-                            logger.debug(f"선택된 이슈 조회 성공: {issue_key}")
-                        else:
-                            logger.warning(f"이슈 {issue_key} 조회 실패: 이슈를 찾을 수 없음")
-                    except Exception as e:
-                        logger.warning(f"이슈 {issue_key} 조회 실패: {str(e)}")
+                def on_page_fetched(fetched: int, total: int):
+                    fetch_state["total"] = total
+                    if fetch_progress_callback:
+                        fetch_progress_callback(fetched, total)
                 
-                logger.info(f"선택된 이슈 {len(selected_issues)}개 중 {len(issues)}개 조회 성공")
-            else:
-                # 전체 이슈 조회
-                logger.info(f"프로젝트 {project_key} 전체 이슈 조회 시작")
-                issues = jira_service.get_issues(project_key)
-                logger.info(f"프로젝트 {project_key} 전체 이슈 {len(issues)}개 조회 완료")
-            
-            # 기존 작업들을 한 번에 조회 (성능 최적화)
-            existing_tasks = {}
-            if issues:
-                jira_keys = [issue.get("key", "") for issue in issues if issue.get("key")]
-                existing_task_list = db.query(Task).filter(Task.jira_key.in_(jira_keys)).all()
-                existing_tasks = {task.jira_key: task for task in existing_task_list}
-                logger.info(f"기존 작업 {len(existing_tasks)}개 조회 완료")
+                pages = prefetch(
+                    jira_service.iter_issue_pages(
+                        project_key,
+                        progress_callback=on_page_fetched,
+                        updated_since=updated_since,
+                        full_scan=reconcile
+                    ),
+                    depth=1
+                )
             
+            total_issues = 0
             synced_count = 0
-            batch_size = 200  # 배치 크기를 200으로 증가
-            new_tasks = []
-            updated_tasks = []
-            
-            # 배치 처리로 성능 대폭 향상
-            for i, issue in enumerate(issues):
-                try:
-                    jira_key = issue.get("key", "")
-                    if not jira_key:
-                        continue
-                    
-                    # 진행률 콜백 호출 (매번 호출하되 성능 최적화)
-                    if progress_callback:
-                        progress_callback(i + 1, len(issues), jira_key)
-                    
-                    # Jira 서비스에서 이미 정규화된 데이터 사용
-                    title = issue.get("summary", "")[:500]
-                    description = issue.get("description", "")
-                    status = issue.get("status", "To Do")
-                    assignee = issue.get("assignee", "")
-                    priority = issue.get("priority", "Medium")
-                    jira_id = issue.get("id", "")
-                    
-                    # 기존 작업 확인
-                    task = existing_tasks.get(jira_key)
-                    
-                    if not task:
-                        # 새 작업 생성 (배치에 추가)
-                        new_task = Task(
-                            jira_key=jira_key,
-                            jira_id=jira_id,
-                            title=title,
-                            description=description,
-                            status=status,
-                            assignee=assignee,
-                            priority=priority,
-                            project_id=project.id,
-                            last_sync=datetime.now()
-                        )
-                        new_tasks.append(new_task)
-                    else:
-                        # 기존 작업 업데이트 (배치에 추가)
-                        task.title = title
-                        task.description = description or task.description
-                        task.status = status
-                        task.assignee = assignee
-                        task.priority = priority
-                        task.project_id = project.id
-                        task.last_sync = datetime.now()
-                        updated_tasks.append(task)
-                    
-                    synced_count += 1
-                    
-                    # 배치 처리 - 200개마다 한 번에 커밋
-                    if synced_count % batch_size == 0:
-                        # 새 작업들 한 번에 추가
-                        if new_tasks:
-                            db.add_all(new_tasks)
-                            new_tasks = []
-                        
-                        # 업데이트된 작업들은 이미 세션에 있으므로 별도 처리 불필요
-                        db.commit()
-                        logger.info(f"배치 커밋: {synced_count}개 이슈 처리 완료 (배치 크기: {batch_size})")
-                    
-                except Exception as e:
-                    logger.error(f"이슈 {issue.get('key', 'Unknown')} 동기화 오류: {str(e)}")
-                    continue
+            new_count = 0
+            updated_count = 0
+            unchanged_count = 0
+            fetched_keys = set()
             
-            # 남은 작업들 처리
-            if new_tasks:
-                db.add_all(new_tasks)
-                logger.info(f"마지막 배치: {len(new_tasks)}개 새 작업 추가")
+            for page in pages:
+                total_issues += len(page)
+                for issue in page:
+                    fetched_keys.add(issue.get("key", ""))
+                page_synced, page_new, page_updated, page_unchanged = TaskService._upsert_issue_page(db, project, page)
+                db.commit()
+                
+                synced_count += page_synced
+                new_count += page_new
+                updated_count += page_updated
+                unchanged_count += page_unchanged
+                logger.info(f"배치 커밋: {synced_count}개 이슈 처리 완료 (새 작업: {page_new}, 업데이트: {page_updated}, 변경 없음: {page_unchanged})")
+                
+                if progress_callback:
+                    progress_callback(total_issues, max(fetch_state["total"], total_issues), page[-1].get("key", ""))
             
             # 최종 진행률 콜백 호출
             if progress_callback:
-                progress_callback(len(issues), len(issues), "완료")
+                progress_callback(total_issues, total_issues, "완료")
+            
+            tombstoned_count = 0
+            if reconcile:
+                tombstoned_count = TaskService._tombstone_missing_tasks(
+                    db, project, fetched_keys, fetch_state["total"]
+                )
             
             # 동기화 이력 업데이트
             sync_history.status = "completed"
-            sync_history.total_issues = len(issues)
+            sync_history.total_issues = total_issues
             sync_history.processed_issues = synced_count
+            sync_history.changed_issues = new_count + updated_count
+            sync_history.unchanged_issues = unchanged_count
+            sync_history.deleted_issues = tombstoned_count
             sync_history.completed_at = datetime.now()
             
+            # 증분 기준 시각 갱신 (선택 동기화는 프로젝트 전체를 반영하지 않으므로 제외)
+            if sync_type != "selected":
+                current_cursor = project.issues_updated_cursor
+                if current_cursor and current_cursor.tzinfo:
+                    current_cursor = current_cursor.astimezone(timezone.utc).replace(tzinfo=None)
+                if sync_started_at and (not current_cursor or sync_started_at > current_cursor):
+                    project.issues_updated_cursor = sync_started_at
+                project.last_sync = datetime.now()
+            
             # 최종 커밋
             db.commit()
             
-            logger.info(f"프로젝트 {project_key}: {synced_count}개 작업 동기화 완료 (새 작업: {len(new_tasks)}, 업데이트: {len(updated_tasks)})")
+            logger.info(f"프로젝트 {project_key}: {synced_count}개 작업 동기화 완료 (새 작업: {new_count}, 업데이트: {updated_count}, 변경 없음: {unchanged_count}, 삭제: {tombstoned_count})")
             
             return {
                 "success": True,
-                "message": f"동기화 완료! {synced_count}개 작업 처리됨 (고성능 배치 처리)",
+                "message": f"동기화 완료! {synced_count}개 작업 처리됨 (변경: {new_count + updated_count}, 변경 없음: {unchanged_count})",
                 "project_key": project_key,
+                "sync_type": sync_type,
                 "synced_count": synced_count,
-                "total_issues": len(issues),
-                "new_tasks": len([t for t in new_tasks]) + len([t for t in existing_tasks.values() if t not in updated_tasks]),
-                "updated_tasks": len(updated_tasks)
+                "total_issues": total_issues,
+                "new_tasks": new_count,
+                "updated_tasks": updated_count,
+                "unchanged_tasks": unchanged_count,
+                "deleted_tasks": tombstoned_count
             }
             
         except Exception as e:
@@ -411,6 +439,175 @@ class TaskService:
             logger.error(f"프로젝트 {project_key} 동기화 실패: {str(e)}")
             raise
     
+    @staticmethod
+    def _upsert_issue_page(db: Session, project: Project, issues: List[Dict[str, Any]]) -> Tuple[int, int, int, int]:
+        """정규화된 이슈 한 페이지를 Task로 저장 - (처리 수, 생성 수, 업데이트 수, 변경 없음 수) 반환
+        
+        기존 작업은 content_hash가 달라진 경우에만 UPDATE 한다.
+        """
+        now = datetime.now()
+        rows_by_key = {}
+        
+        for issue in issues:
+            try:
+                jira_key = issue.get("key", "")
+                if not jira_key:
+                    continue
+                
+                # Jira 서비스에서 이미 정규화된 데이터 사용
+                row = {
+                    "jira_key": jira_key,
+                    "jira_id": issue.get("id", ""),
+                    "title": issue.get("summary", "")[:500],
+                    "description": issue.get("description", ""),
+                    "status": issue.get("status", "To Do"),
+                    "assignee": issue.get("assignee", ""),
+                    "priority": issue.get("priority", "Medium"),
+                    "project_id": project.id,
+                    "last_sync": now
+                }
+                row["content_hash"] = TaskService._content_hash(row)
+                # 같은 키가 한 페이지에 두 번 들어오면 마지막 값만 사용
+                rows_by_key[jira_key] = row
+            except Exception as e:
+                logger.error(f"이슈 {issue.get('key', 'Unknown')} 동기화 오류: {str(e)}")
+                continue
+        
+        if not rows_by_key:
+            return 0, 0, 0, 0
+        
+        # 기존 작업의 해시와 통계 버킷 필드만 조회해 생성/변경/변경 없음을 구분 (삭제 표시된 작업은 복구 대상)
+        existing = {
+            task.jira_key: task for task in
+            db.query(
+                Task.jira_key, Task.content_hash, Task.deleted_at, Task.project_id,
+                Task.status, Task.qa_status, Task.priority, Task.assignee
+            ).filter(Task.jira_key.in_(list(rows_by_key)))
+        }
+        existing_hashes = {
+            jira_key: None if task.deleted_at else task.content_hash
+            for jira_key, task in existing.items()
+        }
+        new_rows = [row for key, row in rows_by_key.items() if key not in existing_hashes]
+        changed_rows = [
+            row for key, row in rows_by_key.items()
+            if key in existing_hashes and existing_hashes[key] != row["content_hash"]
+        ]
+        
+        rows = new_rows + changed_rows
+        if rows:
+            if db.get_bind().dialect.name in BULK_UPSERT_INSERTS:
+                written_keys = TaskService._bulk_upsert_tasks(db, rows)
+            else:
+                written_keys = TaskService._orm_upsert_tasks(db, rows)
+            
+            # 조회 이후 다른 동기화가 같은 내용을 먼저 반영해 건너뛴 행은 통계/건수에서 제외
+            new_rows = [row for row in new_rows if row["jira_key"] in written_keys]
+            changed_rows = [row for row in changed_rows if row["jira_key"] in written_keys]
+            
+            # 통계 버킷 증감 (QA 상태는 동기화로 바뀌지 않으므로 기존 값 유지)
+            stat_deltas = Counter()
+            for row in new_rows:
+                stat_deltas[task_stats_service.bucket_of(dict(row, qa_status=DEFAULT_QA_STATUS))] += 1
+            for row in changed_rows:
+                task = existing[row["jira_key"]]
+                if not task.deleted_at:
+                    stat_deltas[task_stats_service.bucket_of(task._asdict())] -= 1
+                stat_deltas[task_stats_service.bucket_of(dict(row, qa_status=task.qa_status))] += 1
+            task_stats_service.apply(db, stat_deltas)
+        
+        unchanged_count = len(rows_by_key) - len(new_rows) - len(changed_rows)
+        return len(rows_by_key), len(new_rows), len(changed_rows), unchanged_count
+    
+    @staticmethod
+    def _content_hash(row: Dict[str, Any]) -> str:
+        """Jira에서 동기화되는 필드의 해시 (변경 여부 판단용)"""
+        fields = [row.get(field) for field in TASK_HASH_FIELDS]
+        payload = json.dumps(fields, ensure_ascii=False, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _bulk_upsert_tasks(db: Session, rows: List[Dict[str, Any]]) -> Set[str]:
+        """jira_key 기준 INSERT ... ON CONFLICT DO UPDATE 일괄 실행 - 실제로 쓰인 jira_key 반환"""
+        tasks = Task.__table__
+        stmt = BULK_UPSERT_INSERTS[db.get_bind().dialect.name](tasks)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[tasks.c.jira_key],
+            set_={
+                "title": stmt.excluded.title,
+                "description": func.coalesce(func.nullif(stmt.excluded.description, ""), tasks.c.description),
+                "status": stmt.excluded.status,
+                "assignee": stmt.excluded.assignee,
+                "priority": stmt.excluded.priority,
+                "project_id": stmt.excluded.project_id,
+                "content_hash": stmt.excluded.content_hash,
+                "last_sync": stmt.excluded.last_sync,
+                "deleted_at": None,
+                "updated_at": func.now()
+            },
+            # 조회 이후 다른 동기화가 같은 내용을 먼저 반영한 경우에도 다시 쓰지 않음
+            where=tasks.c.content_hash.is_distinct_from(stmt.excluded.content_hash) | tasks.c.deleted_at.isnot(None)
+        )
+        # WHERE 조건으로 UPDATE가 생략된 행은 RETURNING에 포함되지 않음
+        return set(db.execute(stmt.returning(tasks.c.jira_key), rows).scalars())
+    
+    @staticmethod
+    def _orm_upsert_tasks(db: Session, rows: List[Dict[str, Any]]) -> Set[str]:
+        """ON CONFLICT를 지원하지 않는 DB용 ORM upsert - 쓰인 jira_key 반환 (모든 행)"""
+        existing_tasks = {
+            task.jira_key: task for task in
+            db.query(Task).filter(Task.jira_key.in_([row["jira_key"] for row in rows])).all()
+        }
+        
+        for row in rows:
+            task = existing_tasks.get(row["jira_key"])
+            
+            if not task:
+                db.add(Task(**row))
+            else:
+                task.title = row["title"]
+                task.description = row["description"] or task.description
+                task.status = row["status"]
+                task.assignee = row["assignee"]
+                task.priority = row["priority"]
+                task.project_id = row["project_id"]
+                task.content_hash = row["content_hash"]
+                task.last_sync = row["last_sync"]
+                task.deleted_at = None
+        
+        return {row["jira_key"] for row in rows}
+    
+    @staticmethod
+    def _tombstone_missing_tasks(db: Session, project: Project, fetched_keys: set, expected_total: int) -> int:
+        """전체 동기화에서 조회되지 않은 프로젝트 작업을 삭제 표시 - 표시한 작업 수 반환
+        
+        Jira에서 삭제되었거나 다른 프로젝트로 이동한 이슈가 대상이며, 다음 동기화에서 다시 조회되면 복구된다.
+        """
+        fetched_keys.discard("")
+        
+        # 조회가 비었거나 Jira가 알려준 전체 건수보다 적게 받았으면 잘못 삭제하지 않도록 건너뜀
+        if not fetched_keys or len(fetched_keys) < expected_total:
+            logger.warning(
+                f"프로젝트 {project.jira_project_key}: 조회 결과가 불완전하여 삭제 이슈 정리를 건너뜁니다 "
+                f"(조회: {len(fetched_keys)}, 전체: {expected_total})"
+            )
+            return 0
+        
+        stored_keys = {
+            jira_key for (jira_key,) in
+            db.query(Task.jira_key).filter(Task.project_id == project.id, Task.deleted_at.is_(None))
+        }
+        missing_keys = stored_keys - fetched_keys
+        if not missing_keys:
+            return 0
+        
+        task_stats_service.remove_tasks(db, [Task.jira_key.in_(missing_keys)])
+        db.query(Task).filter(Task.jira_key.in_(missing_keys)).update(
+            {Task.deleted_at: datetime.now()}, synchronize_session=False
+        )
+        logger.info(f"프로젝트 {project.jira_project_key}: Jira에서 사라진 작업 {len(missing_keys)}개 삭제 표시")
+        return len(missing_keys)
+    
     @staticmethod
     def _ensure_project_exists(db: Session, project_key: str) -> Project:
         """프로젝트 존재 확인 및 생성"""
@@ -474,3 +671,9 @@ class TaskService:
 
 # 전역 작업 서비스 인스턴스
 task_service = TaskService()
+
+# API 라우트용 비동기 래퍼 (DB만 사용하는 메서드)
+async_task_service = AsyncServiceProxy(task_service, methods=(
+    "get_tasks", "get_task_by_id", "get_task_by_jira_key", "create_task", "update_task", "delete_task",
+    "update_qa_status", "update_memo", "reset_all_tasks", "get_dashboard_stats"
+))
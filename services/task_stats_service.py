@@ -0,0 +1,183 @@
+"""
+작업 통계 집계(task_stats) 서비스
+
+대시보드가 tasks 전체를 스캔하지 않도록 (프로젝트, 상태, QA 상태, 우선순위, 담당자) 버킷별 작업 수를 유지한다.
+작업을 변경하는 쪽에서 같은 세션에 증감분을 반영하고 함께 커밋한다.
+"""
+import logging
+from collections import Counter
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from core.async_service import AsyncServiceProxy
+from core.database import BULK_UPSERT_INSERTS
+from models.database_models import Task, TaskStat
+
+logger = logging.getLogger(__name__)
+
+# 버킷 키: (project_id, status, qa_status, priority, assignee)
+StatBucket = Tuple[int, str, str, str, str]
+
+# 새 작업의 QA 상태 기본값 (Task.qa_status 컬럼 기본값과 동일)
+DEFAULT_QA_STATUS = "미시작"
+
+
+class TaskStatsService:
+    """작업 통계 집계 서비스 클래스"""
+    
+    @staticmethod
+    def bucket_of(task: Any) -> StatBucket:
+        """Task(또는 같은 속성을 가진 객체/dict)의 통계 버킷"""
+        get = task.get if isinstance(task, dict) else lambda field: getattr(task, field, None)
+        return (
+            get("project_id"),
+            get("status") or "",
+            get("qa_status") or "",
+            get("priority") or "",
+            get("assignee") or ""
+        )
+    
+    @staticmethod
+    def apply(db: Session, deltas: Counter) -> None:
+        """버킷별 증감분 반영 (커밋은 호출 측에서 작업 변경과 함께 수행)"""
+        rows = [
+            {
+                "project_id": bucket[0],
+                "status": bucket[1],
+                "qa_status": bucket[2],
+                "priority": bucket[3],
+                "assignee": bucket[4],
+                "task_count": delta
+            }
+            for bucket, delta in deltas.items() if delta
+        ]
+        if not rows:
+            return
+        
+        dialect = db.get_bind().dialect.name
+        if dialect in BULK_UPSERT_INSERTS:
+            stats = TaskStat.__table__
+            stmt = BULK_UPSERT_INSERTS[dialect](stats)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[stats.c.project_id, stats.c.status, stats.c.qa_status, stats.c.priority, stats.c.assignee],
+                set_={"task_count": stats.c.task_count + stmt.excluded.task_count}
+            )
+            db.execute(stmt, rows)
+        else:
+            for row in rows:
+                stat = db.query(TaskStat).filter_by(
+                    project_id=row["project_id"], status=row["status"], qa_status=row["qa_status"],
+                    priority=row["priority"], assignee=row["assignee"]
+                ).first()
+                if stat:
+                    stat.task_count += row["task_count"]
+                else:
+                    db.add(TaskStat(**row))
+            db.flush()
+        
+        # 비어 있는 버킷 정리
+        db.query(TaskStat).filter(TaskStat.task_count <= 0).delete(synchronize_session=False)
+    
+    @staticmethod
+    def record_change(db: Session, old_bucket: Optional[StatBucket], new_bucket: Optional[StatBucket]) -> None:
+        """작업 1건의 생성(old 없음)/삭제(new 없음)/변경 반영"""
+        if old_bucket == new_bucket:
+            return
+        
+        deltas = Counter()
+        if old_bucket:
+            deltas[old_bucket] -= 1
+        if new_bucket:
+            deltas[new_bucket] += 1
+        TaskStatsService.apply(db, deltas)
+    
+    @staticmethod
+    def remove_tasks(db: Session, task_filter: Iterable) -> None:
+        """조건에 맞는 (삭제 표시되지 않은) 작업들을 통계에서 제외 - 일괄 삭제/삭제 표시 직전에 호출"""
+        grouped = db.query(
+            Task.project_id, Task.status, Task.qa_status, Task.priority, Task.assignee, func.count(Task.id)
+        ).filter(Task.deleted_at.is_(None), *task_filter).group_by(
+            Task.project_id, Task.status, Task.qa_status, Task.priority, Task.assignee
+        ).all()
+        
+        deltas = Counter()
+        for project_id, status, qa_status, priority, assignee, count in grouped:
+            deltas[(project_id, status or "", qa_status or "", priority or "", assignee or "")] -= count
+        TaskStatsService.apply(db, deltas)
+    
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """tasks 테이블에서 통계 전체 재계산 - 버킷 수 반환"""
+        db.query(TaskStat).delete(synchronize_session=False)
+        
+        grouped = db.query(
+            Task.project_id,
+            func.coalesce(Task.status, ""),
+            func.coalesce(Task.qa_status, ""),
+            func.coalesce(Task.priority, ""),
+            func.coalesce(Task.assignee, ""),
+            func.count(Task.id)
+        ).filter(Task.deleted_at.is_(None)).group_by(
+            Task.project_id,
+            func.coalesce(Task.status, ""),
+            func.coalesce(Task.qa_status, ""),
+            func.coalesce(Task.priority, ""),
+            func.coalesce(Task.assignee, "")
+        ).all()
+        
+        db.add_all([
+            TaskStat(
+                project_id=project_id, status=status, qa_status=qa_status,
+                priority=priority, assignee=assignee, task_count=count
+            )
+            for project_id, status, qa_status, priority, assignee, count in grouped
+        ])
+        db.commit()
+        
+        logger.info(f"작업 통계 재계산 완료: {len(grouped)}개 버킷")
+        return len(grouped)
+    
+    @staticmethod
+    def ensure_initialized(db: Session) -> None:
+        """통계 테이블이 비어 있는데 작업이 있으면 재계산 (기존 데이터베이스 최초 기동 시)"""
+        if db.query(TaskStat.id).first() is None and db.query(Task.id).filter(Task.deleted_at.is_(None)).first():
+            TaskStatsService.rebuild(db)
+    
+    @staticmethod
+    def get_summary(db: Session) -> Dict[str, Any]:
+        """버킷 단위 집계 - 상태/QA 상태/우선순위별 건수, 담당자/프로젝트별 건수"""
+        status_counts = Counter()
+        qa_status_counts = Counter()
+        priority_counts = Counter()
+        assignee_counts = Counter()
+        project_counts = Counter()
+        total = 0
+        
+        for stat in db.query(
+            TaskStat.project_id, TaskStat.status, TaskStat.qa_status,
+            TaskStat.priority, TaskStat.assignee, TaskStat.task_count
+        ):
+            total += stat.task_count
+            status_counts[stat.status] += stat.task_count
+            qa_status_counts[stat.qa_status] += stat.task_count
+            priority_counts[stat.priority] += stat.task_count
+            assignee_counts[stat.assignee] += stat.task_count
+            project_counts[stat.project_id] += stat.task_count
+        
+        return {
+            "total": total,
+            "status": status_counts,
+            "qa_status": qa_status_counts,
+            "priority": priority_counts,
+            "assignee": assignee_counts,
+            "project": project_counts
+        }
+
+
+# 전역 인스턴스
+task_stats_service = TaskStatsService()
+
+# API 라우트용 비동기 래퍼
+async_task_stats_service = AsyncServiceProxy(task_stats_service, methods=("rebuild", "get_summary"))
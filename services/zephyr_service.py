@@ -3,22 +3,29 @@ Zephyr API 서비스
 remember-qa.atlassian.net과의 연동을 담당
 """
 
+import hashlib
 import logging
 import json
+import threading
 import time
-from datetime import datetime
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, case, func, insert, update
 import requests
 from requests.auth import HTTPBasicAuth
 import base64
 from cryptography.fernet import Fernet
 import os
 
+from config.settings import settings
+from core.async_service import AsyncServiceProxy
+from core.database import BULK_UPSERT_INSERTS
+from core.pipeline import chunked
+from core.progress import ProgressReporter
 from models.database_models import (
     ZephyrConnection, ZephyrProject, ZephyrTestCase, 
-    ZephyrTestExecution, ZephyrSyncHistory, ZephyrTestCycle
+    ZephyrTestExecution, ZephyrSyncHistory, ZephyrTestCycle, ZephyrCycleExecution
 )
 from models.pydantic_models import (
     ZephyrConnectionCreate, ZephyrConnectionUpdate, ZephyrConnectionResponse,
@@ -69,6 +76,10 @@ class ZephyrService:
         self.api_version = "3"  # Jira API v3 사용
         self.timeout = 30
         
+        # 프로젝트 키 → (API 프로젝트 ID, 만료 시각) 메모리 캐시
+        self._project_id_cache: Dict[str, Tuple[str, float]] = {}
+        self._project_id_lock = threading.Lock()
+        
     def encrypt_token(self, token: str) -> str:
         """API 토큰 암호화"""
         try:
@@ -118,6 +129,7 @@ class ZephyrService:
             )
             
             db.add(db_connection)
+            self._clear_project_ids(db)
             db.commit()
             db.refresh(db_connection)
             
@@ -150,6 +162,10 @@ class ZephyrService:
             for field, value in update_data.items():
                 setattr(db_connection, field, value)
             
+            # 서버/계정/토큰이 바뀌면 조회 결과가 달라질 수 있으므로 저장된 프로젝트 ID 폐기
+            if update_data.keys() & {"server_url", "username", "api_token"}:
+                self._clear_project_ids(db)
+            
             db.commit()
             db.refresh(db_connection)
             
@@ -377,7 +393,7 @@ class ZephyrService:
             
             # 실행 결과 가져오기
             if sync_request.sync_type in ["executions", "both"]:
-                self._import_executions(db, connection, project, sync_history, auth)
+                self._import_executions(db, connection, project, sync_history, full_sync=sync_request.force_sync)
             
             # 동기화 완료
             sync_history.sync_status = "completed"
@@ -402,81 +418,468 @@ class ZephyrService:
             raise
     
     def _import_test_cases(self, db: Session, connection: ZephyrConnection, project: ZephyrProject, sync_history: ZephyrSyncHistory, auth):
-        """테스트 케이스 가져오기"""
+        """테스트 케이스 가져오기 - 페이지 단위로 조회해 배치로 일괄 생성/수정"""
         try:
-            # Jira 이슈 조회 (테스트 케이스로 사용)
-            url = f"{connection.server_url}/rest/api/{self.api_version}/search"
+            # 기존 테스트 케이스를 한 번에 조회 (zephyr_test_id → id, test_case_key → (id, zephyr_test_id))
+            existing_rows = db.query(
+                ZephyrTestCase.zephyr_test_id, ZephyrTestCase.id, ZephyrTestCase.test_case_key
+            ).filter(ZephyrTestCase.zephyr_project_id == project.id).all()
+            existing_ids = {test_id: case_id for test_id, case_id, _ in existing_rows}
+            existing_keys = {key: (case_id, test_id) for test_id, case_id, key in existing_rows if key}
+            
+            # 진행 상황은 시간/퍼센트 단위로만 커밋해 sync-status 조회에 반영
+            progress = ProgressReporter(
+                lambda done, total: self._report_import_progress(db, sync_history, "테스트 케이스", done, total)
+            )
+            
+            total_counted = False
+            for issues, total in self._iter_test_case_pages(connection, project, auth):
+                if not total_counted:
+                    sync_history.total_items += total
+                    total_counted = True
+                
+                for batch in chunked(issues, settings.SYNC_BATCH_SIZE):
+                    success, failed = self._upsert_test_case_batch(db, project, batch, existing_ids, existing_keys)
+                    
+                    # 배치당 한 번만 이력 카운터 갱신
+                    sync_history.processed_items += success
+                    sync_history.success_items += success
+                    sync_history.failed_items += failed
+                    progress(sync_history.processed_items + sync_history.failed_items, sync_history.total_items)
+            
+            # 테스트 케이스 수 업데이트
+            project.test_case_count = len(existing_ids)
+            
+            db.commit()
+            
+        except Exception as e:
+            logger.error(f"테스트 케이스 가져오기 실패: {str(e)}")
+            raise
+    
+    def _iter_test_case_pages(self, connection: ZephyrConnection, project: ZephyrProject, auth):
+        """테스트 이슈를 startAt 페이지 단위로 조회 - (issues, total) 반환"""
+        url = f"{connection.server_url}/rest/api/{self.api_version}/search"
+        page_size = max(1, min(connection.max_results or 100, 100))  # Jira 검색 API 페이지 최대 크기
+        start_at = 0
+        
+        while True:
             params = {
-                "jql": f"project = {project.project_key} AND issuetype = Test",
-                "maxResults": min(connection.max_results, 10000),  # 최대 10000개로 제한
+                "jql": f"project = {project.project_key} AND issuetype = Test ORDER BY key ASC",
+                "startAt": start_at,
+                "maxResults": page_size,
                 "fields": "summary,description,status,priority,assignee,created,updated"
             }
-            
             response = requests.get(url, auth=auth, params=params, timeout=self.timeout, verify=False)
             
             if response.status_code != 200:
-                raise Exception(f"테스트 케이스 조회 실패: HTTP {response.status_code}")
+                raise Exception(f"테스트 케이스 조회 실패: HTTP {response.status_code} (startAt={start_at})")
             
             data = response.json()
             issues = data.get("issues", [])
+            total = data.get("total", start_at + len(issues))
+            if not issues:
+                return
             
-            sync_history.total_items += len(issues)
-            
-            for issue in issues:
-                try:
-                    # 기존 테스트 케이스 확인
-                    existing_tc = db.query(ZephyrTestCase).filter(
-                        and_(
-                            ZephyrTestCase.zephyr_project_id == project.id,
-                            ZephyrTestCase.zephyr_test_id == issue["id"]
-                        )
-                    ).first()
-                    
-                    if existing_tc:
-                        # 기존 테스트 케이스 업데이트
-                        existing_tc.title = issue["fields"]["summary"]
-                        existing_tc.description = self._extract_description(issue["fields"].get("description"))
-                        existing_tc.status = issue["fields"]["status"]["name"]
-                        existing_tc.priority = issue["fields"]["priority"]["name"] if issue["fields"].get("priority") else "Medium"
-                        existing_tc.last_sync = datetime.now()
-                    else:
-                        # 새 테스트 케이스 생성
-                        test_case = ZephyrTestCase(
-                            zephyr_test_id=issue["id"],
-                            zephyr_project_id=project.id,
-                            test_case_key=issue["key"],
-                            title=issue["fields"]["summary"],
-                            description=self._extract_description(issue["fields"].get("description")),
-                            status=issue["fields"]["status"]["name"],
-                            priority=issue["fields"]["priority"]["name"] if issue["fields"].get("priority") else "Medium",
-                            created_by=issue["fields"]["assignee"]["displayName"] if issue["fields"].get("assignee") else None,
-                            last_sync=datetime.now()
-                        )
-                        db.add(test_case)
-                    
-                    sync_history.processed_items += 1
-                    sync_history.success_items += 1
+            yield issues, total
+            
+            start_at += len(issues)
+            if start_at >= total:
+                return
+    
+    def _upsert_test_case_batch(self, db: Session, project: ZephyrProject, issues: List[Dict[str, Any]], existing_ids: Dict[str, int], existing_keys: Dict[str, Tuple[int, str]]):
+        """테스트 케이스 배치 일괄 생성/수정 - (성공 수, 실패 수) 반환, existing_ids에 새 ID 반영
+        
+        실행 결과 가져오기에서 키만으로 만든 테스트 케이스는 키로 찾아 같은 행을 갱신하고 zephyr_test_id를 이슈 ID로 바꾼다.
+        """
+        now = datetime.now()
+        new_rows = {}
+        update_rows = {}
+        adopted_rows = {}
+        failed = 0
+        
+        for issue in issues:
+            try:
+                fields = issue["fields"]
+                row = {
+                    "title": fields["summary"],
+                    "description": self._extract_description(fields.get("description")),
+                    "status": fields["status"]["name"],
+                    "priority": fields["priority"]["name"] if fields.get("priority") else "Medium",
+                    "last_sync": now
+                }
+                test_id = issue["id"]
+                if test_id in existing_ids:
+                    update_rows[test_id] = dict(row, id=existing_ids[test_id])
+                elif issue["key"] in existing_keys:
+                    case_id, stub_test_id = existing_keys[issue["key"]]
+                    adopted_rows[test_id] = dict(
+                        row,
+                        id=case_id,
+                        zephyr_test_id=test_id,
+                        created_by=fields["assignee"]["displayName"] if fields.get("assignee") else None
+                    )
+                    existing_ids.pop(stub_test_id, None)
+                    existing_ids[test_id] = case_id
+                    existing_keys[issue["key"]] = (case_id, test_id)
+                else:
+                    new_rows[test_id] = dict(
+                        row,
+                        zephyr_test_id=test_id,
+                        zephyr_project_id=project.id,
+                        test_case_key=issue["key"],
+                        created_by=fields["assignee"]["displayName"] if fields.get("assignee") else None
+                    )
+            except Exception as e:
+                logger.error(f"테스트 케이스 처리 실패 {issue.get('key', 'Unknown')}: {str(e)}")
+                failed += 1
+        
+        if new_rows:
+            # render_nulls: None 값 유무로 행이 나뉘지 않고 한 번의 다중 행 INSERT로 실행되도록
+            inserted = db.execute(
+                insert(ZephyrTestCase).returning(ZephyrTestCase.zephyr_test_id, ZephyrTestCase.id),
+                list(new_rows.values()),
+                execution_options={"render_nulls": True}
+            )
+            existing_ids.update(dict(inserted.all()))
+        # 갱신 컬럼이 다른 행끼리 섞이지 않도록 따로 실행
+        for rows in (update_rows, adopted_rows):
+            if rows:
+                db.execute(update(ZephyrTestCase), list(rows.values()))
+        
+        return len(new_rows) + len(update_rows) + len(adopted_rows), failed
+    
+    def _report_import_progress(self, db: Session, sync_history: ZephyrSyncHistory, item_name: str, done: int, total: int):
+        """가져오기 진행 상황 커밋 및 로그 (ProgressReporter 콜백)"""
+        db.commit()
+        logger.info(f"{item_name} 가져오기 진행: {done}/{total}")
+    
+    def _import_executions(self, db: Session, connection: ZephyrConnection, project: ZephyrProject, sync_history: ZephyrSyncHistory, full_sync: bool = False):
+        """실행 결과 가져오기 - Zephyr Scale testexecutions를 페이지 단위로 조회해 배치로 일괄 생성/수정
+        
+        프로젝트에 증분 기준 시각이 있으면 그 이후에 실행된 결과만 조회하며, full_sync=True면 전체를 조회한다.
+        실행 결과는 ZephyrTestExecution에, 사이클이 동기화되어 있으면 ZephyrCycleExecution에도 저장된다.
+        아직 동기화되지 않은 사이클의 실행 결과가 있으면 증분 기준 시각을 그 실행 시각 이후로 넘기지 않아,
+        사이클 동기화 후 다음 가져오기에서 다시 조회해 사이클 실행 결과로 저장한다.
+        """
+        try:
+            api_token = self.decrypt_token(connection.api_token) or self.default_api_token
+            if not api_token:
+                raise ValueError("API 토큰이 설정되지 않았습니다.")
+            headers = {
+                "Authorization": f"Bearer {api_token}",
+                "Accept": "application/json"
+            }
+            
+            # 증분 기준 시각은 UTC naive로 비교
+            current_cursor = project.executions_cursor
+            if current_cursor and current_cursor.tzinfo:
+                current_cursor = current_cursor.astimezone(timezone.utc).replace(tzinfo=None)
+            
+            executed_after = None
+            if current_cursor and not full_sync:
+                executed_after = current_cursor - timedelta(minutes=settings.ZEPHYR_EXECUTION_OVERLAP_MINUTES)
+                logger.info(f"프로젝트 {project.project_key} 실행 결과 증분 가져오기: {executed_after} (UTC) 이후 실행분 조회")
+            
+            # 기존 데이터를 한 번에 조회해 키 → ID 맵 구성
+            lookups = self._load_execution_lookups(db, project)
+            status_names = self._fetch_execution_status_names(project, headers)
+            
+            progress = ProgressReporter(
+                lambda done, total: self._report_import_progress(db, sync_history, "실행 결과", done, total)
+            )
+            
+            total_counted = False
+            max_executed = None
+            oldest_skipped = None
+            for executions, total in self._iter_execution_pages(connection, project, headers, executed_after):
+                if not total_counted:
+                    sync_history.total_items += total
+                    total_counted = True
+                
+                for batch in chunked(executions, settings.SYNC_BATCH_SIZE):
+                    success, failed, batch_max_executed, batch_oldest_skipped = self._upsert_execution_batch(
+                        db, project, batch, lookups, status_names
+                    )
+                    if batch_max_executed and (max_executed is None or batch_max_executed > max_executed):
+                        max_executed = batch_max_executed
+                    if batch_oldest_skipped and (oldest_skipped is None or batch_oldest_skipped < oldest_skipped):
+                        oldest_skipped = batch_oldest_skipped
                     
-                except Exception as e:
-                    logger.error(f"테스트 케이스 처리 실패 {issue.get('key', 'Unknown')}: {str(e)}")
-                    sync_history.failed_items += 1
+                    # 배치당 한 번만 이력 카운터 갱신
+                    sync_history.processed_items += success
+                    sync_history.success_items += success
+                    sync_history.failed_items += failed
+                    progress(sync_history.processed_items + sync_history.failed_items, sync_history.total_items)
+            
+            # 증분 기준 시각 갱신 - 사이클 미동기화로 건너뛴 실행 결과가 있으면 그 시각까지만 진행
+            new_cursor = max_executed
+            if oldest_skipped and new_cursor and oldest_skipped < new_cursor:
+                logger.info(
+                    f"프로젝트 {project.project_key}: 동기화되지 않은 사이클의 실행 결과가 있어 "
+                    f"증분 기준 시각을 {oldest_skipped} (UTC)까지만 진행"
+                )
+                new_cursor = oldest_skipped
+            if new_cursor and (not current_cursor or new_cursor > current_cursor):
+                project.executions_cursor = new_cursor
             
-            # 테스트 케이스 수 업데이트
-            project.test_case_count = db.query(ZephyrTestCase).filter(
-                ZephyrTestCase.zephyr_project_id == project.id
-            ).count()
+            # 저장된 실행 결과로 사이클 통계 일괄 갱신
+            self.refresh_cycle_statistics(db, project.id)
             
             db.commit()
             
         except Exception as e:
-            logger.error(f"테스트 케이스 가져오기 실패: {str(e)}")
+            logger.error(f"실행 결과 가져오기 실패: {str(e)}")
             raise
     
-    def _import_executions(self, db: Session, connection: ZephyrConnection, project: ZephyrProject, sync_history: ZephyrSyncHistory, auth):
-        """실행 결과 가져오기 (임시 구현)"""
-        # 실제 Zephyr API에서는 별도의 실행 결과 API를 사용해야 함
-        # 여기서는 간단한 예시로 구현
-        logger.info(f"프로젝트 {project.project_key}의 실행 결과 가져오기 (구현 예정)")
+    def _load_execution_lookups(self, db: Session, project: ZephyrProject) -> Dict[str, Dict[str, int]]:
+        """실행 결과 저장에 필요한 프로젝트의 기존 키 → ID 맵"""
+        test_case_rows = db.query(
+            ZephyrTestCase.id, ZephyrTestCase.zephyr_test_id, ZephyrTestCase.test_case_key
+        ).filter(ZephyrTestCase.zephyr_project_id == project.id).all()
+        
+        return {
+            "test_case_keys": {key: case_id for case_id, _, key in test_case_rows if key},
+            "test_case_ids": {test_id: case_id for case_id, test_id, _ in test_case_rows},
+            "cycles": dict(
+                db.query(ZephyrTestCycle.zephyr_cycle_id, ZephyrTestCycle.id).filter(
+                    ZephyrTestCycle.zephyr_project_id == project.id
+                )
+            ),
+            "executions": dict(
+                db.query(ZephyrTestExecution.zephyr_execution_id, ZephyrTestExecution.id).join(
+                    ZephyrTestCase, ZephyrTestExecution.test_case_id == ZephyrTestCase.id
+                ).filter(ZephyrTestCase.zephyr_project_id == project.id)
+            ),
+            "cycle_executions": dict(
+                db.query(ZephyrCycleExecution.zephyr_execution_id, ZephyrCycleExecution.id).join(
+                    ZephyrTestCycle, ZephyrCycleExecution.test_cycle_id == ZephyrTestCycle.id
+                ).filter(ZephyrTestCycle.zephyr_project_id == project.id)
+            )
+        }
+    
+    def _fetch_execution_status_names(self, project: ZephyrProject, headers: Dict[str, str]) -> Dict[str, str]:
+        """실행 상태 ID → 이름 (testexecutions 응답에는 상태 ID만 포함됨)"""
+        try:
+            url = "https://api.zephyrscale.smartbear.com/v2/statuses"
+            params = {
+                "projectKey": project.project_key,
+                "statusType": "TEST_EXECUTION",
+                "maxResults": 1000
+            }
+            response = requests.get(url, headers=headers, params=params, timeout=self.timeout, verify=False)
+            
+            if response.status_code != 200:
+                logger.warning(f"실행 상태 목록 조회 실패: HTTP {response.status_code}")
+                return {}
+            
+            return {
+                str(status["id"]): status.get("name", "")
+                for status in response.json().get("values", [])
+                if status.get("id") is not None
+            }
+            
+        except Exception as e:
+            logger.warning(f"실행 상태 목록 조회 실패: {str(e)}")
+            return {}
+    
+    def _iter_execution_pages(self, connection: ZephyrConnection, project: ZephyrProject, headers: Dict[str, str], executed_after: Optional[datetime] = None):
+        """Zephyr Scale 실행 결과를 startAt 페이지 단위로 조회 - (executions, total) 반환"""
+        url = "https://api.zephyrscale.smartbear.com/v2/testexecutions"
+        page_size = max(1, min(connection.max_results or 100, 1000))  # Zephyr Scale 페이지 최대 크기
+        start_at = 0
+        
+        while True:
+            params = {
+                "projectKey": project.project_key,
+                "startAt": start_at,
+                "maxResults": page_size
+            }
+            if executed_after:
+                params["actualEndDateAfter"] = executed_after.strftime("%Y-%m-%dT%H:%M:%SZ")
+            
+            response = requests.get(url, headers=headers, params=params, timeout=self.timeout, verify=False)
+            
+            if response.status_code != 200:
+                raise Exception(f"실행 결과 조회 실패: HTTP {response.status_code} (startAt={start_at})")
+            
+            data = response.json()
+            executions = data.get("values", [])
+            total = data.get("total", start_at + len(executions))
+            if not executions:
+                return
+            
+            yield executions, total
+            
+            start_at += len(executions)
+            if data.get("isLast") or start_at >= total:
+                return
+    
+    def _upsert_execution_batch(self, db: Session, project: ZephyrProject, executions: List[Dict[str, Any]], lookups: Dict[str, Dict[str, int]], status_names: Dict[str, str]):
+        """실행 결과 배치 일괄 생성/수정 - lookups에 새 ID 반영
+        
+        (성공 수, 실패 수, 최대 실행 시각, 사이클이 동기화되지 않아 사이클 실행 결과를 건너뛴 가장 이른 실행 시각) 반환
+        """
+        now = datetime.now()
+        rows = {}
+        missing_cases = {}
+        max_executed = None
+        oldest_skipped = None
+        failed = 0
+        
+        for execution in executions:
+            try:
+                execution_id = str(execution["id"])
+                test_case_id, test_case_key = self._execution_test_case_ref(execution)
+                if not test_case_id and not test_case_key:
+                    raise ValueError("테스트 케이스 정보가 없습니다.")
+                
+                executed_at = self._parse_date(execution.get("actualEndDate"))
+                if executed_at and executed_at.tzinfo:
+                    executed_at = executed_at.astimezone(timezone.utc).replace(tzinfo=None)
+                if executed_at and (max_executed is None or executed_at > max_executed):
+                    max_executed = executed_at
+                
+                execution_time = execution.get("executionTime")
+                issues = (execution.get("links") or {}).get("issues") or []
+                rows[execution_id] = {
+                    "test_case_ref": (test_case_id, test_case_key),
+                    "test_cycle_id": str((execution.get("testCycle") or {}).get("id") or ""),
+                    "execution_status": self._execution_status_name(execution, status_names)[:20],
+                    "executed_by": (execution.get("executedById") or "")[:100] or None,
+                    "executed_at": executed_at,
+                    "execution_time": int(execution_time / 1000) if execution_time else None,  # ms → 초
+                    "comments": execution.get("comment"),
+                    "defects": json.dumps(issues, ensure_ascii=False) if issues else None,
+                    "last_sync": now
+                }
+                
+                # 아직 가져오지 않은 테스트 케이스는 키만으로 생성해 실행 결과를 연결
+                if not self._resolve_test_case(lookups, test_case_id, test_case_key):
+                    missing_cases[test_case_key or test_case_id] = {
+                        "zephyr_test_id": test_case_id or test_case_key,
+                        "zephyr_project_id": project.id,
+                        "test_case_key": test_case_key,
+                        "title": test_case_key or test_case_id,
+                        "last_sync": now
+                    }
+            except Exception as e:
+                logger.error(f"실행 결과 처리 실패 {execution.get('key', execution.get('id', 'Unknown'))}: {str(e)}")
+                failed += 1
+        
+        if missing_cases:
+            inserted = db.execute(
+                insert(ZephyrTestCase).returning(
+                    ZephyrTestCase.id, ZephyrTestCase.zephyr_test_id, ZephyrTestCase.test_case_key
+                ),
+                list(missing_cases.values()),
+                execution_options={"render_nulls": True}
+            )
+            for case_id, test_id, key in inserted.all():
+                lookups["test_case_ids"][test_id] = case_id
+                if key:
+                    lookups["test_case_keys"][key] = case_id
+        
+        execution_rows, cycle_execution_rows = [], []
+        for execution_id, row in rows.items():
+            zephyr_cycle_id = row.pop("test_cycle_id")
+            test_cycle_id = lookups["cycles"].get(zephyr_cycle_id)
+            row["test_case_id"] = self._resolve_test_case(lookups, *row.pop("test_case_ref"))
+            row["zephyr_execution_id"] = execution_id
+            execution_rows.append(row)
+            
+            # 사이클이 아직 동기화되지 않았으면 사이클 실행 결과는 건너뛰고, 증분 기준 시각을 이 실행 시각에서 멈춰
+            # 사이클 동기화 후 다음 가져오기에서 다시 저장
+            if zephyr_cycle_id and not test_cycle_id:
+                executed_at = row["executed_at"]
+                if executed_at and (oldest_skipped is None or executed_at < oldest_skipped):
+                    oldest_skipped = executed_at
+            if test_cycle_id:
+                cycle_execution_rows.append(dict(row, test_cycle_id=test_cycle_id))
+        
+        dialect = db.get_bind().dialect.name
+        for model, model_rows, conflict_columns, id_map in (
+            (ZephyrTestExecution, execution_rows, ["zephyr_execution_id"], lookups["executions"]),
+            (ZephyrCycleExecution, cycle_execution_rows, ["test_cycle_id", "zephyr_execution_id"], lookups["cycle_executions"])
+        ):
+            if not model_rows:
+                continue
+            if dialect in BULK_UPSERT_INSERTS:
+                # 동시에 실행된 다른 가져오기가 먼저 넣은 행도 유니크 인덱스 충돌로 갱신되어 중복 생성되지 않음
+                id_map.update(self._bulk_upsert_executions(db, model, model_rows, conflict_columns))
+                continue
+            
+            new_rows = [row for row in model_rows if row["zephyr_execution_id"] not in id_map]
+            update_rows = [
+                dict(row, id=id_map[row["zephyr_execution_id"]])
+                for row in model_rows if row["zephyr_execution_id"] in id_map
+            ]
+            if new_rows:
+                # render_nulls: None 값 유무로 행이 나뉘지 않고 한 번의 다중 행 INSERT로 실행되도록
+                inserted = db.execute(
+                    insert(model).returning(model.zephyr_execution_id, model.id),
+                    new_rows,
+                    execution_options={"render_nulls": True}
+                )
+                id_map.update(dict(inserted.all()))
+            if update_rows:
+                db.execute(update(model), update_rows)
+        
+        return len(rows), failed, max_executed, oldest_skipped
+    
+    @staticmethod
+    def _bulk_upsert_executions(db: Session, model, rows: List[Dict[str, Any]], conflict_columns: List[str]) -> Dict[str, int]:
+        """유니크 키 기준 INSERT ... ON CONFLICT DO UPDATE 일괄 실행 - zephyr_execution_id → id 반환"""
+        table = model.__table__
+        stmt = BULK_UPSERT_INSERTS[db.get_bind().dialect.name](table)
+        set_ = {column: stmt.excluded[column] for column in rows[0] if column not in conflict_columns}
+        set_["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c[column] for column in conflict_columns],
+            set_=set_
+        )
+        return dict(db.execute(stmt.returning(table.c.zephyr_execution_id, table.c.id), rows).all())
+    
+    @staticmethod
+    def _execution_test_case_ref(execution: Dict[str, Any]):
+        """실행 결과의 테스트 케이스 (ID, 키) - 키가 없으면 self URL(.../testcases/{key}/versions/{n})에서 추출"""
+        test_case = execution.get("testCase") or {}
+        test_case_id = str(test_case["id"]) if test_case.get("id") is not None else None
+        test_case_key = test_case.get("key")
+        
+        if not test_case_key and "/testcases/" in (test_case.get("self") or ""):
+            test_case_key = test_case["self"].split("/testcases/", 1)[1].split("/", 1)[0] or None
+        
+        return test_case_id, test_case_key
+    
+    @staticmethod
+    def _resolve_test_case(lookups: Dict[str, Dict[str, int]], test_case_id: Optional[str], test_case_key: Optional[str]) -> Optional[int]:
+        """테스트 케이스 키(없으면 Zephyr ID)로 로컬 테스트 케이스 ID 조회
+        
+        Jira 이슈로 가져온 테스트 케이스의 zephyr_test_id는 이슈 ID이므로 키가 있으면 키로만 찾는다.
+        """
+        if test_case_key:
+            return lookups["test_case_keys"].get(test_case_key)
+        return lookups["test_case_ids"].get(test_case_id)
+    
+    def _execution_status_name(self, execution: Dict[str, Any], status_names: Dict[str, str]) -> str:
+        """실행 상태를 대시보드 집계 기준 이름(Pass, Fail, Blocked, Not Executed, In Progress)으로 변환"""
+        status = execution.get("testExecutionStatus") or {}
+        if isinstance(status, dict):
+            name = status.get("name") or status_names.get(str(status.get("id")), "")
+        else:
+            name = str(status)
+        
+        status_mapping = {
+            "pass": "Pass",
+            "passed": "Pass",
+            "fail": "Fail",
+            "failed": "Fail",
+            "blocked": "Blocked",
+            "in progress": "In Progress",
+            "not executed": "Not Executed",
+            "unexecuted": "Not Executed"
+        }
+        return status_mapping.get(name.strip().lower(), name.strip() or "Not Executed")
     
     def _export_to_zephyr(self, db: Session, project: ZephyrProject, sync_history: ZephyrSyncHistory, sync_request: ZephyrSyncRequest):
         """Zephyr로 데이터 내보내기 (임시 구현)"""
@@ -557,9 +960,8 @@ class ZephyrService:
                 zephyr_project.sync_status = "syncing"
                 db.flush()
             
-            # Zephyr Scale API에서 프로젝트 ID 조회
-            logger.info(f"Zephyr Scale API에서 프로젝트 ID 조회: {project_key}")
-            zephyr_project_id = self._get_zephyr_project_id(project_key, db)
+            # 프로젝트 ID 조회 (캐시/저장된 ID가 없을 때만 API 조회)
+            zephyr_project_id = self._resolve_zephyr_project_id(db, zephyr_project)
             
             # 프로젝트 ID를 찾지 못해도 계속 진행 (기존 데이터 사용)
             if not zephyr_project_id:
@@ -623,83 +1025,10 @@ class ZephyrService:
             
             logger.info(f"조회된 테스트 사이클 수: {len(cycles_data)}")
             
-            synced_cycles = 0
-            failed_cycles = 0
+            synced_cycles, unchanged_cycles, failed_cycles = self._upsert_test_cycles(db, zephyr_project, cycles_data)
             
-            for i, cycle_data in enumerate(cycles_data):
-                try:
-                    logger.debug(f"사이클 처리 중 ({i+1}/{len(cycles_data)}): {cycle_data.get('id', 'Unknown')}")
-                    
-                    # 필수 데이터 검증
-                    cycle_id = cycle_data.get("id")
-                    if not cycle_id:
-                        logger.warning(f"사이클 ID가 없음: {cycle_data}")
-                        failed_cycles += 1
-                        continue
-                    
-                    cycle_id_str = str(cycle_id)
-                    cycle_name = cycle_data.get("name", "이름 없음")
-                    
-                    # 기존 사이클 확인
-                    existing_cycle = db.query(ZephyrTestCycle).filter(
-                        and_(
-                            ZephyrTestCycle.zephyr_project_id == zephyr_project.id,
-                            ZephyrTestCycle.zephyr_cycle_id == cycle_id_str
-                        )
-                    ).first()
-                    
-                    if existing_cycle:
-                        logger.debug(f"기존 사이클 업데이트: {cycle_name}")
-                        # 기존 사이클 업데이트
-                        existing_cycle.cycle_name = cycle_name[:255]  # 길이 제한
-                        existing_cycle.description = (cycle_data.get("description", "") or "")[:1000]  # 길이 제한
-                        existing_cycle.status = (cycle_data.get("statusName", "Not Started") or "Not Started")[:20]
-                        existing_cycle.version = self._safe_get_name(cycle_data.get("version"))[:50]
-                        existing_cycle.environment = self._safe_get_name(cycle_data.get("environment"))[:50]
-                        existing_cycle.build = (cycle_data.get("build", "") or "")[:100]
-                        existing_cycle.start_date = self._parse_date(cycle_data.get("plannedStartDate"))
-                        existing_cycle.end_date = self._parse_date(cycle_data.get("plannedEndDate"))
-                        existing_cycle.created_by = self._safe_get_author(cycle_data)[:100]
-                        existing_cycle.assigned_to = self._safe_get_owner(cycle_data)[:100]
-                        existing_cycle.last_sync = datetime.now()
-                        
-                        # 테스트 실행 통계 업데이트
-                        self._update_cycle_statistics(existing_cycle, cycle_data)
-                    else:
-                        logger.debug(f"새 사이클 생성: {cycle_name}")
-                        # 새 사이클 생성
-                        new_cycle = ZephyrTestCycle(
-                            zephyr_cycle_id=cycle_id_str,
-                            zephyr_project_id=zephyr_project.id,
-                            cycle_name=cycle_name[:255],  # 길이 제한
-                            description=(cycle_data.get("description", "") or "")[:1000],  # 길이 제한
-                            status=(cycle_data.get("statusName", "Not Started") or "Not Started")[:20],
-                            version=self._safe_get_name(cycle_data.get("version"))[:50],
-                            environment=self._safe_get_name(cycle_data.get("environment"))[:50],
-                            build=(cycle_data.get("build", "") or "")[:100],
-                            start_date=self._parse_date(cycle_data.get("plannedStartDate")),
-                            end_date=self._parse_date(cycle_data.get("plannedEndDate")),
-                            created_by=self._safe_get_author(cycle_data)[:100],
-                            assigned_to=self._safe_get_owner(cycle_data)[:100],
-                            created_at=datetime.now(),
-                            last_sync=datetime.now()
-                        )
-                        
-                        # 테스트 실행 통계 설정
-                        self._update_cycle_statistics(new_cycle, cycle_data)
-                        
-                        db.add(new_cycle)
-                    
-                    synced_cycles += 1
-                    
-                    # 주기적으로 flush (메모리 관리)
-                    if synced_cycles % 10 == 0:
-                        db.flush()
-                    
-                except Exception as cycle_error:
-                    failed_cycles += 1
-                    logger.error(f"사이클 처리 실패 {cycle_data.get('id', 'Unknown')}: {str(cycle_error)}")
-                    continue
+            # 변경된 사이클의 API 통계 대신 저장된 실행 결과 기준 통계 유지
+            self.refresh_cycle_statistics(db, zephyr_project.id)
             
             # 프로젝트 동기화 상태 업데이트
             zephyr_project.is_synced = True
@@ -710,7 +1039,7 @@ class ZephyrService:
             # 최종 커밋
             db.commit()
             
-            success_msg = f"프로젝트 '{project_key}' 동기화 완료: {synced_cycles}개 사이클 성공"
+            success_msg = f"프로젝트 '{project_key}' 동기화 완료: {synced_cycles}개 사이클 성공 (변경 없음: {unchanged_cycles})"
             if failed_cycles > 0:
                 success_msg += f", {failed_cycles}개 실패"
             
@@ -720,6 +1049,7 @@ class ZephyrService:
                 "success": True,
                 "message": f"프로젝트 '{project_key}'의 테스트 사이클 {synced_cycles}개가 동기화되었습니다.",
                 "synced_cycles": synced_cycles,
+                "unchanged_cycles": unchanged_cycles,
                 "failed_cycles": failed_cycles,
                 "project_id": zephyr_project.id
             }
@@ -753,6 +1083,40 @@ class ZephyrService:
             
             raise Exception(error_msg)
     
+    def _resolve_zephyr_project_id(self, db: Session, zephyr_project: ZephyrProject) -> Optional[str]:
+        """사이클 조회용 API 프로젝트 ID - 메모리 캐시(TTL) → 프로젝트에 저장된 ID → API 조회 순
+        
+        API 조회는 느린 요청을 여러 번 시도하므로 프로젝트당 최초 1회만 하고 결과를 프로젝트에 저장한다.
+        찾지 못한 결과는 저장하지 않아 다음 동기화에서 다시 조회한다.
+        """
+        project_key = zephyr_project.project_key
+        with self._project_id_lock:
+            cached = self._project_id_cache.get(project_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
+        project_id = zephyr_project.api_project_id
+        if not project_id:
+            logger.info(f"프로젝트 '{project_key}' API 프로젝트 ID 조회")
+            project_id = self._get_zephyr_project_id(project_key, db)
+            if not project_id:
+                return None
+            project_id = str(project_id)
+            zephyr_project.api_project_id = project_id
+            logger.info(f"프로젝트 '{project_key}' API 프로젝트 ID 저장: {project_id}")
+        
+        with self._project_id_lock:
+            self._project_id_cache[project_key] = (
+                project_id, time.monotonic() + settings.ZEPHYR_PROJECT_ID_CACHE_TTL
+            )
+        return project_id
+    
+    def _clear_project_ids(self, db: Session):
+        """저장된 API 프로젝트 ID와 메모리 캐시 폐기 (연결 설정 변경 시)"""
+        db.query(ZephyrProject).update({ZephyrProject.api_project_id: None}, synchronize_session=False)
+        with self._project_id_lock:
+            self._project_id_cache.clear()
+    
     def _get_zephyr_project_id(self, project_key: str, db: Session = None) -> Optional[str]:
         """Zephyr/Jira API에서 프로젝트 ID 조회"""
         try:
@@ -1156,6 +1520,91 @@ class ZephyrService:
         }
         return status_mapping.get(str(status), "Not Started")
     
+    def _upsert_test_cycles(self, db: Session, zephyr_project: ZephyrProject, cycles_data: List[Dict[str, Any]]):
+        """테스트 사이클 일괄 생성/수정 - (동기화 수, 변경 없음 수, 실패 수) 반환
+        
+        프로젝트의 기존 사이클을 한 번에 조회하고, API 응답 해시가 같은 사이클은 건너뛴다.
+        """
+        existing = {
+            zephyr_cycle_id: (cycle_id, payload_hash)
+            for cycle_id, zephyr_cycle_id, payload_hash in db.query(
+                ZephyrTestCycle.id, ZephyrTestCycle.zephyr_cycle_id, ZephyrTestCycle.payload_hash
+            ).filter(ZephyrTestCycle.zephyr_project_id == zephyr_project.id)
+        }
+        
+        now = datetime.now()
+        new_rows = {}
+        update_rows = {}
+        unchanged_cycles = 0
+        failed_cycles = 0
+        progress = ProgressReporter(
+            lambda done, total: logger.info(f"테스트 사이클 처리 중: {done}/{total}")
+        )
+        
+        for i, cycle_data in enumerate(cycles_data):
+            progress(i + 1, len(cycles_data))
+            try:
+                # 필수 데이터 검증
+                cycle_id = cycle_data.get("id")
+                if not cycle_id:
+                    logger.warning(f"사이클 ID가 없음: {cycle_data}")
+                    failed_cycles += 1
+                    continue
+                
+                cycle_id_str = str(cycle_id)
+                payload_hash = self._payload_hash(cycle_data)
+                if cycle_id_str in existing and existing[cycle_id_str][1] == payload_hash:
+                    unchanged_cycles += 1
+                    continue
+                
+                row = self._build_cycle_row(cycle_data)
+                row.update(payload_hash=payload_hash, last_sync=now)
+                if cycle_id_str in existing:
+                    update_rows[cycle_id_str] = dict(row, id=existing[cycle_id_str][0])
+                else:
+                    new_rows[cycle_id_str] = dict(
+                        row,
+                        zephyr_cycle_id=cycle_id_str,
+                        zephyr_project_id=zephyr_project.id,
+                        created_at=now
+                    )
+                
+            except Exception as cycle_error:
+                failed_cycles += 1
+                logger.error(f"사이클 처리 실패 {cycle_data.get('id', 'Unknown')}: {str(cycle_error)}")
+                continue
+        
+        for batch in chunked(list(new_rows.values()), settings.SYNC_BATCH_SIZE):
+            db.execute(insert(ZephyrTestCycle), batch, execution_options={"render_nulls": True})
+        for batch in chunked(list(update_rows.values()), settings.SYNC_BATCH_SIZE):
+            db.execute(update(ZephyrTestCycle), batch)
+        
+        logger.info(f"테스트 사이클 저장: 신규 {len(new_rows)}개, 변경 {len(update_rows)}개, 변경 없음 {unchanged_cycles}개")
+        return len(new_rows) + len(update_rows) + unchanged_cycles, unchanged_cycles, failed_cycles
+    
+    def _build_cycle_row(self, cycle_data: Dict[str, Any]) -> Dict[str, Any]:
+        """API 사이클 데이터를 ZephyrTestCycle 컬럼 값으로 변환"""
+        row = {
+            "cycle_name": cycle_data.get("name", "이름 없음")[:255],  # 길이 제한
+            "description": (cycle_data.get("description", "") or "")[:1000],  # 길이 제한
+            "status": (cycle_data.get("statusName", "Not Started") or "Not Started")[:20],
+            "version": self._safe_get_name(cycle_data.get("version"))[:50],
+            "environment": self._safe_get_name(cycle_data.get("environment"))[:50],
+            "build": (cycle_data.get("build", "") or "")[:100],
+            "start_date": self._parse_date(cycle_data.get("plannedStartDate")),
+            "end_date": self._parse_date(cycle_data.get("plannedEndDate")),
+            "created_by": self._safe_get_author(cycle_data)[:100],
+            "assigned_to": self._safe_get_owner(cycle_data)[:100]
+        }
+        row.update(self._cycle_statistics(cycle_data))
+        return row
+    
+    @staticmethod
+    def _payload_hash(payload: Dict[str, Any]) -> str:
+        """API 응답 항목의 해시 (변경 여부 판단용)"""
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+    
     def _safe_get_name(self, field) -> str:
         """안전하게 name 필드 추출"""
         if not field:
@@ -1199,108 +1648,164 @@ class ZephyrService:
         except:
             return None
     
-    def _update_cycle_statistics(self, cycle, cycle_data: Dict[str, Any]):
-        """사이클 통계 정보 업데이트"""
+    def get_cycle_statistics(self, db: Session, zephyr_project_id: Optional[int] = None) -> Dict[int, Dict[str, int]]:
+        """저장된 사이클 실행 결과로 사이클별 통계 집계 (GROUP BY test_cycle_id, execution_status 1회)
+        
+        실행 결과가 있는 사이클만 포함되며, Pass/Fail/Blocked 외의 상태는 미실행으로 센다.
+        """
+        status_columns = {
+            "Pass": "passed_test_cases",
+            "Fail": "failed_test_cases",
+            "Blocked": "blocked_test_cases"
+        }
+        
+        query = db.query(
+            ZephyrCycleExecution.test_cycle_id,
+            ZephyrCycleExecution.execution_status,
+            func.count(ZephyrCycleExecution.id)
+        )
+        if zephyr_project_id is not None:
+            query = query.join(
+                ZephyrTestCycle, ZephyrCycleExecution.test_cycle_id == ZephyrTestCycle.id
+            ).filter(ZephyrTestCycle.zephyr_project_id == zephyr_project_id)
+        
+        stats = {}
+        for cycle_id, execution_status, count in query.group_by(
+            ZephyrCycleExecution.test_cycle_id, ZephyrCycleExecution.execution_status
+        ):
+            cycle_stats = stats.setdefault(cycle_id, {
+                "total_test_cases": 0,
+                "executed_test_cases": 0,
+                "passed_test_cases": 0,
+                "failed_test_cases": 0,
+                "blocked_test_cases": 0,
+                "not_executed_test_cases": 0
+            })
+            cycle_stats["total_test_cases"] += count
+            column = status_columns.get(execution_status)
+            if column:
+                cycle_stats[column] += count
+                cycle_stats["executed_test_cases"] += count
+            else:
+                cycle_stats["not_executed_test_cases"] += count
+        
+        return stats
+    
+    def refresh_cycle_statistics(self, db: Session, zephyr_project_id: Optional[int] = None) -> int:
+        """저장된 실행 결과 기준으로 ZephyrTestCycle 통계 컬럼 일괄 갱신 - 갱신한 사이클 수 반환
+        
+        실행 결과가 없는 사이클은 API 응답에서 가져온 통계를 유지한다.
+        """
+        rows = [
+            {
+                "id": cycle_id,
+                "total_test_cases": cycle_stats["total_test_cases"],
+                "executed_test_cases": cycle_stats["executed_test_cases"],
+                "passed_test_cases": cycle_stats["passed_test_cases"],
+                "failed_test_cases": cycle_stats["failed_test_cases"],
+                "blocked_test_cases": cycle_stats["blocked_test_cases"],
+                "not_executed_test_cases": cycle_stats["not_executed_test_cases"]
+            }
+            for cycle_id, cycle_stats in self.get_cycle_statistics(db, zephyr_project_id).items()
+        ]
+        
+        for batch in chunked(rows, settings.SYNC_BATCH_SIZE):
+            db.execute(update(ZephyrTestCycle), batch)
+        
+        if rows:
+            logger.info(f"사이클 통계 갱신: {len(rows)}개 사이클")
+        return len(rows)
+    
+    def _cycle_statistics(self, cycle_data: Dict[str, Any]) -> Dict[str, int]:
+        """사이클 통계 정보 추출"""
+        # 기본값 설정
+        stats = {
+            "total_test_cases": 0,
+            "executed_test_cases": 0,
+            "passed_test_cases": 0,
+            "failed_test_cases": 0,
+            "blocked_test_cases": 0,
+            "not_executed_test_cases": 0
+        }
+        
         try:
-            # 기본값 설정
-            cycle.total_test_cases = 0
-            cycle.executed_test_cases = 0
-            cycle.passed_test_cases = 0
-            cycle.failed_test_cases = 0
-            cycle.blocked_test_cases = 0
-            
             # API에서 통계 정보 추출 (실제 API 응답 구조에 따라 조정 필요)
             if cycle_data.get("testExecutions"):
                 executions = cycle_data.get("testExecutions", {})
-                cycle.total_test_cases = executions.get("total", 0)
-                cycle.passed_test_cases = executions.get("passed", 0)
-                cycle.failed_test_cases = executions.get("failed", 0)
-                cycle.blocked_test_cases = executions.get("blocked", 0)
-                cycle.executed_test_cases = (
-                    cycle.passed_test_cases + 
-                    cycle.failed_test_cases + 
-                    cycle.blocked_test_cases
+                stats["total_test_cases"] = executions.get("total", 0)
+                stats["passed_test_cases"] = executions.get("passed", 0)
+                stats["failed_test_cases"] = executions.get("failed", 0)
+                stats["blocked_test_cases"] = executions.get("blocked", 0)
+                stats["executed_test_cases"] = (
+                    stats["passed_test_cases"] + 
+                    stats["failed_test_cases"] + 
+                    stats["blocked_test_cases"]
                 )
+                stats["not_executed_test_cases"] = max(stats["total_test_cases"] - stats["executed_test_cases"], 0)
             
         except Exception as e:
-            logger.error(f"사이클 통계 업데이트 실패: {str(e)}")
+            logger.error(f"사이클 통계 추출 실패: {str(e)}")
+        
+        return stats
 
     def get_dashboard_stats(self, db: Session) -> ZephyrDashboardStats:
         """Zephyr 대시보드 통계 조회"""
         try:
-            # 프로젝트 통계
-            total_projects = db.query(ZephyrProject).count()
-            synced_projects = db.query(ZephyrProject).filter(
-                ZephyrProject.is_synced == True
-            ).count()
-            
-            # 테스트 케이스 통계
-            total_test_cases = db.query(ZephyrTestCase).count()
-            
-            # 실행 결과 통계
-            total_executions = db.query(ZephyrTestExecution).count()
-            passed_executions = db.query(ZephyrTestExecution).filter(
-                ZephyrTestExecution.execution_status == "Pass"
-            ).count()
-            failed_executions = db.query(ZephyrTestExecution).filter(
-                ZephyrTestExecution.execution_status == "Fail"
-            ).count()
-            blocked_executions = db.query(ZephyrTestExecution).filter(
-                ZephyrTestExecution.execution_status == "Blocked"
-            ).count()
+            # 프로젝트 목록 (1회 조회)
+            projects = db.query(ZephyrProject).all()
+            total_projects = len(projects)
+            synced_projects = sum(1 for project in projects if project.is_synced)
+            
+            # 프로젝트별 테스트 케이스 수 (GROUP BY 1회)
+            test_case_counts = dict(
+                db.query(ZephyrTestCase.zephyr_project_id, func.count(ZephyrTestCase.id))
+                .group_by(ZephyrTestCase.zephyr_project_id)
+                .all()
+            )
+            total_test_cases = sum(test_case_counts.values())
+            
+            # 프로젝트별 실행 결과 수/상태별 건수/마지막 실행 시간 (조건부 집계 GROUP BY 1회)
+            def status_count(status: str):
+                return func.coalesce(
+                    func.sum(case((ZephyrTestExecution.execution_status == status, 1), else_=0)), 0
+                )
+            
+            execution_rows = db.query(
+                ZephyrTestCase.zephyr_project_id,
+                func.count(ZephyrTestExecution.id),
+                status_count("Pass"),
+                status_count("Fail"),
+                status_count("Blocked"),
+                func.max(ZephyrTestExecution.executed_at)
+            ).select_from(ZephyrTestExecution).outerjoin(
+                ZephyrTestCase, ZephyrTestExecution.test_case_id == ZephyrTestCase.id
+            ).group_by(ZephyrTestCase.zephyr_project_id).all()
+            
+            execution_stats = {row[0]: row[1:] for row in execution_rows}
+            total_executions = sum(row[1] for row in execution_rows)
+            passed_executions = sum(row[2] for row in execution_rows)
+            failed_executions = sum(row[3] for row in execution_rows)
+            blocked_executions = sum(row[4] for row in execution_rows)
             
             # 통과율 계산
             pass_rate = (passed_executions / total_executions * 100) if total_executions > 0 else 0.0
             
             # 프로젝트별 통계
-            projects = db.query(ZephyrProject).all()
             project_stats = []
-            
             for project in projects:
-                project_test_cases = db.query(ZephyrTestCase).filter(
-                    ZephyrTestCase.zephyr_project_id == project.id
-                ).count()
-                
-                project_executions = db.query(ZephyrTestExecution).join(ZephyrTestCase).filter(
-                    ZephyrTestCase.zephyr_project_id == project.id
-                ).count()
-                
-                project_passed = db.query(ZephyrTestExecution).join(ZephyrTestCase).filter(
-                    and_(
-                        ZephyrTestCase.zephyr_project_id == project.id,
-                        ZephyrTestExecution.execution_status == "Pass"
-                    )
-                ).count()
-                
-                project_failed = db.query(ZephyrTestExecution).join(ZephyrTestCase).filter(
-                    and_(
-                        ZephyrTestCase.zephyr_project_id == project.id,
-                        ZephyrTestExecution.execution_status == "Fail"
-                    )
-                ).count()
-                
-                project_blocked = db.query(ZephyrTestExecution).join(ZephyrTestCase).filter(
-                    and_(
-                        ZephyrTestCase.zephyr_project_id == project.id,
-                        ZephyrTestExecution.execution_status == "Blocked"
-                    )
-                ).count()
-                
-                # 마지막 실행 시간
-                last_execution = db.query(ZephyrTestExecution).join(ZephyrTestCase).filter(
-                    ZephyrTestCase.zephyr_project_id == project.id
-                ).order_by(ZephyrTestExecution.executed_at.desc()).first()
-                
+                executions, passed, failed, blocked, last_executed_at = execution_stats.get(
+                    project.id, (0, 0, 0, 0, None)
+                )
                 project_stats.append(ZephyrProjectStats(
                     project_id=project.id,
                     project_key=project.project_key,
                     project_name=project.project_name,
-                    total_test_cases=project_test_cases,
-                    total_executions=project_executions,
-                    passed_executions=project_passed,
-                    failed_executions=project_failed,
-                    blocked_executions=project_blocked,
-                    last_execution=last_execution.executed_at if last_execution else None
+                    total_test_cases=test_case_counts.get(project.id, 0),
+                    total_executions=executions,
+                    passed_executions=passed,
+                    failed_executions=failed,
+                    blocked_executions=blocked,
+                    last_execution=last_executed_at
                 ))
             
             return ZephyrDashboardStats(
@@ -1321,3 +1826,8 @@ class ZephyrService:
 
 # 전역 서비스 인스턴스
 zephyr_service = ZephyrService()
+
+# API 라우트용 비동기 래퍼 (Zephyr API를 호출하지 않는 조회 메서드만)
+async_zephyr_service = AsyncServiceProxy(
+    zephyr_service, methods=("get_connection", "get_dashboard_stats", "get_cycle_statistics")
+)
@@ -2,6 +2,8 @@
 API 클라이언트 모듈 - 백엔드 서버와의 통신을 담당
 """
 
+import json
+
 import requests
 import streamlit as st
 
@@ -185,8 +187,8 @@ def get_jira_projects():
     """지라 프로젝트 목록 가져오기"""
     return api_call("/jira/projects")
 
-def sync_jira_project(project_key, selected_issues=None):
-    """지라 프로젝트 동기화 - 타임아웃 연장"""
+def sync_jira_project(project_key, selected_issues=None, full_sync=False):
+    """지라 프로젝트 동기화 - 타임아웃 연장 (선택 이슈가 없으면 증분, full_sync=True면 전체)"""
     try:
         url = f"{API_BASE_URL}/jira/sync/{project_key}"
         
@@ -195,8 +197,8 @@ def sync_jira_project(project_key, selected_issues=None):
             data = {"selected_issues": selected_issues}
             response = requests.post(url, json=data, timeout=60)  # 60초로 연장
         else:
-            # 전체 동기화
-            response = requests.post(url, timeout=60)  # 60초로 연장
+            # 증분 동기화 (full_sync=True면 전체 동기화)
+            response = requests.post(url, json={"full_sync": full_sync}, timeout=60)  # 60초로 연장
         
         if 200 <= response.status_code < 300:
             result = response.json()
@@ -258,6 +260,10 @@ def get_jira_project_issues(project_key, limit=None, quick=False):
         st.error(f"❌ {error_message}")
         return {"success": False, "message": error_message}
 
+def cancel_sync_job(job_id):
+    """동기화 작업 취소"""
+    return api_call(f"/jira/sync-jobs/{job_id}/cancel", method="POST")
+
 def get_sync_status(project_key):
     """동기화 상태 조회 - 타임아웃 연장"""
     try:
@@ -287,6 +293,28 @@ def get_sync_status(project_key):
         # 연결 오류 시 None 반환 (모달에서 재시도)
         return None
 
+def stream_sync_status(project_key):
+    """동기화 진행 이벤트(SSE) 구독 - 상태가 바뀔 때마다 상태 dict를 반환하는 generator
+    
+    스트림을 열 수 없거나 연결이 끊기면 조용히 종료하므로 호출 측에서 get_sync_status로 폴백한다.
+    """
+    url = f"{API_BASE_URL}/jira/sync-status/{project_key}/stream"
+    try:
+        # 서버가 15초마다 keep-alive를 보내므로 읽기 timeout은 그보다 길게 설정
+        with requests.get(url, stream=True, timeout=(10, 60)) as response:
+            if response.status_code != 200:
+                return
+            
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data:"):
+                    continue
+                try:
+                    yield json.loads(line[len("data:"):].strip())
+                except ValueError:
+                    continue
+    except requests.exceptions.RequestException:
+        return
+
 def reset_all_tasks():
     """모든 작업 데이터 초기화"""
     try:
@@ -1069,432 +1097,6 @@ def get_zephyr_cycle_executions(cycle_id, skip=0, limit=100):
         return []
 
 
-def get_cycle_test_results_summary(cycle_id):
-    """사이클의 테스트 결과 요약 정보 조회"""
-    try:
-        # 1. 먼저 테스트 실행 결과를 여러 방법으로 조회
-        executions = []
-        
-        # 방법 1: 기존 함수 사용
-        executions = get_zephyr_cycle_executions(cycle_id, limit=1000)
-        if not isinstance(executions, list):
-            executions = []
-        
-        # 방법 2: 실행 결과가 없으면 직접 API 호출로 다시 시도
-        if len(executions) == 0:
-            import os
-            from dotenv import load_dotenv
-            
-            load_dotenv()
-            zephyr_api_token = os.getenv('ZEPHYR_API_TOKEN', '')
-            
-            if zephyr_api_token:
-                try:
-                    headers = {
-                        "Authorization": f"Bearer {zephyr_api_token}",
-                        "Accept": "application/json"
-                    }
-                    
-                    # 다양한 실행 결과 조회 API 시도 (작동하는 API를 우선순위로)
-                    execution_apis = [
-                        f"https://api.zephyrscale.smartbear.com/v2/testexecutions?cycleId={cycle_id}&maxResults=1000",  # 이 API가 올바른 결과 반환
-                        f"https://api.zephyrscale.smartbear.com/v2/testexecutions?testCycle={cycle_id}&maxResults=1000",
-                        f"https://api.zephyrscale.smartbear.com/v2/testcycles/{cycle_id}/testexecutions?maxResults=1000",
-                        f"https://api.zephyrscale.smartbear.com/v2/testexecutions?cycle={cycle_id}&maxResults=1000"
-                    ]
-                    
-                    for i, api_url in enumerate(execution_apis):
-                        try:
-                            response = requests.get(api_url, headers=headers, timeout=30, verify=False)
-                            
-                            if response.status_code == 200:
-                                data = response.json()
-                                
-                                if isinstance(data, dict):
-                                    if "values" in data:
-                                        potential_executions = data.get("values", [])
-                                        if len(potential_executions) > 0:
-                                            executions = potential_executions
-                                            break
-                                elif isinstance(data, list):
-                                    if len(data) > 0:
-                                        executions = data
-                                        break
-                        except Exception:
-                            continue
-                            
-                except Exception:
-                    pass
-        
-        # 3. 실행 결과가 있는 경우 통계 계산
-        if len(executions) > 0:
-            # 통계 계산
-            total_tests = len(executions)
-            passed_tests = 0
-            failed_tests = 0
-            blocked_tests = 0
-            not_executed_tests = 0
-            
-            test_results = []
-            
-            for i, execution in enumerate(executions):
-                try:
-                    # 첫 번째 실행 결과의 전체 구조를 디버깅으로 출력
-                    if i == 0:
-                        st.info(f"🔍 [디버깅] 첫 번째 실행 결과 전체 구조:")
-                        st.json(execution)
-                    
-                    # 실행 상태 추출 (다양한 필드명 지원)
-                    status_name = "Not Executed"
-                    found_status_field = None
-                    
-                    # 여러 가능한 상태 필드 확인
-                    status_fields = [
-                        "testExecutionStatus",
-                        "executionStatus", 
-                        "status",
-                        "result",
-                        "testResult",
-                        "statusName",
-                        "resultStatus"
-                    ]
-                    
-                    for field in status_fields:
-                        if execution.get(field):
-                            status_obj = execution.get(field)
-                            if isinstance(status_obj, dict):
-                                if status_obj.get("name"):
-                                    status_name = status_obj.get("name")
-                                    found_status_field = f"{field}.name"
-                                    break
-                                elif status_obj.get("status"):
-                                    status_name = status_obj.get("status")
-                                    found_status_field = f"{field}.status"
-                                    break
-                            elif isinstance(status_obj, str):
-                                status_name = status_obj
-                                found_status_field = field
-                                break
-                    
-                    # 첫 번째 실행 결과의 상태 정보 디버깅
-                    if i == 0:
-                        st.info(f"🔍 [디버깅] 상태 추출 결과: '{status_name}' (필드: {found_status_field})")
-                        
-                        # 모든 가능한 상태 필드 값 출력
-                        for field in status_fields:
-                            if execution.get(field):
-                                st.info(f"🔍 [디버깅] {field}: {execution.get(field)}")
-                    
-                    # 상태별 카운트 (대소문자 무시하고 다양한 표현 지원)
-                    status_lower = status_name.lower()
-                    if status_lower in ["pass", "passed", "success", "successful"]:
-                        passed_tests += 1
-                    elif status_lower in ["fail", "failed", "failure", "error"]:
-                        failed_tests += 1
-                    elif status_lower in ["blocked", "block", "skip", "skipped"]:
-                        blocked_tests += 1
-                    else:
-                        not_executed_tests += 1
-                    
-                    # 처음 5개 실행 결과의 상태 분류 디버깅
-                    if i < 5:
-                        st.info(f"🔍 [디버깅] 실행 결과 {i+1}: '{status_name}' → 분류: {'Pass' if status_lower in ['pass', 'passed', 'success', 'successful'] else 'Fail' if status_lower in ['fail', 'failed', 'failure', 'error'] else 'Blocked' if status_lower in ['blocked', 'block', 'skip', 'skipped'] else 'Not Executed'}")
-                    
-                    # 테스트 케이스 정보 추출
-                    test_case = execution.get("testCase", {})
-                    test_case_name = "Unknown Test"
-                    test_case_key = "N/A"
-                    
-                    if isinstance(test_case, dict):
-                        test_case_name = test_case.get("name", "Unknown Test")
-                        test_case_key = test_case.get("key", "N/A")
-                    
-                    # 실행자 정보 추출
-                    executed_by = "Unknown"
-                    executor_fields = ["executedBy", "executor", "assignee", "user"]
-                    
-                    for field in executor_fields:
-                        if execution.get(field):
-                            executed_by_info = execution.get(field)
-                            if isinstance(executed_by_info, dict):
-                                executed_by = executed_by_info.get("displayName", executed_by_info.get("name", "Unknown"))
-                                break
-                            elif isinstance(executed_by_info, str):
-                                executed_by = executed_by_info
-                                break
-                    
-                    # 실행 날짜 추출
-                    executed_on = "N/A"
-                    date_fields = ["executedOn", "executionDate", "completedDate", "updatedOn"]
-                    
-                    for field in date_fields:
-                        if execution.get(field):
-                            executed_on = str(execution.get(field))
-                            break
-                    
-                    test_result = {
-                        "test_case_key": test_case_key,
-                        "test_case_name": test_case_name,
-                        "status": status_name,
-                        "executed_by": executed_by,
-                        "executed_on": executed_on,
-                        "comment": execution.get("comment", execution.get("notes", ""))
-                    }
-                    test_results.append(test_result)
-                    
-                except Exception:
-                    # 개별 실행 결과 처리 실패 시 건너뛰기
-                    continue
-            
-            executed_tests = passed_tests + failed_tests + blocked_tests
-            
-            # 비율 계산
-            pass_rate = (passed_tests / executed_tests * 100) if executed_tests > 0 else 0.0
-            execution_rate = (executed_tests / total_tests * 100) if total_tests > 0 else 0.0
-            
-            return {
-                "total_tests": total_tests,
-                "executed_tests": executed_tests,
-                "passed_tests": passed_tests,
-                "failed_tests": failed_tests,
-                "blocked_tests": blocked_tests,
-                "not_executed_tests": not_executed_tests,
-                "pass_rate": round(pass_rate, 1),
-                "execution_rate": round(execution_rate, 1),
-                "test_results": test_results
-            }
-        
-        # 4. 실행 결과가 없는 경우, 사이클에 할당된 테스트 케이스 직접 조회
-        if len(executions) == 0:
-            # 직접 API 호출로 테스트 케이스 조회
-            import os
-            from dotenv import load_dotenv
-            
-            try:
-                load_dotenv()
-                zephyr_api_token = os.getenv('ZEPHYR_API_TOKEN', '')
-                
-                if not zephyr_api_token:
-                    return {
-                        "total_tests": 0,
-                        "executed_tests": 0,
-                        "passed_tests": 0,
-                        "failed_tests": 0,
-                        "blocked_tests": 0,
-                        "not_executed_tests": 0,
-                        "pass_rate": 0.0,
-                        "execution_rate": 0.0,
-                        "test_results": []
-                    }
-                
-                headers = {
-                    "Authorization": f"Bearer {zephyr_api_token}",
-                    "Accept": "application/json"
-                }
-                
-                # Zephyr Scale Cloud API 공식 문서에 따른 올바른 엔드포인트들
-                api_endpoints = [
-                    # 1. 테스트 사이클에 연결된 테스트 실행 결과 조회 (공식 방법)
-                    f"https://api.zephyrscale.smartbear.com/v2/testexecutions?testCycle={cycle_id}",
-                    # 2. 테스트 사이클 상세 정보 조회 (통계 포함)
-                    f"https://api.zephyrscale.smartbear.com/v2/testcycles/{cycle_id}",
-                    # 3. 테스트 케이스를 사이클 ID로 필터링하여 조회
-                    f"https://api.zephyrscale.smartbear.com/v2/testcases?testCycle={cycle_id}",
-                ]
-                
-                for i, url in enumerate(api_endpoints):
-                    try:
-                        response = requests.get(url, headers=headers, params={"maxResults": 100}, timeout=30, verify=False)
-                        
-                        if response.status_code == 200:
-                            test_cases_data = response.json()
-                            
-                            if isinstance(test_cases_data, dict):
-                                # values 키 확인
-                                if "values" in test_cases_data:
-                                    test_cases = test_cases_data.get("values", [])
-                                    if len(test_cases) > 0:
-                                        return {
-                                            "total_tests": len(test_cases),
-                                            "executed_tests": 0,
-                                            "passed_tests": 0,
-                                            "failed_tests": 0,
-                                            "blocked_tests": 0,
-                                            "not_executed_tests": len(test_cases),
-                                            "pass_rate": 0.0,
-                                            "execution_rate": 0.0,
-                                            "test_results": [],
-                                            "assigned_test_cases": test_cases[:10]
-                                        }
-                                
-                                # testCases 키 확인
-                                elif "testCases" in test_cases_data:
-                                    test_cases = test_cases_data.get("testCases", [])
-                                    if len(test_cases) > 0:
-                                        return {
-                                            "total_tests": len(test_cases),
-                                            "executed_tests": 0,
-                                            "passed_tests": 0,
-                                            "failed_tests": 0,
-                                            "blocked_tests": 0,
-                                            "not_executed_tests": len(test_cases),
-                                            "pass_rate": 0.0,
-                                            "execution_rate": 0.0,
-                                            "test_results": [],
-                                            "assigned_test_cases": test_cases[:10]
-                                        }
-                                
-                                # 사이클 상세 정보인 경우 (두 번째 API)
-                                elif i == 1:  # 사이클 상세 API
-                                    # 통계 정보 확인
-                                    if "testExecutions" in test_cases_data:
-                                        executions_info = test_cases_data.get("testExecutions", {})
-                                        total_tests = executions_info.get("total", 0)
-                                        if total_tests > 0:
-                                            return {
-                                                "total_tests": total_tests,
-                                                "executed_tests": 0,
-                                                "passed_tests": 0,
-                                                "failed_tests": 0,
-                                                "blocked_tests": 0,
-                                                "not_executed_tests": total_tests,
-                                                "pass_rate": 0.0,
-                                                "execution_rate": 0.0,
-                                                "test_results": []
-                                            }
-                            
-                            elif isinstance(test_cases_data, list):
-                                if len(test_cases_data) > 0:
-                                    return {
-                                        "total_tests": len(test_cases_data),
-                                        "executed_tests": 0,
-                                        "passed_tests": 0,
-                                        "failed_tests": 0,
-                                        "blocked_tests": 0,
-                                        "not_executed_tests": len(test_cases_data),
-                                        "pass_rate": 0.0,
-                                        "execution_rate": 0.0,
-                                        "test_results": [],
-                                        "assigned_test_cases": test_cases_data[:10]
-                                    }
-                    
-                    except Exception:
-                        continue
-                
-            except Exception:
-                pass
-            
-            # 할당된 테스트 케이스도 없는 경우
-            return {
-                "total_tests": 0,
-                "executed_tests": 0,
-                "passed_tests": 0,
-                "failed_tests": 0,
-                "blocked_tests": 0,
-                "not_executed_tests": 0,
-                "pass_rate": 0.0,
-                "execution_rate": 0.0,
-                "test_results": []
-            }
-        
-        # 통계 계산
-        total_tests = len(executions)
-        passed_tests = 0
-        failed_tests = 0
-        blocked_tests = 0
-        not_executed_tests = 0
-        
-        test_results = []
-        
-        for execution in executions:
-            try:
-                # 실행 상태 추출
-                status = execution.get("testExecutionStatus", {})
-                status_name = "Not Executed"
-                
-                if isinstance(status, dict):
-                    status_name = status.get("name", "Not Executed")
-                elif isinstance(status, str):
-                    status_name = status
-                
-                # 상태별 카운트
-                if status_name in ["Pass", "Passed", "PASS"]:
-                    passed_tests += 1
-                elif status_name in ["Fail", "Failed", "FAIL"]:
-                    failed_tests += 1
-                elif status_name in ["Blocked", "BLOCKED"]:
-                    blocked_tests += 1
-                else:
-                    not_executed_tests += 1
-                
-                # 테스트 케이스 정보 추출
-                test_case = execution.get("testCase", {})
-                test_case_name = "Unknown Test"
-                test_case_key = "N/A"
-                
-                if isinstance(test_case, dict):
-                    test_case_name = test_case.get("name", "Unknown Test")
-                    test_case_key = test_case.get("key", "N/A")
-                
-                # 실행자 정보 추출
-                executed_by = "Unknown"
-                if execution.get("executedBy"):
-                    executed_by_info = execution.get("executedBy")
-                    if isinstance(executed_by_info, dict):
-                        executed_by = executed_by_info.get("displayName", "Unknown")
-                    elif isinstance(executed_by_info, str):
-                        executed_by = executed_by_info
-                
-                # 실행 날짜 추출
-                executed_on = execution.get("executedOn", "N/A")
-                
-                test_result = {
-                    "test_case_key": test_case_key,
-                    "test_case_name": test_case_name,
-                    "status": status_name,
-                    "executed_by": executed_by,
-                    "executed_on": executed_on,
-                    "comment": execution.get("comment", "")
-                }
-                test_results.append(test_result)
-                
-            except Exception as e:
-                # 개별 실행 결과 처리 실패 시 건너뛰기
-                continue
-        
-        executed_tests = passed_tests + failed_tests + blocked_tests
-        
-        # 비율 계산
-        pass_rate = (passed_tests / executed_tests * 100) if executed_tests > 0 else 0.0
-        execution_rate = (executed_tests / total_tests * 100) if total_tests > 0 else 0.0
-        
-        return {
-            "total_tests": total_tests,
-            "executed_tests": executed_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": failed_tests,
-            "blocked_tests": blocked_tests,
-            "not_executed_tests": not_executed_tests,
-            "pass_rate": round(pass_rate, 1),
-            "execution_rate": round(execution_rate, 1),
-            "test_results": test_results
-        }
-        
-    except Exception as e:
-        st.error(f"사이클 테스트 결과 요약 조회 실패: {str(e)}")
-        return {
-            "total_tests": 0,
-            "executed_tests": 0,
-            "passed_tests": 0,
-            "failed_tests": 0,
-            "blocked_tests": 0,
-            "not_executed_tests": 0,
-            "pass_rate": 0.0,
-            "execution_rate": 0.0,
-            "test_results": []
-        }
-
-
 # QA 요청서 관련 API 함수들
 def create_qa_request(qa_request_data):
     """QA 요청서 생성"""
@@ -9,10 +9,13 @@ from datetime import datetime
 from typing import Dict, List, Any
 import logging
 
-from streamlit_app.api.client import get_api_base_url, get_sync_status, get_jira_project_issues, sync_jira_project
+from streamlit_app.api.client import get_api_base_url, get_sync_status, stream_sync_status, cancel_sync_job, get_jira_project_issues, sync_jira_project
 
 logger = logging.getLogger(__name__)
 
+# 진행 이벤트 구독을 멈추는 동기화 상태
+SYNC_FINISHED_STATUSES = ["completed", "error", "cancelled", "not_found"]
+
 def get_current_selection_count(project_key: str, issues: List[Dict[str, Any]]) -> int:
     """현재 선택된 이슈 수 반환"""
     if not issues:
@@ -303,7 +306,7 @@ def sync_project(project_key: str):
 
 @st.dialog("동기화 진행 상황")
 def sync_progress_modal(project_key: str):
-    """동기화 진행 상황"""
+    """동기화 진행 상황 - 진행 이벤트(SSE)를 받아 상태 영역만 갱신"""
     # 동기화 상태 조회
     sync_status = get_sync_status(project_key)
     
@@ -314,75 +317,29 @@ def sync_progress_modal(project_key: str):
         st.rerun()
         return
     
+    status_area = st.empty()
+    _render_sync_status(status_area, sync_status)
     status = sync_status.get('status', 'unknown')
-    progress = sync_status.get('progress', 0)
-    message = sync_status.get('message', '진행 중...')
-    total_issues = sync_status.get('total_issues', 0)
-    processed_issues = sync_status.get('processed_issues', 0)
-    
-    # 메시지에서 불필요한 문구 제거
-    if message:
-        message = message.replace('(고성능 배치 처리)', '').strip()
-        # 연속된 공백 제거
-        import re
-        message = re.sub(r'\s+', ' ', message)
-    
-    # 상태별 아이콘 설정
-    if status == "starting":
-        status_icon = "●"
-        status_text = "시작 중"
-    elif status == "connecting":
-        status_icon = "●"
-        status_text = "연결 중"
-    elif status == "fetching_issues":
-        status_icon = "●"
-        status_text = "이슈 조회 중"
-    elif status == "processing":
-        status_icon = "●"
-        status_text = "처리 중"
-    elif status == "completed":
-        status_icon = "✓"
-        status_text = "완료"
-    elif status == "error":
-        status_icon = "✗"
-        status_text = "오류"
-    elif status == "not_found":
-        status_icon = "!"
-        status_text = "찾을 수 없음"
-    else:
-        status_icon = "●"
-        status_text = "진행 중"
-    
-    # 상태 표시
-    if status == "completed":
-        st.markdown(f"**{status_icon} {status_text}**")
-        if total_issues > 0:
-            st.markdown(f"**완료:** {processed_issues}/{total_issues} 이슈 처리됨")
-        else:
-            st.markdown(f"{message}")
-    elif status == "error":
-        st.markdown(f"**{status_icon} {status_text}**")
-        st.markdown(f"{message}")
-    elif status == "not_found":
-        st.markdown(f"**{status_icon} {status_text}**")
-        st.markdown(f"{message}")
-    else:
-        st.markdown(f"**{status_icon} {status_text}**")
-        st.markdown(f"{message}")
-    
-    # 진행률 표시
-    st.progress(progress / 100.0)
-    st.markdown(f"**진행률:** {progress}%")
-    
-    # 상세 정보 표시
-    if total_issues > 0 and status == "processing":
-        st.markdown(f"**처리 중:** {processed_issues}/{total_issues} 이슈")
     
-    # 완료 상태가 아니면 자동 새로고침
-    if status not in ["completed", "error", "not_found"]:
+    # 완료 상태가 아니면 진행 이벤트 구독
+    if status not in SYNC_FINISHED_STATUSES:
         st.markdown("---")
         st.markdown("동기화가 진행 중입니다. 잠시만 기다려주세요...")
-        time.sleep(2)
+        
+        job_id = sync_status.get('job_id')
+        if job_id and st.button("동기화 취소", key=f"sync_cancel_{project_key}_{job_id}"):
+            cancel_sync_job(job_id)
+        
+        # 상태가 바뀔 때마다 상태 영역만 다시 그림 (페이지 전체 rerun 없음)
+        for event in stream_sync_status(project_key):
+            _render_sync_status(status_area, event)
+            if event.get('status') in SYNC_FINISHED_STATUSES:
+                break
+        else:
+            # 스트림을 사용할 수 없거나 연결이 끊긴 경우 기존 방식으로 재조회
+            time.sleep(2)
+        
+        # 완료 화면(확인 버튼)을 그리기 위해 한 번만 rerun
         st.rerun()
     else:
         # 완료 상태면 확인 버튼 표시
@@ -394,6 +351,76 @@ def sync_progress_modal(project_key: str):
             if st.button("확인", key=f"sync_complete_{project_key}", use_container_width=True, type="primary"):
                 st.rerun()
 
+def _render_sync_status(status_area, sync_status: Dict[str, Any]):
+    """동기화 상태(아이콘, 메시지, 진행률)를 지정된 영역에 그림"""
+    with status_area.container():
+        status = sync_status.get('status', 'unknown')
+        progress = sync_status.get('progress', 0)
+        message = sync_status.get('message', '진행 중...')
+        total_issues = sync_status.get('total_issues', 0)
+        processed_issues = sync_status.get('processed_issues', 0)
+        
+        # 메시지에서 불필요한 문구 제거
+        if message:
+            message = message.replace('(고성능 배치 처리)', '').strip()
+            # 연속된 공백 제거
+            import re
+            message = re.sub(r'\s+', ' ', message)
+        
+        # 상태별 아이콘 설정
+        if status == "starting":
+            status_icon = "●"
+            status_text = "시작 중"
+        elif status == "connecting":
+            status_icon = "●"
+            status_text = "연결 중"
+        elif status == "fetching_issues":
+            status_icon = "●"
+            status_text = "이슈 조회 중"
+        elif status == "processing":
+            status_icon = "●"
+            status_text = "처리 중"
+        elif status == "completed":
+            status_icon = "✓"
+            status_text = "완료"
+        elif status == "error":
+            status_icon = "✗"
+            status_text = "오류"
+        elif status == "cancelled":
+            status_icon = "✗"
+            status_text = "취소됨"
+        elif status == "not_found":
+            status_icon = "!"
+            status_text = "찾을 수 없음"
+        else:
+            status_icon = "●"
+            status_text = "진행 중"
+        
+        # 상태 표시
+        if status == "completed":
+            st.markdown(f"**{status_icon} {status_text}**")
+            if total_issues > 0:
+                st.markdown(f"**완료:** {processed_issues}/{total_issues} 이슈 처리됨")
+            else:
+                st.markdown(f"{message}")
+        elif status in ["error", "cancelled"]:
+            st.markdown(f"**{status_icon} {status_text}**")
+            st.markdown(f"{message}")
+        elif status == "not_found":
+            st.markdown(f"**{status_icon} {status_text}**")
+            st.markdown(f"{message}")
+        else:
+            st.markdown(f"**{status_icon} {status_text}**")
+            st.markdown(f"{message}")
+        
+        # 진행률 표시
+        st.progress(progress / 100.0)
+        st.markdown(f"**진행률:** {progress}%")
+        
+        # 상세 정보 표시
+        if total_issues > 0 and status == "processing":
+            st.markdown(f"**처리 중:** {processed_issues}/{total_issues} 이슈")
+
 def monitor_sync_progress(project_key: str):
     """동기화 진행 상황 실시간 모니터링 (실제 모달)"""
     sync_progress_modal(project_key)
@@ -17,7 +17,7 @@ from streamlit_app.api.client import (
     update_qa_status, update_task_memo, get_task_memo, get_sync_status, reset_all_tasks,
     get_cycles_for_project, get_zephyr_projects, get_task_linked_cycles, 
     get_available_cycles_for_task, link_task_to_cycle, unlink_task_from_cycle,
-    sync_zephyr_cycles_from_api, get_zephyr_test_cycles, get_cycle_test_results_summary,
+    sync_zephyr_cycles_from_api, get_zephyr_test_cycles,
     get_zephyr_cycles_from_api
 )
 from streamlit_app.utils.helpers import get_jira_issue_url
@@ -633,29 +633,34 @@ def show_task_detail_card(task):
                     else:
                         st.error("❌ 사이클 연결 해제에 실패했습니다.")
             
-            # 사이클 테스트 결과 표시
+            # 사이클 테스트 결과 표시 (동기화된 실행 결과로 서버가 갱신한 사이클 통계 사용)
             if cycle_id and cycle_id != 'N/A':
                 with st.expander(f"📊 {cycle_name} 테스트 실행 현황"):
-                    test_summary = get_cycle_test_results_summary(cycle_id)
+                    total_tests = cycle.get('total_test_cases', 0) or 0
+                    executed_tests = cycle.get('executed_test_cases', 0) or 0
                     
-                    if test_summary and test_summary.get('total_tests', 0) > 0:
-                        col1, col2, col3, col4 = st.columns(4)
+                    if total_tests > 0:
+                        execution_rate = round(executed_tests / total_tests * 100, 1)
+                        col1, col2, col3, col4, col5 = st.columns(5)
                         
                         with col1:
-                            st.metric("총 테스트", test_summary.get('total_tests', 0))
+                            st.metric("총 테스트", total_tests)
                         with col2:
-                            st.metric("실행률", f"{test_summary.get('executed_tests', 0)}/{test_summary.get('total_tests', 0)} ({test_summary.get('execution_rate', 0)}%)")
+                            st.metric("실행률", f"{executed_tests}/{total_tests} ({execution_rate}%)")
                         with col3:
-                            st.metric("통과", test_summary.get('passed_tests', 0))
+                            st.metric("통과", cycle.get('passed_test_cases', 0))
                         with col4:
-                            st.metric("실패", test_summary.get('failed_tests', 0))
+                            st.metric("실패", cycle.get('failed_test_cases', 0))
+                        with col5:
+                            st.metric("미실행", cycle.get('not_executed_test_cases', 0))
                         
-                        if test_summary.get('executed_tests', 0) > 0:
-                            st.success(f"✅ 통과율: {test_summary.get('pass_rate', 0)}%")
+                        if executed_tests > 0:
+                            pass_rate = round((cycle.get('passed_test_cases', 0) or 0) / executed_tests * 100, 1)
+                            st.success(f"✅ 통과율: {pass_rate}%")
                         else:
                             st.info("아직 실행된 테스트가 없습니다.")
                     else:
-                        st.info("테스트 결과 정보를 불러올 수 없습니다.")
+                        st.info("동기화된 실행 결과가 없습니다. Zephyr 프로젝트 동기화 후 표시됩니다.")
     
     # 새 사이클 연결
     st.write("**새 사이클 연결:**")
@@ -0,0 +1,67 @@
+"""
+테스트 공통 설정
+
+앱 모듈은 import 시점에 settings.DATABASE_URL로 엔진을 만들기 때문에
+임시 SQLite 파일 DB를 환경 변수로 먼저 지정한 뒤 import 한다.
+"""
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+
+_TEST_DB_DIR = tempfile.mkdtemp(prefix="qa_dashboard_test_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TEST_DB_DIR, 'test.db')}"
+os.environ["ASYNC_DB_ENABLED"] = "false"
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event  # noqa: E402
+
+import models.database_models  # noqa: E402,F401  (모델을 Base.metadata에 등록)
+from core.database import Base, SessionLocal, engine, init_db  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """init_db()로 만든 테스트 DB"""
+    init_db()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """테스트마다 새 세션 - 종료 시 모든 테이블 데이터 삭제"""
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
+        with engine.begin() as connection:
+            for table in reversed(Base.metadata.sorted_tables):
+                connection.execute(table.delete())
+
+
+@pytest.fixture
+def count_statements(database):
+    """블록 안에서 실행된 SQL 문을 수집 (before_cursor_execute)
+    
+    with count_statements() as statements: ... 후 len(statements)로 쿼리 수를 확인한다.
+    """
+    @contextmanager
+    def _count():
+        statements = []
+        
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+    
+    return _count
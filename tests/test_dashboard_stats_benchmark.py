@@ -0,0 +1,115 @@
+"""
+작업 대시보드 통계 벤치마크 (100k 작업)
+
+기존 방식(tasks에 COUNT 쿼리를 항목마다 실행)과 task_stats 집계 버킷을 읽는 현재
+get_dashboard_stats의 쿼리 수와 평균 지연 시간을 비교한다.
+데이터 생성에 시간이 걸리므로 기본 실행에서는 건너뛴다.
+
+    QA_DASHBOARD_BENCHMARK=1 python -m pytest -q -s tests/test_dashboard_stats_benchmark.py
+"""
+import os
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import desc, func, insert
+
+from models.database_models import Project, SyncHistory, Task
+from services.task_service import task_service
+from services.task_stats_service import task_stats_service
+
+pytestmark = pytest.mark.skipif(
+    os.getenv("QA_DASHBOARD_BENCHMARK") != "1",
+    reason="QA_DASHBOARD_BENCHMARK=1일 때만 실행"
+)
+
+TASK_COUNT = 100_000
+ROUNDS = 20
+
+STATUSES = ("To Do", "In Progress", "QA Ready", "Done")
+QA_STATUSES = ("미시작", "QA 시작", "QA 진행중", "QA 완료")
+PRIORITIES = ("Highest", "High", "Medium", "Low", "Lowest")
+
+
+def _legacy_dashboard_counts(db) -> dict:
+    """변경 전 get_dashboard_stats의 쿼리 구성 (건수마다 tasks를 다시 스캔)"""
+    live = db.query(Task).filter(Task.deleted_at.is_(None))
+    week_ago = datetime.now() - timedelta(days=7)
+    
+    stats = {
+        "total_tasks": live.count(),
+        "completed_tasks": live.filter(Task.status == "Done").count(),
+        "qa_ready_tasks": live.filter(Task.status == "QA Ready").count(),
+        "in_progress_tasks": live.filter(Task.status == "In Progress").count(),
+        "qa_completed": live.filter(Task.qa_status == "QA 완료").count(),
+        "qa_in_progress": live.filter(Task.qa_status == "QA 진행중").count(),
+        "qa_started": live.filter(Task.qa_status == "QA 시작").count(),
+        "qa_not_started": live.filter((Task.qa_status == "미시작") | (Task.qa_status.is_(None))).count(),
+        "weekly_new_tasks": live.filter(Task.created_at >= week_ago).count(),
+        "active_projects": db.query(Project).filter(Project.is_active == True).count()
+    }
+    priority_dict = dict(
+        db.query(Task.priority, func.count(Task.id)).filter(Task.deleted_at.is_(None)).group_by(Task.priority).all()
+    )
+    stats.update({f"priority_{priority.lower()}": priority_dict.get(priority, 0) for priority in PRIORITIES})
+    db.query(Task.assignee, func.count(Task.id)).filter(
+        Task.deleted_at.is_(None), Task.assignee.isnot(None), Task.assignee != "", Task.assignee != "Unassigned"
+    ).group_by(Task.assignee).order_by(func.count(Task.id).desc()).limit(5).all()
+    db.query(Project.jira_project_key, func.count(Task.id)).join(
+        Task, Project.id == Task.project_id
+    ).filter(Task.deleted_at.is_(None)).group_by(Project.jira_project_key).order_by(func.count(Task.id).desc()).all()
+    db.query(SyncHistory).order_by(desc(SyncHistory.started_at)).first()
+    return stats
+
+
+def _measure(db, count_statements, stats_func):
+    """(결과, 1회 실행 쿼리 수, 평균 지연 ms)"""
+    stats_func(db)  # 워밍업
+    
+    db.expire_all()
+    with count_statements() as statements:
+        result = stats_func(db)
+    
+    elapsed = 0.0
+    for _ in range(ROUNDS):
+        db.expire_all()
+        started = time.perf_counter()
+        stats_func(db)
+        elapsed += time.perf_counter() - started
+    return result, len(statements), elapsed / ROUNDS * 1000
+
+
+def test_dashboard_stats_benchmark_100k_tasks(db, count_statements):
+    projects = [Project(name=f"Project {index}", jira_project_key=f"P{index}") for index in range(5)]
+    db.add_all(projects)
+    db.flush()
+    
+    now = datetime.now()
+    db.execute(insert(Task), [
+        {
+            "jira_key": f"{projects[index % 5].jira_project_key}-{index}",
+            "title": f"Task {index}",
+            "status": STATUSES[index % 4],
+            "qa_status": QA_STATUSES[index % 4],
+            "priority": PRIORITIES[index % 5],
+            "assignee": f"user{index % 20}",
+            "project_id": projects[index % 5].id,
+            "created_at": now - timedelta(days=index % 30),
+            "deleted_at": now if index % 50 == 49 else None
+        }
+        for index in range(TASK_COUNT)
+    ])
+    task_stats_service.rebuild(db)
+    
+    legacy, legacy_statements, legacy_ms = _measure(db, count_statements, _legacy_dashboard_counts)
+    rollup, rollup_statements, rollup_ms = _measure(db, count_statements, task_service.get_dashboard_stats)
+    
+    print(
+        f"\n대시보드 통계 ({TASK_COUNT:,}개 작업, {ROUNDS}회 평균)"
+        f"\n  기존 COUNT 쿼리: {legacy_statements}개 쿼리, {legacy_ms:.1f} ms"
+        f"\n  task_stats 집계: {rollup_statements}개 쿼리, {rollup_ms:.1f} ms"
+    )
+    
+    assert {key: rollup[key] for key in legacy} == legacy
+    assert rollup_statements < legacy_statements
+    assert rollup_ms < legacy_ms
@@ -0,0 +1,46 @@
+"""
+데이터베이스 초기화/엔진 설정 테스트
+"""
+from sqlalchemy import inspect, text
+
+from config.settings import settings
+from core.database import _add_missing_indexes, _async_database_url, _postgres_connect_args, engine
+from models.database_models import ZephyrProject, ZephyrTestCase, ZephyrTestExecution
+
+
+def test_unique_execution_index_is_added_after_removing_duplicates(db):
+    project = ZephyrProject(zephyr_project_id="10000", project_key="ZP", project_name="Zephyr Project")
+    db.add(project)
+    db.flush()
+    test_case = ZephyrTestCase(zephyr_test_id="1", zephyr_project_id=project.id, title="Test")
+    db.add(test_case)
+    db.commit()
+    
+    # 유니크 인덱스가 없던 이전 스키마에서 겹친 가져오기로 생긴 중복 행
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_zephyr_test_executions_execution_id"))
+    db.add_all([
+        ZephyrTestExecution(zephyr_execution_id=execution_id, test_case_id=test_case.id, execution_status="Pass")
+        for execution_id in ("E-1", "E-1", "E-2")
+    ])
+    db.commit()
+    
+    _add_missing_indexes()
+    
+    index_names = {index["name"] for index in inspect(engine).get_indexes("zephyr_test_executions")}
+    assert "ix_zephyr_test_executions_execution_id" in index_names
+    assert sorted(execution_id for execution_id, in db.query(ZephyrTestExecution.zephyr_execution_id)) == ["E-1", "E-2"]
+
+
+def test_prepared_statement_settings_follow_driver(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PREPARE_THRESHOLD", 5)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 250)
+    
+    # postgresql:// 기본 설정은 동기 psycopg2 + 비동기 asyncpg
+    async_url = _async_database_url("postgresql://qa:secret@db/qa_dashboard")
+    assert _postgres_connect_args(async_url) == {"prepared_statement_cache_size": 250}
+    assert _postgres_connect_args("postgresql://qa:secret@db/qa_dashboard") == {}
+    assert _postgres_connect_args("postgresql+psycopg://qa:secret@db/qa_dashboard") == {"prepare_threshold": 5}
+    
+    monkeypatch.setattr(settings, "DB_PREPARE_THRESHOLD", 0)
+    assert _postgres_connect_args("postgresql+psycopg://qa:secret@db/qa_dashboard") == {"prepare_threshold": None}
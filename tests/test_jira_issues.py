@@ -0,0 +1,61 @@
+"""
+Jira 이슈 목록 조회 테스트
+
+재시도 후에도 페이지 조회가 실패하면 이미 받은 페이지만으로 성공 응답을 만들지 않아야 한다.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import jira_routes
+from services.jira_service import JiraPageFetchError, JiraProjectNotFoundError, jira_service
+
+
+def _issue(index: int):
+    return {"key": f"ALPHA-{index}", "summary": f"Issue {index}"}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(jira_routes.router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def failing_pages(monkeypatch):
+    """첫 페이지는 성공하고 두 번째 페이지에서 재시도 후 실패"""
+    def iter_issue_pages(project_key, **kwargs):
+        yield [_issue(index) for index in range(100)]
+        raise JiraPageFetchError("페이지 2 조회 실패: HTTP 429")
+    
+    monkeypatch.setattr(jira_service, "configured", True)
+    monkeypatch.setattr(jira_service, "iter_issue_pages", iter_issue_pages)
+
+
+def test_get_issues_raises_instead_of_returning_partial_list(failing_pages):
+    with pytest.raises(JiraPageFetchError):
+        jira_service.get_issues("ALPHA")
+
+
+def test_issues_route_answers_502_on_page_failure(client, failing_pages):
+    response = client.get("/jira/projects/ALPHA/issues")
+    
+    assert response.status_code == 502
+    assert "HTTP 429" in response.json()["detail"]
+
+
+def test_issues_route_reports_missing_project(client, monkeypatch):
+    def iter_issue_pages(project_key, **kwargs):
+        raise JiraProjectNotFoundError(f"프로젝트 {project_key}가 존재하지 않거나 접근할 수 없습니다.")
+        yield
+    
+    monkeypatch.setattr(jira_service, "configured", True)
+    monkeypatch.setattr(jira_service, "iter_issue_pages", iter_issue_pages)
+    monkeypatch.setattr(jira_service, "_check_project_exists", lambda project_key: False)
+    
+    response = client.get("/jira/projects/NOPE/issues")
+    
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+    assert "접근할 수 없습니다" in response.json()["message"]
@@ -0,0 +1,106 @@
+"""
+인덱스 사용 테스트
+
+init_db()로 만든 SQLite DB에서 자주 쓰는 필터/집계 쿼리를 실제로 실행해 SQL을 수집하고,
+EXPLAIN QUERY PLAN에 기대한 인덱스가 나타나는지 확인한다.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func
+
+from models.database_models import Task, TaskCycleLink, ZephyrProject, ZephyrTestExecution
+from services.task_service import task_service
+from services.zephyr_service import zephyr_service
+
+
+@pytest.fixture
+def query_plan(db, count_statements):
+    """fn(db) 실행 중 나간 SELECT 문들의 EXPLAIN QUERY PLAN 상세를 한 문자열로 반환"""
+    def _plan(fn) -> str:
+        with count_statements() as statements:
+            fn(db)
+        
+        # 플랜은 바인드 값과 무관하므로 파라미터는 NULL로 채움
+        details = []
+        connection = db.connection()
+        for statement in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            rows = connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", (None,) * statement.count("?")
+            ).fetchall()
+            details.extend(row[-1] for row in rows)
+        return "\n".join(details)
+    
+    return _plan
+
+
+@pytest.mark.parametrize("filters, expected_indexes", [
+    # 통계(ANALYZE) 없이는 세 인덱스의 비용이 같아 생성 순서에 따라 선택이 달라짐 - 어느 쪽이든 범위 조회면 충분
+    (
+        {"project_id": 1, "status": "Done"},
+        ("ix_tasks_project_status", "ix_tasks_project_updated_at", "ix_tasks_status_updated_at")
+    ),
+    ({"project_id": 1}, ("ix_tasks_project_updated_at",)),
+    ({"status": "Done"}, ("ix_tasks_status_updated_at",)),
+    ({}, ("ix_tasks_updated_at",)),
+])
+def test_task_list_filters_use_index(query_plan, filters, expected_indexes):
+    plan = query_plan(lambda db: task_service.get_tasks(db, **filters))
+    
+    assert any(f"USING INDEX {index}" in plan for index in expected_indexes), plan
+
+
+def test_task_project_status_count_uses_index(query_plan):
+    plan = query_plan(lambda db: db.query(func.count(Task.id)).filter(
+        Task.project_id == 1, Task.status == "Done"
+    ).scalar())
+    
+    assert "ix_tasks_project_status" in plan
+
+
+def test_task_qa_status_filter_uses_index(query_plan):
+    plan = query_plan(lambda db: db.query(Task).filter(Task.qa_status == "진행중").all())
+    
+    assert "ix_tasks_qa_status" in plan
+
+
+def test_weekly_new_tasks_count_uses_index(query_plan):
+    week_ago = datetime.now() - timedelta(days=7)
+    plan = query_plan(lambda db: db.query(func.count(Task.id)).filter(
+        Task.deleted_at.is_(None), Task.created_at >= week_ago
+    ).scalar())
+    
+    assert "ix_tasks_created_at" in plan
+
+
+def test_active_cycle_links_by_task_use_index(query_plan):
+    plan = query_plan(lambda db: db.query(TaskCycleLink).filter(
+        TaskCycleLink.task_id == 1, TaskCycleLink.is_active == True
+    ).all())
+    
+    assert "ix_task_cycle_links_task_active" in plan
+
+
+def test_execution_lookups_use_project_indexes(query_plan):
+    project = ZephyrProject(id=1)
+    plan = query_plan(lambda db: zephyr_service._load_execution_lookups(db, project))
+    
+    assert "ix_zephyr_test_cases_project_test" in plan
+    assert "ix_zephyr_test_cycles_project_cycle" in plan
+
+
+def test_execution_status_by_test_case_uses_index(query_plan):
+    plan = query_plan(lambda db: db.query(func.count(ZephyrTestExecution.id)).filter(
+        ZephyrTestExecution.test_case_id == 1,
+        ZephyrTestExecution.execution_status == "Pass"
+    ).scalar())
+    
+    assert "ix_zephyr_test_executions_case_status" in plan
+
+
+def test_cycle_statistics_uses_index(query_plan):
+    plan = query_plan(lambda db: zephyr_service.get_cycle_statistics(db))
+    
+    assert "ix_zephyr_cycle_executions_cycle_status" in plan
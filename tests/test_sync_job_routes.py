@@ -0,0 +1,40 @@
+"""
+동기화 작업 API 테스트
+
+작업 등록/조회/취소 라우트는 get_async_db 세션으로 서비스를 호출한다.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import jira_routes
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(jira_routes.router)
+    return TestClient(app)
+
+
+def test_enqueue_get_list_and_cancel_sync_job(client):
+    response = client.post("/jira/sync/ALPHA", json={"full_sync": True})
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    
+    # 같은 프로젝트의 대기 중 작업이 있으면 새로 등록하지 않음
+    assert client.post("/jira/sync/ALPHA").json()["job_id"] == job_id
+    
+    job = client.get(f"/jira/sync-jobs/{job_id}").json()
+    assert (job["project_key"], job["status"], job["payload"]["full_sync"]) == ("ALPHA", "queued", True)
+    assert [job["id"] for job in client.get("/jira/sync-jobs", params={"project_key": "ALPHA"}).json()] == [job_id]
+    assert client.get("/jira/sync-status/ALPHA").json()["job_id"] == job_id
+    
+    cancelled = client.post(f"/jira/sync-jobs/{job_id}/cancel").json()
+    assert cancelled["status"] == "cancelled"
+    assert client.get("/jira/sync-status/ALPHA").json()["status"] == "cancelled"
+
+
+def test_missing_sync_job_returns_404(client):
+    assert client.get("/jira/sync-jobs/999").status_code == 404
+    assert client.post("/jira/sync-jobs/999/cancel").status_code == 404
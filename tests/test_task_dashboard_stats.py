@@ -0,0 +1,129 @@
+"""
+작업 대시보드 통계 테스트
+
+get_dashboard_stats는 task_stats 집계 버킷에서 건수를 읽으므로 작업 수와 관계없이 같은 수의 쿼리로 끝나야 하고,
+결과는 tasks 테이블을 직접 센 값과 같아야 한다.
+버킷 키에 담당자가 포함되므로 담당자 변경 시 작업이 버킷 사이를 옮겨도 재계산 결과와 같아야 한다.
+"""
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, insert
+
+from models.database_models import Project, Task, TaskStat
+from models.pydantic_models import TaskUpdate
+from services.task_service import task_service
+from services.task_stats_service import task_stats_service
+
+STATUSES = ("To Do", "In Progress", "Done")
+QA_STATUSES = ("미시작", "QA 진행중", "QA 완료")
+PRIORITIES = ("High", "Medium", "Low")
+
+
+def _add_tasks(db, start: int, count: int) -> None:
+    """두 프로젝트에 작업을 나눠 추가하고 (10개 중 1개는 삭제 표시) 통계 버킷을 재계산"""
+    projects = db.query(Project).order_by(Project.id).all()
+    if not projects:
+        projects = [
+            Project(name="Alpha", jira_project_key="ALPHA"),
+            Project(name="Beta", jira_project_key="BETA")
+        ]
+        db.add_all(projects)
+        db.flush()
+    
+    now = datetime.now()
+    db.execute(insert(Task), [
+        {
+            "jira_key": f"{projects[index % 2].jira_project_key}-{index}",
+            "title": f"Task {index}",
+            "status": STATUSES[index % 3],
+            "qa_status": QA_STATUSES[index % 3],
+            "priority": PRIORITIES[index % 3],
+            "assignee": f"user{index % 7}",
+            "project_id": projects[index % 2].id,
+            "created_at": now - timedelta(days=index % 14),
+            "deleted_at": now if index % 10 == 9 else None
+        }
+        for index in range(start, start + count)
+    ])
+    task_stats_service.rebuild(db)
+
+
+def _dashboard_statement_count(db, count_statements) -> int:
+    db.expire_all()
+    with count_statements() as statements:
+        task_service.get_dashboard_stats(db)
+    return len(statements)
+
+
+def test_dashboard_stats_query_count_does_not_grow_with_tasks(db, count_statements):
+    _add_tasks(db, 0, 100)
+    small_count = _dashboard_statement_count(db, count_statements)
+    
+    _add_tasks(db, 100, 10000)
+    large_count = _dashboard_statement_count(db, count_statements)
+    
+    assert small_count > 0
+    assert large_count == small_count
+
+
+def test_dashboard_stats_match_task_counts(db):
+    _add_tasks(db, 0, 300)
+    live = db.query(Task).filter(Task.deleted_at.is_(None))
+    week_ago = datetime.now() - timedelta(days=7)
+    
+    stats = task_service.get_dashboard_stats(db)
+    
+    assert stats["total_tasks"] == live.count()
+    assert stats["completed_tasks"] == live.filter(Task.status == "Done").count()
+    assert stats["qa_completed"] == live.filter(Task.qa_status == "QA 완료").count()
+    assert stats["weekly_new_tasks"] == live.filter(Task.created_at >= week_ago).count()
+    assert {item["project"]: item["count"] for item in stats["project_stats"]} == {
+        key: count for key, count in db.query(Project.jira_project_key, func.count(Task.id))
+        .join(Task, Task.project_id == Project.id)
+        .filter(Task.deleted_at.is_(None))
+        .group_by(Project.jira_project_key)
+    }
+
+
+def _summary_matches_rebuild(db) -> None:
+    """증분 반영된 집계가 tasks에서 다시 계산한 집계와 같은지 확인"""
+    incremental = task_stats_service.get_summary(db)
+    assert db.query(TaskStat).filter(TaskStat.task_count <= 0).count() == 0
+    
+    task_stats_service.rebuild(db)
+    assert task_stats_service.get_summary(db) == incremental
+
+
+def test_summary_stays_correct_after_assignee_reassignment(db):
+    _add_tasks(db, 0, 30)
+    tasks = db.query(Task).filter(Task.deleted_at.is_(None), Task.assignee == "user0").all()
+    before = task_stats_service.get_summary(db)
+    
+    # API로 담당자 변경 - user0 버킷에서 user1 버킷으로 이동 (마지막 작업이 빠지면 user0 버킷 삭제)
+    for task in tasks:
+        task_service.update_task(db, task.id, TaskUpdate(assignee="user1"))
+    
+    summary = task_stats_service.get_summary(db)
+    assert summary["total"] == before["total"]
+    assert summary["assignee"]["user0"] == 0
+    assert summary["assignee"]["user1"] == before["assignee"]["user1"] + before["assignee"]["user0"]
+    assert summary["status"] == before["status"]
+    _summary_matches_rebuild(db)
+    
+    # Jira 동기화로 담당자와 상태가 함께 바뀌는 경우
+    task = db.query(Task).filter(Task.deleted_at.is_(None), Task.assignee == "user2").first()
+    project = db.query(Project).get(task.project_id)
+    task_service._upsert_issue_page(db, project, [{
+        "key": task.jira_key,
+        "id": task.jira_id,
+        "summary": task.title,
+        "status": "Done",
+        "assignee": "user0",
+        "priority": task.priority
+    }])
+    db.commit()
+    
+    summary = task_stats_service.get_summary(db)
+    assert summary["total"] == before["total"]
+    assert summary["assignee"]["user0"] == 1
+    _summary_matches_rebuild(db)
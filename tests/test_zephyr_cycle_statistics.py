@@ -0,0 +1,35 @@
+"""
+Zephyr 사이클 통계 테스트
+
+사이클 통계 컬럼은 저장된 사이클 실행 결과로 갱신되며, UI는 API 재조회 없이 이 값을 그대로 표시한다.
+"""
+from models.database_models import ZephyrCycleExecution, ZephyrProject, ZephyrTestCase, ZephyrTestCycle
+from services.zephyr_service import zephyr_service
+
+
+def test_refresh_cycle_statistics_stores_all_counters(db):
+    project = ZephyrProject(zephyr_project_id="10000", project_key="ZP", project_name="Zephyr Project")
+    db.add(project)
+    db.flush()
+    test_case = ZephyrTestCase(zephyr_test_id="1", zephyr_project_id=project.id, title="Test")
+    cycle = ZephyrTestCycle(zephyr_cycle_id="501", zephyr_project_id=project.id, cycle_name="Cycle 501")
+    db.add_all([test_case, cycle])
+    db.flush()
+    statuses = ["Pass", "Pass", "Fail", "Blocked", "Not Executed", "In Progress"]
+    db.add_all([
+        ZephyrCycleExecution(
+            zephyr_execution_id=f"E-{index}", test_cycle_id=cycle.id,
+            test_case_id=test_case.id, execution_status=status
+        )
+        for index, status in enumerate(statuses)
+    ])
+    db.commit()
+    
+    assert zephyr_service.refresh_cycle_statistics(db, project.id) == 1
+    db.commit()
+    db.refresh(cycle)
+    
+    assert (
+        cycle.total_test_cases, cycle.executed_test_cases, cycle.passed_test_cases,
+        cycle.failed_test_cases, cycle.blocked_test_cases, cycle.not_executed_test_cases
+    ) == (6, 4, 2, 1, 1, 2)
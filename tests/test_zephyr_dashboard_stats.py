@@ -0,0 +1,77 @@
+"""
+Zephyr 대시보드 통계 쿼리 수 테스트
+
+get_dashboard_stats는 프로젝트 수와 관계없이 같은 수의 쿼리로 집계해야 한다 (프로젝트별 N+1 쿼리 금지).
+"""
+from datetime import datetime, timedelta
+
+from models.database_models import ZephyrProject, ZephyrTestCase, ZephyrTestExecution
+from services.zephyr_service import zephyr_service
+
+
+def _add_projects(db, start: int, count: int) -> None:
+    """프로젝트마다 테스트 케이스 2개와 Pass/Fail/Blocked 실행 결과를 추가"""
+    executed_at = datetime(2025, 1, 1, 9, 0, 0)
+    for index in range(start, start + count):
+        project = ZephyrProject(
+            zephyr_project_id=str(10000 + index),
+            project_key=f"ZP{index}",
+            project_name=f"Zephyr Project {index}",
+            is_synced=True
+        )
+        db.add(project)
+        db.flush()
+        for case_index in range(2):
+            test_case = ZephyrTestCase(
+                zephyr_test_id=f"{index}-{case_index}",
+                zephyr_project_id=project.id,
+                test_case_key=f"ZP{index}-T{case_index}",
+                title=f"Test case {case_index}"
+            )
+            db.add(test_case)
+            db.flush()
+            for execution_index, status in enumerate(("Pass", "Fail", "Blocked")):
+                db.add(ZephyrTestExecution(
+                    zephyr_execution_id=f"{index}-{case_index}-{execution_index}",
+                    test_case_id=test_case.id,
+                    execution_status=status,
+                    executed_at=executed_at + timedelta(minutes=index * 10 + execution_index)
+                ))
+    db.commit()
+
+
+def _dashboard_statement_count(db, count_statements) -> int:
+    db.expire_all()
+    with count_statements() as statements:
+        zephyr_service.get_dashboard_stats(db)
+    return len(statements)
+
+
+def test_dashboard_stats_query_count_does_not_grow_with_projects(db, count_statements):
+    _add_projects(db, 0, 1)
+    single_project_count = _dashboard_statement_count(db, count_statements)
+    
+    _add_projects(db, 1, 19)
+    many_projects_count = _dashboard_statement_count(db, count_statements)
+    
+    assert single_project_count > 0
+    assert many_projects_count == single_project_count
+
+
+def test_dashboard_stats_totals(db):
+    _add_projects(db, 0, 3)
+    
+    stats = zephyr_service.get_dashboard_stats(db)
+    
+    assert stats.total_projects == 3
+    assert stats.synced_projects == 3
+    assert stats.total_test_cases == 6
+    assert stats.total_executions == 18
+    assert stats.passed_executions == 6
+    assert stats.failed_executions == 6
+    assert stats.blocked_executions == 6
+    for project_stats in stats.projects:
+        assert project_stats.total_test_cases == 2
+        assert project_stats.total_executions == 6
+        assert project_stats.passed_executions == 2
+        assert project_stats.last_execution is not None
@@ -0,0 +1,139 @@
+"""
+Zephyr 실행 결과 가져오기 테스트
+
+동기화되지 않은 사이클의 실행 결과는 사이클 실행 결과로 저장되지 않으므로,
+증분 기준 시각이 그 실행 시각을 넘어가면 사이클 동기화 후에도 다시 조회되지 않는다.
+실행 결과 가져오기에서 키만으로 만든 테스트 케이스는 이후 테스트 케이스 가져오기에서 같은 행으로 갱신되어야 한다.
+"""
+from datetime import datetime
+
+import pytest
+
+from models.database_models import (
+    ZephyrConnection, ZephyrCycleExecution, ZephyrProject, ZephyrSyncHistory, ZephyrTestCase,
+    ZephyrTestCycle, ZephyrTestExecution
+)
+from services.zephyr_service import zephyr_service
+
+
+def _execution(execution_id: int, cycle_id: int, executed_at: str):
+    return {
+        "id": execution_id,
+        "testCase": {"id": 100 + execution_id, "key": f"ZP-T{execution_id}"},
+        "testCycle": {"id": cycle_id},
+        "testExecutionStatus": {"name": "Pass"},
+        "actualEndDate": executed_at
+    }
+
+
+EXECUTIONS = [
+    _execution(1, 501, "2025-01-01T09:00:00Z"),  # 동기화된 사이클
+    _execution(2, 502, "2025-01-02T09:00:00Z"),  # 아직 동기화되지 않은 사이클
+    _execution(3, 501, "2025-01-03T09:00:00Z"),
+]
+
+
+@pytest.fixture
+def zephyr_project(db, monkeypatch):
+    connection = ZephyrConnection(username="qa", api_token="token")
+    project = ZephyrProject(zephyr_project_id="10000", project_key="ZP", project_name="Zephyr Project")
+    db.add_all([connection, project])
+    db.flush()
+    db.add(ZephyrTestCycle(zephyr_cycle_id="501", zephyr_project_id=project.id, cycle_name="Cycle 501"))
+    db.commit()
+    
+    monkeypatch.setattr(zephyr_service, "decrypt_token", lambda token: token)
+    monkeypatch.setattr(zephyr_service, "_fetch_execution_status_names", lambda project, headers: {})
+    
+    def iter_execution_pages(connection, project, headers, executed_after=None):
+        # actualEndDateAfter 조건 흉내 - 기준 시각 이후 실행분만 반환
+        executions = [
+            execution for execution in EXECUTIONS
+            if executed_after is None or datetime.fromisoformat(execution["actualEndDate"][:-1]) > executed_after
+        ]
+        yield executions, len(executions)
+    
+    monkeypatch.setattr(zephyr_service, "_iter_execution_pages", iter_execution_pages)
+    return connection, project
+
+
+def _sync_history(db, project, sync_type: str) -> ZephyrSyncHistory:
+    sync_history = ZephyrSyncHistory(zephyr_project_id=project.id, sync_direction="import", sync_type=sync_type)
+    db.add(sync_history)
+    db.flush()
+    return sync_history
+
+
+def _import_executions(db, connection, project):
+    zephyr_service._import_executions(db, connection, project, _sync_history(db, project, "executions"))
+
+
+def test_cursor_stops_at_execution_of_unsynced_cycle(db, zephyr_project):
+    connection, project = zephyr_project
+    
+    _import_executions(db, connection, project)
+    
+    assert project.executions_cursor.replace(tzinfo=None) == datetime(2025, 1, 2, 9, 0, 0)
+    assert db.query(ZephyrCycleExecution).count() == 2
+
+
+def test_skipped_cycle_execution_is_stored_after_cycle_sync(db, zephyr_project):
+    connection, project = zephyr_project
+    _import_executions(db, connection, project)
+    
+    db.add(ZephyrTestCycle(zephyr_cycle_id="502", zephyr_project_id=project.id, cycle_name="Cycle 502"))
+    db.commit()
+    _import_executions(db, connection, project)
+    
+    assert project.executions_cursor.replace(tzinfo=None) == datetime(2025, 1, 3, 9, 0, 0)
+    assert db.query(ZephyrCycleExecution).count() == 3
+
+
+def test_test_case_import_updates_case_created_by_execution_import(db, zephyr_project, monkeypatch):
+    connection, project = zephyr_project
+    _import_executions(db, connection, project)
+    
+    # 테스트 케이스 가져오기는 Jira 이슈 ID를 zephyr_test_id로 사용
+    issues = [
+        {
+            "id": str(9000 + index),
+            "key": f"ZP-T{index}",
+            "fields": {"summary": f"Test {index}", "status": {"name": "Approved"}, "priority": {"name": "High"}}
+        }
+        for index in (1, 2, 3)
+    ]
+    monkeypatch.setattr(
+        zephyr_service, "_iter_test_case_pages",
+        lambda connection, project, auth: iter([(issues, len(issues))])
+    )
+    zephyr_service._import_test_cases(db, connection, project, _sync_history(db, project, "test_cases"), auth=None)
+    _import_executions(db, connection, project)
+    
+    test_cases = db.query(ZephyrTestCase).filter(ZephyrTestCase.zephyr_project_id == project.id).all()
+    assert sorted((case.test_case_key, case.zephyr_test_id) for case in test_cases) == [
+        ("ZP-T1", "9001"), ("ZP-T2", "9002"), ("ZP-T3", "9003")
+    ]
+    assert all(case.title.startswith("Test ") for case in test_cases)
+    assert project.test_case_count == 3
+    assert db.query(ZephyrTestExecution).count() == 3
+    assert {execution.test_case_id for execution in db.query(ZephyrTestExecution)} == {case.id for case in test_cases}
+
+
+def test_overlapping_imports_do_not_duplicate_executions(db, zephyr_project, monkeypatch):
+    connection, project = zephyr_project
+    load_execution_lookups = zephyr_service._load_execution_lookups
+    
+    def stale_lookups(db, project):
+        # 다른 가져오기가 조회 이후 같은 실행 결과를 먼저 저장한 상황
+        lookups = load_execution_lookups(db, project)
+        lookups["executions"].clear()
+        lookups["cycle_executions"].clear()
+        return lookups
+    
+    monkeypatch.setattr(zephyr_service, "_load_execution_lookups", stale_lookups)
+    _import_executions(db, connection, project)
+    project.executions_cursor = None
+    _import_executions(db, connection, project)
+    
+    assert db.query(ZephyrTestExecution).count() == 3
+    assert db.query(ZephyrCycleExecution).count() == 2